@@ -0,0 +1,351 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa diagramas de decisão binária reduzidos e ordenados
+*                     (ROBDD) para as saídas do circuito: satisfatibilidade, equivalência e contagem
+*                     sem enumerar os 2^n vetores de entrada.
+*              en-us/ this file implements reduced ordered binary decision diagrams (ROBDD) for the
+*                     circuit outputs: satisfiability, equivalence and counting without enumerating
+*                     the 2^n input vectors.
+*
+"""
+
+from typing import Dict, List
+from circuit import *
+
+FALSE = 0           # terminal nodes
+TRUE = 1
+CACHE_SIZE = 1 << 16
+
+
+# BddManager: the nodes are integers; node n tests the variable getVar(n) and goes to getLow(n) if it
+#            is False and to getHigh(n) if it is True. The unique table keeps one node per (var, low,
+#            high), so equal functions are the same node. The computed table of ite() is a fixed size
+#            array: a new result takes the slot of its hash, evicting the one there.
+class BddManager:
+    __vars: List[int] = None
+    __lows: List[int] = None
+    __highs: List[int] = None
+    __unique: Dict = None
+    __cache: List = None
+    __cacheSize: int = CACHE_SIZE
+    __varCount: int = 0
+    __hits: int = 0
+    __misses: int = 0
+
+    def __init__(self, varCount: int, cacheSize: int = CACHE_SIZE):
+        if cacheSize < 1 or cacheSize & (cacheSize - 1) != 0:
+            raise ValueError("ValueError: the cache size must be a power of two. You entered: ", cacheSize)
+        self.__varCount = varCount
+        self.__vars = [varCount, varCount]      # the terminals are below every variable
+        self.__lows = [FALSE, TRUE]
+        self.__highs = [FALSE, TRUE]
+        self.__unique = {}
+        self.__cacheSize = cacheSize
+        self.__cache = [None] * cacheSize
+        self.__hits = 0
+        self.__misses = 0
+
+    def getVarCount(self) -> int:
+        return self.__varCount
+
+    def getNodeCount(self) -> int:
+        return len(self.__vars)
+
+    def getVar(self, node: int) -> int:
+        return self.__vars[node]
+
+    def getLow(self, node: int) -> int:
+        return self.__lows[node]
+
+    def getHigh(self, node: int) -> int:
+        return self.__highs[node]
+
+    def getCacheHits(self) -> int:
+        return self.__hits
+
+    def getCacheMisses(self) -> int:
+        return self.__misses
+
+    def node(self, var: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        key = (var, low, high)
+        n = self.__unique.get(key)
+        if n is None:
+            n = len(self.__vars)
+            self.__vars.append(var)
+            self.__lows.append(low)
+            self.__highs.append(high)
+            self.__unique[key] = n
+        return n
+
+    def var(self, i: int) -> int:
+        return self.node(i, FALSE, TRUE)
+
+    # ite(): if f then g else h. The recursion depth is at most the number of variables.
+    def ite(self, f: int, g: int, h: int) -> int:
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+        key = (f, g, h)
+        slot = hash(key) & (self.__cacheSize - 1)
+        entry = self.__cache[slot]
+        if entry is not None and entry[0] == key:
+            self.__hits += 1
+            return entry[1]
+        self.__misses += 1
+
+        v = min(self.__vars[f], self.__vars[g], self.__vars[h])
+        f0, f1 = self.__cofactors(f, v)
+        g0, g1 = self.__cofactors(g, v)
+        h0, h1 = self.__cofactors(h, v)
+        ret = self.node(v, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self.__cache[slot] = (key, ret)
+        return ret
+
+    def __cofactors(self, f: int, v: int) -> tuple:
+        if self.__vars[f] != v:
+            return f, f
+        return self.__lows[f], self.__highs[f]
+
+    def bddNot(self, f: int) -> int:
+        return self.ite(f, FALSE, TRUE)
+
+    def bddAnd(self, f: int, g: int) -> int:
+        return self.ite(f, g, FALSE)
+
+    def bddOr(self, f: int, g: int) -> int:
+        return self.ite(f, TRUE, g)
+
+    def bddXor(self, f: int, g: int) -> int:
+        return self.ite(f, self.bddNot(g), g)
+
+    def evaluate(self, f: int, values: List[bool]) -> bool:
+        while f > TRUE:
+            f = self.__highs[f] if values[self.__vars[f]] else self.__lows[f]
+        return f == TRUE
+
+    # satCount(): the number of assignments of the variables which make f True.
+    def satCount(self, f: int) -> int:
+        counts = {FALSE: 0, TRUE: 1}
+
+        def count(n: int) -> int:
+            # assignments of the variables from getVar(n) on
+            if n not in counts:
+                low, high = self.__lows[n], self.__highs[n]
+                counts[n] = count(low) * (1 << (self.__vars[low] - self.__vars[n] - 1)) + count(high) * (1 << (self.__vars[high] - self.__vars[n] - 1))
+            return counts[n]
+        return count(f) * (1 << self.__vars[f])
+
+    # anySat(): an assignment making f True (the variables not tested are False), or None.
+    def anySat(self, f: int) -> List[bool]:
+        if f == FALSE:
+            return None
+        values = [False] * self.__varCount
+        while f > TRUE:
+            if self.__highs[f] != FALSE:
+                values[self.__vars[f]] = True
+                f = self.__highs[f]
+            else:
+                f = self.__lows[f]
+        return values
+
+    # size(): the number of nodes reachable from f, the terminals included.
+    def size(self, f: int) -> int:
+        seen = set()
+        stack = [f]
+        while len(stack) > 0:
+            n = stack.pop()
+            if n not in seen:
+                seen.add(n)
+                if n > TRUE:
+                    stack.append(self.__lows[n])
+                    stack.append(self.__highs[n])
+        return len(seen)
+
+
+# dfsOrder(): the static variable order: the inputs as a depth first search from each output through
+#            the gates reaches them, so inputs feeding the same gates stay close in the order.
+def dfsOrder(netlist: CompactNetlist) -> List[int]:
+    driver = {}
+    for g in range(len(netlist.getGates())):
+        driver[netlist.getGates()[g][2]] = g
+    position = {}
+    for i in range(len(netlist.getInputs())):
+        position.setdefault(netlist.getInputs()[i], i)
+
+    order = []
+    seen = set()
+    for output in netlist.getOutputs():
+        stack = [output]
+        while len(stack) > 0:
+            net = stack.pop()
+            if net in seen:
+                continue
+            seen.add(net)
+            if net in position:
+                order.append(position[net])
+            elif net in driver:
+                stack.extend(reversed(netlist.getGates()[driver[net]][1]))
+    for i in range(len(netlist.getInputs())):
+        if i not in order:
+            order.append(i)
+    return order
+
+
+# CircuitBdd: the BDD of every output of the net list. The input i of the net list is the variable
+#            getOrder().index(i). A net without driver has an unknown value (None), as at the
+#            analyzers: each net reached by one is kept as two BDDs (dual rail), the vectors where it
+#            is surely True and the ones where it is surely False, so AND(0, None) is still False. An
+#            output unknown for some vector has no BDD (None, listed by getSkipped()), but
+#            evaluate() still gives its three-valued value.
+class CircuitBdd:
+    __netlist: CompactNetlist = None
+    __manager: BddManager = None
+    __order: List[int] = None
+    __outputs: List[int] = None
+    __rails: List[tuple] = None     # (surely True, surely False) of each output reached by an unknown net
+
+    def __init__(self, netlist: CompactNetlist, order: List[int] = None, cacheSize: int = CACHE_SIZE):
+        self.__netlist = netlist
+        self.__order = order if order is not None else dfsOrder(netlist)
+        self.__manager = BddManager(len(self.__order), cacheSize)
+        m = self.__manager
+
+        # each net is (f, None) when it is never unknown, or (surely True, surely False)
+        nets = [(FALSE, FALSE)] * netlist.getNetCount()
+        for var in range(len(self.__order)):
+            nets[netlist.getInputs()[self.__order[var]]] = (m.var(var), None)
+        for kind, ins, out, name in netlist.getGates():
+            values = [nets[i] for i in ins]
+            if all([v[1] is None for v in values]):
+                nets[out] = (self.__gate(kind, [v[0] for v in values]), None)
+            else:
+                nets[out] = self.__rail(kind, [v if v[1] is not None else (v[0], m.bddNot(v[0])) for v in values])
+
+        self.__outputs = []
+        self.__rails = []
+        for i in netlist.getOutputs():
+            t, f = nets[i]
+            if f is not None and m.bddOr(t, f) == TRUE:
+                f = None    # known for every vector
+            self.__outputs.append(t if f is None else None)
+            self.__rails.append(None if f is None else (t, f))
+
+    # __gate(): the BDD of a gate whose inputs are never unknown.
+    def __gate(self, kind: str, values: List[int]) -> int:
+        m = self.__manager
+        if kind in (GATE_AND, GATE_NAND):
+            f = TRUE
+            for v in values:
+                f = m.bddAnd(f, v)
+        elif kind in (GATE_OR, GATE_NOR):
+            f = FALSE
+            for v in values:
+                f = m.bddOr(f, v)
+        elif kind in (GATE_XOR, GATE_XNOR):
+            f = FALSE
+            for v in values:
+                f = m.bddXor(f, v)
+        elif kind == GATE_NOT:
+            f = m.bddNot(values[0])
+        else:
+            f = values[0]
+        if kind in (GATE_NAND, GATE_NOR, GATE_XNOR):
+            f = m.bddNot(f)
+        return f
+
+    # __rail(): (surely True, surely False) of a gate, from the pairs of its inputs (Kleene logic).
+    def __rail(self, kind: str, values: List[tuple]) -> tuple:
+        m = self.__manager
+        if kind in (GATE_AND, GATE_NAND):
+            t, f = TRUE, FALSE
+            for vt, vf in values:
+                t, f = m.bddAnd(t, vt), m.bddOr(f, vf)
+        elif kind in (GATE_OR, GATE_NOR):
+            t, f = FALSE, TRUE
+            for vt, vf in values:
+                t, f = m.bddOr(t, vt), m.bddAnd(f, vf)
+        elif kind in (GATE_XOR, GATE_XNOR):
+            t, f = FALSE, TRUE
+            for vt, vf in values:
+                t, f = m.bddOr(m.bddAnd(t, vf), m.bddAnd(f, vt)), m.bddOr(m.bddAnd(t, vt), m.bddAnd(f, vf))
+        elif kind == GATE_NOT:
+            f, t = values[0]
+        else:
+            t, f = values[0]
+        if kind in (GATE_NAND, GATE_NOR, GATE_XNOR):
+            t, f = f, t
+        return t, f
+
+    def getManager(self) -> BddManager:
+        return self.__manager
+
+    def getOrder(self) -> List[int]:
+        return self.__order
+
+    def getOutput(self, output: int) -> int:
+        return self.__outputs[output]
+
+    def getOutputs(self) -> List[int]:
+        return self.__outputs
+
+    # getSkipped(): the outputs without a BDD: a net without driver makes them unknown for some vector.
+    def getSkipped(self) -> List[int]:
+        return [i for i in range(len(self.__outputs)) if self.__outputs[i] is None]
+
+    # getKnown(): the BDD of the input vectors for which the output has a known value.
+    def getKnown(self, output: int) -> int:
+        rail = self.__rails[output]
+        return TRUE if rail is None else self.__manager.bddOr(rail[0], rail[1])
+
+    def isSatisfiable(self, output: int) -> bool:
+        f = self.__outputs[output]
+        return None if f is None else f != FALSE
+
+    def isTautology(self, output: int) -> bool:
+        f = self.__outputs[output]
+        return None if f is None else f == TRUE
+
+    # countSolutions(): the number of input vectors making the output True.
+    def countSolutions(self, output: int) -> int:
+        f = self.__outputs[output]
+        return None if f is None else self.__manager.satCount(f)
+
+    def equivalent(self, a: int, b: int) -> bool:
+        if self.__outputs[a] is None or self.__outputs[b] is None:
+            return None
+        return self.__outputs[a] == self.__outputs[b]
+
+    # witness(): input values (in the order of netlist.getInputs()) making the output True, or None.
+    def witness(self, output: int) -> List[bool]:
+        f = self.__outputs[output]
+        values = None if f is None else self.__manager.anySat(f)
+        if values is None:
+            return None
+        ret = [False] * len(self.__order)
+        for var in range(len(self.__order)):
+            ret[self.__order[var]] = values[var]
+        return ret
+
+    # evaluate(): the value of the output for the input values, None where it is unknown.
+    def evaluate(self, output: int, values: List[bool]) -> bool:
+        ordered = [values[i] for i in self.__order]
+        rail = self.__rails[output]
+        if rail is None:
+            return self.__manager.evaluate(self.__outputs[output], ordered)
+        if self.__manager.evaluate(rail[0], ordered):
+            return True
+        if self.__manager.evaluate(rail[1], ordered):
+            return False
+        return None
@@ -0,0 +1,80 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo compara o analisador lógico com a função compilada do circuito.
+*              en-us/ this file compares the logic analyzer with the compiled function of the circuit.
+*
+"""
+
+import random
+import sys
+import time
+
+from util import *
+from components import *
+from logicanalyzer import LogicAnalyzer
+from levelizedanalyzer import LevelizedAnalyzer
+from netlist import uniqueCheckers
+
+GATES = 1000
+INPUTS = 32
+REPEAT = 20
+
+
+# a random circuit: each gate input is wired to an entry or to the output of a gate placed before.
+def randomCircuit(inputs: int, gates: int, seed: int = 0):
+    rnd = random.Random(seed)
+    kinds = [AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate, NotGate]
+    entries = [Entry(coords=Coords(0, i*20*POINT_SPACE)) for i in range(inputs)]
+    sources = list(entries)
+    checkers = []
+    wires = []
+    for g in range(gates):
+        gate = rnd.choice(kinds)(coords=Coords((g//50+2)*40*POINT_SPACE, (g % 50)*20*POINT_SPACE))
+        for check in gate.getChecks():
+            wires.append([rnd.choice(sources).getTechCoords(), check.getTechCoords()])
+        checkers.extend(gate.getChecks())
+        sources.append(gate.gateOut())
+    outputs = [Checker(coords=Coords(-100*POINT_SPACE, k*20*POINT_SPACE)) for k in range(8)]
+    for k in range(8):
+        wires.append([sources[-1-k].getTechCoords(), outputs[k].getTechCoords()])
+    return entries, wires, entries + sources[inputs:], checkers + outputs
+
+
+def run(gates: int):
+    entries, wires, allEntries, checkers = randomCircuit(INPUTS, gates)
+    rnd = random.Random(1)
+    vectors = [[rnd.random() < 0.5 for i in range(INPUTS)] for r in range(REPEAT)]
+    print("%22s %14s %10s" % ("engine", "per call (ms)", "speedup"))
+
+    base = None
+    for cls in [LogicAnalyzer, LevelizedAnalyzer]:
+        analyzer = cls(allEntries, wires, checkers)
+        start = time.perf_counter()
+        for vector in vectors:
+            for i in range(INPUTS):
+                entries[i].setValue(vector[i])
+            analyzer.analyze()
+        elapsed = (time.perf_counter() - start) / REPEAT
+        base = elapsed if base is None else base
+        print("%22s %14.3f %9.1fx" % (cls.__name__+".analyze", elapsed*1000, base/elapsed))
+        expected = [i.getValue() for i in uniqueCheckers(analyzer.getCheckers())]
+
+    print(analyzer.optimize()[1])
+    start = time.perf_counter()
+    function = analyzer.compile()
+    print("%22s %14.3f" % ("compile", (time.perf_counter() - start)*1000))
+    start = time.perf_counter()
+    for vector in vectors:
+        values = function(vector)
+    elapsed = (time.perf_counter() - start) / REPEAT
+    print("%22s %14.3f %9.1fx" % ("compiled", elapsed*1000, base/elapsed))
+    print("same values:", list(values) == expected)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GATES)
@@ -0,0 +1,72 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo compara o índice espacial com a busca par a par (Coords.equals)
+*                     usada antes pelo analisador lógico.
+*              en-us/ this file compares the spatial index with the pairwise search (Coords.equals)
+*                     used before by the logic analyzer.
+*
+"""
+
+import random
+import sys
+import time
+
+from util import *
+from spatialindex import ConnectivityIndex
+
+SIZES = [1000, 10000, 100000]
+SAMPLE = 200    # the pairwise scan is quadratic: only this many lookups are timed, then scaled
+
+
+def pins(n: int, seed: int = 0):
+    rnd = random.Random(seed)
+    side = int(n**0.5) + 1
+    return [(Coords(rnd.randint(-side, side)*POINT_SPACE, rnd.randint(-side, side)*POINT_SPACE), "P"+str(i)) for i in range(n)]
+
+
+# the search done by the analyzer before: every lookup compares the point with all pins.
+def scan(points, queries):
+    found = 0
+    for q in queries:
+        for c, pin in points:
+            if c.equals(q):
+                found += 1
+    return found
+
+
+def indexed(points, queries):
+    index = ConnectivityIndex()
+    for c, pin in points:
+        index.add(c, pin)
+    found = 0
+    for q in queries:
+        found += len(index.find(q))
+    return found
+
+
+def run(sizes):
+    print("%10s %16s %16s %10s" % ("pins", "scan (s)", "index (s)", "speedup"))
+    for n in sizes:
+        points = pins(n)
+        queries = [c for c, pin in points]
+        sample = queries[:min(SAMPLE, n)]
+
+        start = time.perf_counter()
+        scan(points, sample)
+        tScan = (time.perf_counter() - start) * n / len(sample)
+
+        start = time.perf_counter()
+        indexed(points, queries)
+        tIndex = time.perf_counter() - start
+
+        print("%10d %15.4f%s %16.4f %9.0fx" % (n, tScan, "*" if len(sample) < n else " ", tIndex, tScan/tIndex))
+    print("* estimated from", SAMPLE, "lookups")
+
+
+if __name__ == "__main__":
+    run([int(i) for i in sys.argv[1:]] if len(sys.argv) > 1 else SIZES)
@@ -0,0 +1,100 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo compara Coords com GridPoint: memória e tempo de criação,
+*                     comparação e busca de cada ponto, e o tempo de gerar e analisar circuitos
+*                     cujos pinos e fios usam GridPoint.
+*              en-us/ this file compares Coords with GridPoint: memory and time to create, compare
+*                     and look up each point, and the time to generate and analyze circuits whose
+*                     pins and wires use GridPoint.
+*
+*   Uso/usage: python benchmark_points.py [points] [width ...]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from util import *
+from spatialindex import ConnectivityIndex
+from logicanalyzer import LogicAnalyzer
+import generators
+
+POINTS = 100000
+WIDTHS = [100, 300, 1000]   # widths of the random graphs (generators.randomDag), DEPTH levels each
+
+
+def coordinates(n: int, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    side = int(n**0.5) + 1
+    return [(rnd.randint(-side, side)*POINT_SPACE, rnd.randint(-side, side)*POINT_SPACE) for i in range(n)]
+
+
+# allocated(): bytes per point kept alive by a list of n points (the list itself not counted).
+def allocated(cls, xy: list) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    points = [cls(x, y) for x, y in xy]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(points)) / len(points)
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def create(cls, xy: list) -> list:
+    return [cls(x, y) for x, y in xy]
+
+
+def compare(points: list, others: list) -> int:
+    return sum([1 for a, b in zip(points, others) if a.equals(b)])
+
+
+def lookup(points: list, queries: list) -> int:
+    index = ConnectivityIndex()
+    for i in range(len(points)):
+        index.add(points[i], i)
+    return sum([len(index.find(q)) for q in queries])
+
+
+def points(n: int) -> None:
+    xy = coordinates(n)
+    print("%10s %12s %14s %14s %14s" % ("type", "bytes/point", "create (us)", "equals (us)", "lookup (us)"))
+    for cls in (Coords, GridPoint):
+        size = allocated(cls, xy)
+        tCreate = timed(create, cls, xy)
+        a = create(cls, xy)
+        b = create(cls, xy)
+        tEquals = timed(compare, a, b)
+        tLookup = timed(lookup, a, b)
+        print("%10s %12.1f %14.3f %14.3f %14.3f" % (cls.__name__, size, tCreate*1e6/n, tEquals*1e6/n, tLookup*1e6/n))
+
+
+def circuits(widths: list) -> None:
+    print("%10s %8s %16s %16s" % ("width", "gates", "generate (s)", "analyze (s)"))
+    for width in widths:
+        start = time.perf_counter()
+        circuit = generators.randomDag(width)
+        generate = time.perf_counter() - start
+        netlist = circuit.getNetlist()
+        start = time.perf_counter()
+        LogicAnalyzer(netlist.getEntries(), netlist.getWires(), netlist.getCheckers()).analyze()
+        analyze = time.perf_counter() - start
+        print("%10d %8d %16.3f %16.3f" % (width, circuit.getGateCount(), generate, analyze))
+
+
+if __name__ == "__main__":
+    points(int(sys.argv[1]) if len(sys.argv) > 1 else POINTS)
+    print()
+    circuits([int(i) for i in sys.argv[2:]] if len(sys.argv) > 2 else WIDTHS)
@@ -0,0 +1,54 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo mede a vazão da tabela verdade dividida em fatias para diferentes
+*                     números de processos.
+*              en-us/ this file measures the throughput of the truth table split into shards for
+*                     different numbers of processes.
+*
+"""
+
+import os
+import random
+import sys
+import time
+
+from circuit import *
+from shardrunner import ShardRunner
+
+INPUTS = 22
+GATES = 400
+
+
+# a random circuit: every gate reads nets already driven, so the list is in topological order.
+def randomNetlist(inputs: int, gates: int, seed: int = 0) -> CompactNetlist:
+    rnd = random.Random(seed)
+    kinds = [GATE_AND, GATE_NAND, GATE_OR, GATE_NOR, GATE_XOR, GATE_XNOR, GATE_NOT]
+    compact = []
+    for g in range(gates):
+        kind = rnd.choice(kinds)
+        ins = (rnd.randrange(inputs + g),) if kind == GATE_NOT else (rnd.randrange(inputs + g), rnd.randrange(inputs + g))
+        compact.append((kind, ins, inputs + g, "G"+str(g)))
+    return CompactNetlist(inputs + gates, list(range(inputs)), compact, list(range(inputs + gates - 8, inputs + gates)))
+
+
+def run(workers):
+    netlist = randomNetlist(INPUTS, GATES)
+    chosen = list(range(INPUTS))
+    print("%8s %12s %16s %10s" % ("workers", "time (s)", "rows/s", "speedup"))
+    base = None
+    for n in workers:
+        with ShardRunner(netlist, workers=n, shard=1 << 18) as runner:
+            start = time.perf_counter()
+            runner.truthTable(chosen)
+            elapsed = time.perf_counter() - start
+        base = elapsed if base is None else base
+        print("%8d %12.3f %16.0f %9.2fx" % (n, elapsed, (1 << INPUTS)/elapsed, base/elapsed))
+
+
+if __name__ == "__main__":
+    run([int(i) for i in sys.argv[1:]] if len(sys.argv) > 1 else sorted(set([1, 2, 4, os.cpu_count() or 1])))
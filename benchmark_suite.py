@@ -0,0 +1,233 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo mede os analisadores nos circuitos gerados (generators.py), em
+*                     vários tamanhos, e grava os resultados em JSON Lines para comparar versões.
+*                     Também confere o tempo de abrir um projeto de cerca de 100 mil componentes.
+*              en-us/ this file times the analyzers at the generated circuits (generators.py), at
+*                     several sizes, and writes the results as JSON Lines to compare versions. It
+*                     also checks the time to open a project of about 100k components.
+*
+*   Uso/usage: python benchmark_suite.py [-o results.jsonl] [--compare old.jsonl] [--families adder,dag]
+*              [--engines LogicAnalyzer,compiled] [--sizes 8,16] [--depth 10] [--repeat 20] [--project 1000]
+*              Each case (family, size, engine) runs in a new process, so the state one engine leaves
+*              behind does not change the time of the next one.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import generators
+from logicanalyzer import LogicAnalyzer
+from levelizedanalyzer import LevelizedAnalyzer
+from eventanalyzer import EventDrivenAnalyzer
+from netlist import freeEntries, uniqueCheckers
+from project import saveProject, readProject, loadProject
+
+REPEAT = 20     # input vectors timed per case
+SEED = 1
+SIZES = {"adder": [8, 32, 128], "multiplier": [4, 8, 16], "parity": [64, 256, 1024], "dag": [10, 40, 100]}
+ANALYZERS = {"LogicAnalyzer": LogicAnalyzer, "LevelizedAnalyzer": LevelizedAnalyzer, "EventDrivenAnalyzer": EventDrivenAnalyzer}
+ENGINES = list(ANALYZERS.keys()) + ["compiled"]
+TOLERANCE = 1.25    # a case slower than this ratio against the compared results is a regression
+PROJECT_WIDTH = 1000    # the opened project: randomDag(PROJECT_WIDTH, PROJECT_DEPTH), about 100k components
+PROJECT_DEPTH = 98
+PROJECT_LIMIT = 1.0     # seconds to open it (loadProject); slower is a failure
+
+
+# analyzerEngine(): an analyzer class as an engine: sets the entries, analyzes and reads the outputs.
+def analyzerEngine(cls, circuit):
+    netlist = circuit.getNetlist()
+    analyzer = cls(netlist.getEntries(), netlist.getWires(), netlist.getCheckers())
+
+    def run(values: List[bool]) -> List[bool]:
+        for entry, value in zip(circuit.getInputs(), values):
+            entry.setValue(value)
+        analyzer.analyze()
+        return [i.getValue() for i in circuit.getOutputs()]
+    return run
+
+
+# compiledEngine(): the generated Python function of the optimized circuit (see compiler.py).
+def compiledEngine(circuit):
+    netlist = circuit.getNetlist()
+    analyzer = LogicAnalyzer(netlist.getEntries(), netlist.getWires(), netlist.getCheckers())
+    function = analyzer.compile()
+    inputs = freeEntries(analyzer.getEntries())
+    checkers = uniqueCheckers(analyzer.getCheckers())
+    order = [inputs.index(i) for i in circuit.getInputs()]
+    outputs = [checkers.index(i) for i in circuit.getOutputs()]
+
+    def run(values: List[bool]) -> List[bool]:
+        vector = [None]*len(inputs)
+        for i, value in zip(order, values):
+            vector[i] = value
+        result = function(vector)
+        return [result[i] for i in outputs]
+    return run
+
+
+def engine(name: str, circuit):
+    if name == "compiled":
+        return compiledEngine(circuit)
+    if name in ANALYZERS:
+        return analyzerEngine(ANALYZERS[name], circuit)
+    raise ValueError("ValueError: engine expected ("+", ".join(ENGINES)+"). You entered: ", name)
+
+
+# measure(): one case, in this process. The setup time covers building the engine and the first
+#           vector; the call time is the mean of the next ones. Every output is checked against the
+#           reference of the generated circuit.
+def measure(family: str, size: int, name: str, depth: int, repeat: int) -> Dict:
+    if family == "project":
+        return measureProject(size, depth)
+    start = time.perf_counter()
+    circuit = generators.randomDag(size, depth) if family == "dag" else generators.FAMILIES[family](size)
+    generate = time.perf_counter() - start
+
+    rnd = random.Random(SEED)
+    vectors = [[rnd.random() < 0.5 for i in circuit.getInputs()] for r in range(repeat + 1)]
+    start = time.perf_counter()
+    run = engine(name, circuit)
+    results = [run(vectors[0])]
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    for vector in vectors[1:]:
+        results.append(run(vector))
+    elapsed = time.perf_counter() - start
+
+    return {"family": family, "size": size, "depth": depth if family == "dag" else None, "engine": name,
+            "inputs": len(circuit.getInputs()), "gates": circuit.getGateCount(), "outputs": len(circuit.getOutputs()),
+            "generate_ms": generate*1000, "setup_ms": setup*1000, "call_ms": elapsed*1000/max(repeat, 1), "calls": repeat,
+            "ok": all([result == circuit.reference(vector) for result, vector in zip(results, vectors)])}
+
+
+# measureProject(): saves a random graph as a project and times opening it: readProject() (the
+#                  decoding) and loadProject() (decoding, components and net list), against PROJECT_LIMIT.
+def measureProject(width: int, depth: int) -> Dict:
+    start = time.perf_counter()
+    circuit = generators.randomDag(width, depth)
+    generate = time.perf_counter() - start
+    netlist = circuit.getNetlist()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "project.desp")
+        saveProject(path, [(netlist.getComponents(), netlist.getWires(), netlist)])
+        start = time.perf_counter()
+        readProject(path)
+        read = time.perf_counter() - start
+        start = time.perf_counter()
+        tabs = loadProject(path)
+        load = time.perf_counter() - start
+    return {"family": "project", "size": width, "depth": depth, "engine": "loadProject", "components": len(tabs[0][0]),
+            "gates": circuit.getGateCount(), "generate_ms": generate*1000, "setup_ms": read*1000, "call_ms": load*1000, "calls": 1,
+            "limit_ms": PROJECT_LIMIT*1000, "ok": load < PROJECT_LIMIT}
+
+
+# runCase(): measure() at a new process; its only output line is the JSON record.
+def runCase(family: str, size: int, name: str, depth: int, repeat: int) -> Dict:
+    process = subprocess.run([sys.executable, __file__, "--case", family, str(size), name, "--depth", str(depth), "--repeat", str(repeat)],
+                             capture_output=True, text=True)
+    lines = [i for i in process.stdout.splitlines() if i.startswith("{")]
+    if process.returncode != 0 or len(lines) == 0:
+        return {"family": family, "size": size, "engine": name, "error": (process.stderr.strip().splitlines() or ["no result"])[-1]}
+    return json.loads(lines[-1])
+
+
+# revision(): the commit of the repository holding this file, wherever the suite is run from.
+def revision() -> str:
+    try:
+        process = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10,
+                                 cwd=os.path.dirname(os.path.abspath(__file__)))
+        return process.stdout.strip() if process.returncode == 0 else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def key(record: Dict) -> tuple:
+    return (record["family"], record["size"], record.get("depth"), record["engine"])
+
+
+def load(path: str) -> Dict:
+    with open(path) as f:
+        return dict([(key(record), record) for record in map(json.loads, f) if "call_ms" in record])
+
+
+def run(families: List[str], engines: List[str], sizes: List[int], depth: int, repeat: int, output: str, compare: str,
+        project: int = PROJECT_WIDTH) -> int:
+    old = load(compare) if compare is not None else {}
+    info = {"revision": revision(), "python": platform.python_version(), "date": datetime.datetime.now().isoformat(timespec="seconds")}
+    out = open(output, "w") if output is not None else None
+    failed = 0
+    print("%-10s %6s %6s %20s %12s %12s %8s %4s" % ("family", "size", "gates", "engine", "setup (ms)", "call (ms)", "vs old", "ok"))
+    try:
+        for family in families:
+            for size in (sizes if sizes is not None else SIZES[family]):
+                for name in engines:
+                    record = runCase(family, size, name, depth, repeat)
+                    record.update(info)
+                    if out is not None:
+                        out.write(json.dumps(record) + "\n")
+                        out.flush()
+                    if "error" in record:
+                        failed += 1
+                        print("%-10s %6d %6s %20s  error: %s" % (family, size, "", name, record["error"]))
+                        continue
+                    ratio = ""
+                    if key(record) in old:
+                        ratio = "%7.2fx" % (record["call_ms"] / max(old[key(record)]["call_ms"], 1e-9))
+                        if record["call_ms"] > TOLERANCE*old[key(record)]["call_ms"]:
+                            ratio += "!"
+                    failed += 0 if record["ok"] else 1
+                    print("%-10s %6d %6d %20s %12.3f %12.3f %8s %4s" % (family, size, record["gates"], name, record["setup_ms"], record["call_ms"], ratio, "yes" if record["ok"] else "NO"))
+        if project > 0:
+            record = runCase("project", project, "loadProject", PROJECT_DEPTH, 1)
+            record.update(info)
+            if out is not None:
+                out.write(json.dumps(record) + "\n")
+            if "error" in record:
+                failed += 1
+                print("project: error: %s" % record["error"])
+            else:
+                failed += 0 if record["ok"] else 1
+                print("project: %d components opened in %.3f ms (decoding %.3f ms), limit %.0f ms: %s" % (record["components"], record["call_ms"], record["setup_ms"], record["limit_ms"], "ok" if record["ok"] else "TOO SLOW"))
+    finally:
+        if out is not None:
+            out.close()
+    return 1 if failed > 0 else 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Times the analyzers at generated circuits of several sizes.")
+    parser.add_argument("-o", "--output", help="JSON Lines file with one record per case")
+    parser.add_argument("--compare", help="JSON Lines file of an earlier run: shows the ratio of the call times")
+    parser.add_argument("--families", default=",".join(SIZES.keys()))
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--sizes", help="sizes of every family (bits, inputs or width), instead of the defaults")
+    parser.add_argument("--depth", type=int, default=generators.DEPTH, help="levels of the random graphs")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--project", type=int, default=PROJECT_WIDTH, help="width of the random graph opened as a project against the time limit (0 skips it)")
+    parser.add_argument("--case", nargs=3, metavar=("FAMILY", "SIZE", "ENGINE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case is not None:
+        print(json.dumps(measure(args.case[0], int(args.case[1]), args.case[2], args.depth, args.repeat)))
+        return 0
+    sizes = [int(i) for i in args.sizes.split(",")] if args.sizes is not None else None
+    return run(args.families.split(","), args.engines.split(","), sizes, args.depth, args.repeat, args.output, args.compare, args.project)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
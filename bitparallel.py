@@ -0,0 +1,189 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa a avaliação paralela em bits: cada rede guarda, num
+*                     inteiro, o valor de muitos vetores de entrada, e cada porta vira uma operação
+*                     bit a bit. Com isso monta a tabela verdade completa do circuito.
+*              en-us/ this file implements the bit-parallel evaluation: each net keeps, in an integer,
+*                     the value of many input vectors, and each gate becomes one bitwise operation.
+*                     With it builds the complete truth table of the circuit.
+*
+"""
+
+from typing import List
+from circuit import *
+
+WIDTH = 1 << 16     # input vectors evaluated together (bits of each word)
+
+# Each net is a pair of words (value, known): the bit i of known tells if the net value is known at
+# the vector i and, if it is, the bit i of value is that value. Value bits are always inside known.
+
+
+def bitAnd(words: List[tuple], mask: int) -> tuple:
+    one = mask
+    zero = 0
+    for v, k in words:
+        one &= v
+        zero |= k & ~v
+    return one, one | zero
+
+
+def bitOr(words: List[tuple], mask: int) -> tuple:
+    one = 0
+    zero = mask
+    for v, k in words:
+        one |= v
+        zero &= k & ~v
+    return one, one | zero
+
+
+def bitXor(words: List[tuple], mask: int) -> tuple:
+    value = 0
+    known = mask
+    for v, k in words:
+        value ^= v
+        known &= k
+    return value & known, known
+
+
+def bitNot(word: tuple) -> tuple:
+    return word[1] ^ word[0], word[1]
+
+
+OPERATIONS = {
+    GATE_AND: bitAnd,
+    GATE_NAND: lambda words, mask: bitNot(bitAnd(words, mask)),
+    GATE_OR: bitOr,
+    GATE_NOR: lambda words, mask: bitNot(bitOr(words, mask)),
+    GATE_XOR: bitXor,
+    GATE_XNOR: lambda words, mask: bitNot(bitXor(words, mask)),
+    GATE_NOT: lambda words, mask: bitNot(words[0]),
+    GATE_BUF: lambda words, mask: words[0],
+}
+
+
+# word(): a logic value repeated at every bit of the mask.
+def word(value: bool, mask: int) -> tuple:
+    if value is None:
+        return 0, 0
+    return (mask if value else 0), mask
+
+
+# evaluate(): receives one word per input of the net list and returns the word of every net.
+def evaluate(netlist: CompactNetlist, inputs: List[tuple], mask: int) -> List[tuple]:
+    nets = [(0, 0)] * netlist.getNetCount()
+    for net, w in zip(netlist.getInputs(), inputs):
+        nets[net] = w
+    for kind, ins, out, name in netlist.getGates():
+        nets[out] = OPERATIONS[kind]([nets[i] for i in ins], mask)
+    return nets
+
+
+# pattern(): word of the input j at the vectors start..start+width-1, where the vector r gives the
+#            input j the bit j of r. The width must be a power of two.
+def pattern(j: int, start: int, width: int) -> int:
+    mask = (1 << width) - 1
+    half = 1 << j
+    if half >= width:
+        return mask if (start >> j) & 1 else 0
+    repeat = mask // ((1 << (2*half)) - 1)
+    return repeat * (((1 << half) - 1) << half)
+
+
+# join(): puts the words of consecutive chunks together, the first chunk at the lowest bits.
+def join(chunks: List[int], width: int) -> int:
+    if width % 8 != 0:
+        ret = 0
+        for i in range(len(chunks)):
+            ret |= chunks[i] << (i*width)
+        return ret
+    size = width // 8
+    return int.from_bytes(b"".join([chunk.to_bytes(size, "little") for chunk in chunks]), "little")
+
+
+# TruthTable: the outputs of the circuit for every combination of the chosen inputs. The row r gives
+#            the chosen input j the value of the bit j of r (the first input is the lowest bit).
+class TruthTable:
+    __inputNames: List[str] = None
+    __outputNames: List[str] = None
+    __values: List[int] = None
+    __known: List[int] = None
+    __rows: int = 0
+
+    def __init__(self, inputNames: List[str], outputNames: List[str], values: List[int], known: List[int]):
+        self.__inputNames = inputNames
+        self.__outputNames = outputNames
+        self.__values = values
+        self.__known = known
+        self.__rows = 1 << len(inputNames)
+
+    def getRows(self) -> int:
+        return self.__rows
+
+    def getInputNames(self) -> List[str]:
+        return self.__inputNames
+
+    def getOutputNames(self) -> List[str]:
+        return self.__outputNames
+
+    # getColumn(): the output as a pair of integers (value, known) with one bit per row.
+    def getColumn(self, output: int) -> tuple:
+        return self.__values[output], self.__known[output]
+
+    def getValue(self, row: int, output: int) -> bool:
+        if not (self.__known[output] >> row) & 1:
+            return None
+        return bool((self.__values[output] >> row) & 1)
+
+    def getRow(self, row: int) -> List[bool]:
+        return [self.getValue(row, i) for i in range(len(self.__outputNames))]
+
+    def countTrue(self, output: int) -> int:
+        return bin(self.__values[output]).count("1")
+
+    def __str__(self):
+        return "TruthTable[inputs="+str(len(self.__inputNames))+" outputs="+str(len(self.__outputNames))+" rows="+str(self.__rows)+"]"
+
+
+# evaluateRows(): evaluates the rows start..start+count-1 of the truth table, width rows at a time, and
+#                returns the (value, known) integers of each output, the row start at the bit 0.
+#                The count and the width must be powers of two and start a multiple of both.
+def evaluateRows(netlist: CompactNetlist, chosen: List[int], values: List[bool], start: int, count: int, width: int = WIDTH) -> tuple:
+    if values is None:
+        values = [None] * len(netlist.getInputs())
+    width = min(width, count)
+    if width & (width - 1) != 0:
+        raise ValueError("ValueError: the width must be a power of two. You entered: ", width)
+    mask = (1 << width) - 1
+    position = {}
+    for j in range(len(chosen)):
+        position[chosen[j]] = j
+
+    valueChunks = [[] for i in netlist.getOutputs()]
+    knownChunks = [[] for i in netlist.getOutputs()]
+    for first in range(start, start + count, width):
+        inputs = []
+        for i in range(len(netlist.getInputs())):
+            if i in position:
+                inputs.append((pattern(position[i], first, width), mask))
+            else:
+                inputs.append(word(values[i], mask))
+        nets = evaluate(netlist, inputs, mask)
+        for o in range(len(netlist.getOutputs())):
+            v, k = nets[netlist.getOutputs()[o]]
+            valueChunks[o].append(v)
+            knownChunks[o].append(k)
+
+    return [join(chunks, width) for chunks in valueChunks], [join(chunks, width) for chunks in knownChunks]
+
+
+# truthTable(): builds the truth table of the net list outputs over the chosen inputs (indexes at
+#              netlist.getInputs()). The other inputs keep the value given at values (None if unknown).
+def truthTable(netlist: CompactNetlist, chosen: List[int], values: List[bool] = None, width: int = WIDTH) -> TruthTable:
+    ones, known = evaluateRows(netlist, chosen, values, 0, 1 << len(chosen), width)
+    names = netlist.getInputNames()
+    return TruthTable([names[i] for i in chosen], netlist.getOutputNames(), ones, known)
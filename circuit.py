@@ -0,0 +1,204 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo define a lista de redes compacta do circuito: só números e nomes,
+*                     sem OpenGL, para ser usada pelos avaliadores e enviada a outros processos.
+*              en-us/ this file defines the compact net list of the circuit: only numbers and names,
+*                     without OpenGL, to be used by the evaluators and sent to other processes.
+*
+"""
+
+import json
+from typing import Dict, List
+
+# gate kinds of the compact net list
+GATE_NOT = "NOT"
+GATE_AND = "AND"
+GATE_NAND = "NAND"
+GATE_OR = "OR"
+GATE_NOR = "NOR"
+GATE_XOR = "XOR"
+GATE_XNOR = "XNOR"
+GATE_BUF = "BUF"
+
+GATE_KINDS = [GATE_NOT, GATE_AND, GATE_NAND, GATE_OR, GATE_NOR, GATE_XOR, GATE_XNOR, GATE_BUF]
+
+LOGIC_VALUES = [False, True, None]  # None is the unknown value
+
+
+# kleene(): the output of a gate kind over {False, True, None}: a controlling input decides the output
+#           even if other inputs are unknown; otherwise any unknown input makes the output unknown.
+def kleene(kind: str, values: tuple) -> bool:
+    if kind in (GATE_AND, GATE_NAND):
+        value = False if False in values else (None if None in values else True)
+    elif kind in (GATE_OR, GATE_NOR):
+        value = True if True in values else (None if None in values else False)
+    elif kind in (GATE_XOR, GATE_XNOR):
+        value = None if None in values else values.count(True) % 2 == 1
+    elif kind == GATE_NOT:
+        value = None if values[0] is None else not values[0]
+    else:
+        value = values[0]
+    if kind in (GATE_NAND, GATE_NOR, GATE_XNOR) and value is not None:
+        value = not value
+    return value
+
+
+# gateTable(): the lookup table of a gate kind with the given number of inputs: every tuple of input
+#              values over {False, True, None} to the output value.
+def gateTable(kind: str, inputs: int) -> Dict:
+    keys = [()]
+    for i in range(inputs):
+        keys = [key + (value,) for key in keys for value in LOGIC_VALUES]
+    return dict([(key, kleene(kind, key)) for key in keys])
+
+
+# levelize(): receives the gates and, for each gate, the list of gates that drive its inputs.
+#             Returns the gates grouped by level (Kahn's algorithm): a gate only appears after
+#             every gate it depends on. Gates inside a loop are returned apart as the second value.
+def levelize(gates: List, fanin: Dict) -> tuple:
+    pending = {}
+    fanout = {}
+    for gate in gates:
+        pending[gate] = 0
+        fanout[gate] = []
+    for gate in gates:
+        for source in fanin[gate]:
+            pending[gate] += 1
+            fanout[source].append(gate)
+
+    levels = []
+    level = [gate for gate in gates if pending[gate] == 0]
+    while len(level) > 0:
+        levels.append(level)
+        nextLevel = []
+        for gate in level:
+            for target in fanout[gate]:
+                pending[target] -= 1
+                if pending[target] == 0:
+                    nextLevel.append(target)
+        level = nextLevel
+
+    loop = [gate for gate in gates if pending[gate] > 0]
+    return levels, loop
+
+
+# feedbackLoops(): receives the gates and, for each gate, the list of gates that drive its inputs.
+#                  Returns every feedback loop, as the list of gates of each strongly connected
+#                  component with a cycle (Tarjan's algorithm, iterative, linear time).
+def feedbackLoops(gates: List, fanin: Dict) -> List[List]:
+    index = {}
+    low = {}
+    stack = []
+    onStack = set()
+    loops = []
+    for root in gates:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        onStack.add(root)
+        work = [(root, iter(fanin[root]))]
+        while len(work) > 0:
+            gate, sources = work[-1]
+            advanced = False
+            for source in sources:
+                if source not in index:
+                    index[source] = low[source] = len(index)
+                    stack.append(source)
+                    onStack.add(source)
+                    work.append((source, iter(fanin[source])))
+                    advanced = True
+                    break
+                elif source in onStack:
+                    low[gate] = min(low[gate], index[source])
+            if advanced:
+                continue
+            work.pop()
+            if len(work) > 0:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[gate])
+            if low[gate] == index[gate]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    onStack.discard(member)
+                    component.append(member)
+                    if member is gate:
+                        break
+                if len(component) > 1 or gate in fanin[gate]:
+                    component.reverse()
+                    loops.append(component)
+    return loops
+
+
+# CompactNetlist: the circuit reduced to nets numbered 0..n-1.
+#   inputs:  net of each free Entry (the circuit inputs)
+#   gates:   (kind, input nets, output net, name) of each gate, in topological order
+#   outputs: net of each Checker
+# A net without input or gate driving it has unknown value.
+class CompactNetlist:
+    __netCount: int = 0
+    __inputs: List[int] = None
+    __gates: List[tuple] = None
+    __outputs: List[int] = None
+    __inputNames: List[str] = None
+    __outputNames: List[str] = None
+
+    def __init__(self, netCount: int, inputs: List[int], gates: List[tuple], outputs: List[int], inputNames: List[str] = None, outputNames: List[str] = None):
+        self.__netCount = netCount
+        self.__inputs = list(inputs)
+        self.__gates = [tuple(gate) for gate in gates]
+        self.__outputs = list(outputs)
+        self.__inputNames = list(inputNames) if inputNames is not None else ["I"+str(i) for i in range(len(inputs))]
+        self.__outputNames = list(outputNames) if outputNames is not None else ["O"+str(i) for i in range(len(outputs))]
+
+    def getNetCount(self) -> int:
+        return self.__netCount
+
+    def getInputs(self) -> List[int]:
+        return self.__inputs
+
+    def getGates(self) -> List[tuple]:
+        return self.__gates
+
+    def getOutputs(self) -> List[int]:
+        return self.__outputs
+
+    def getInputNames(self) -> List[str]:
+        return self.__inputNames
+
+    def getOutputNames(self) -> List[str]:
+        return self.__outputNames
+
+    def __str__(self):
+        return "CompactNetlist[nets="+str(self.__netCount)+" inputs="+str(len(self.__inputs))+" gates="+str(len(self.__gates))+" outputs="+str(len(self.__outputs))+"]"
+
+
+# netlistToDict(), netlistFromDict(): the net list as plain lists and strings, for JSON files.
+def netlistToDict(netlist: CompactNetlist) -> Dict:
+    return {"nets": netlist.getNetCount(), "inputs": netlist.getInputs(), "inputNames": netlist.getInputNames(),
+            "gates": [[kind, list(ins), out, name] for kind, ins, out, name in netlist.getGates()],
+            "outputs": netlist.getOutputs(), "outputNames": netlist.getOutputNames()}
+
+
+def netlistFromDict(data: Dict) -> CompactNetlist:
+    for kind, ins, out, name in data["gates"]:
+        if kind not in GATE_KINDS:
+            raise ValueError("ValueError: gate kind expected ("+", ".join(GATE_KINDS)+"). You entered: ", kind)
+    return CompactNetlist(data["nets"], data["inputs"], [(kind, tuple(ins), out, name) for kind, ins, out, name in data["gates"]],
+                          data["outputs"], data.get("inputNames"), data.get("outputNames"))
+
+
+def saveNetlist(netlist: CompactNetlist, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(netlistToDict(netlist), f, indent=1)
+
+
+def loadNetlist(path: str) -> CompactNetlist:
+    with open(path) as f:
+        return netlistFromDict(json.load(f))
@@ -0,0 +1,131 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo compila a lista de redes numa função Python em linha reta: uma
+*                     variável local por rede e uma expressão booleana por porta.
+*              en-us/ this file compiles the net list into a straight-line Python function: one local
+*                     variable per net and one boolean expression per gate.
+*
+"""
+
+from typing import Callable, Dict, List
+from circuit import *
+
+# Kleene operations, used by the generated code where a value may be unknown (None).
+
+
+def kleeneAnd(*values) -> bool:
+    if False in values:
+        return False
+    return None if None in values else True
+
+
+def kleeneOr(*values) -> bool:
+    if True in values:
+        return True
+    return None if None in values else False
+
+
+def kleeneXor(*values) -> bool:
+    if None in values:
+        return None
+    return values.count(True) % 2 == 1
+
+
+def kleeneNot(value) -> bool:
+    return None if value is None else not value
+
+
+# expression of each gate kind when every input is a bool
+BOOLEAN = {
+    GATE_AND: lambda ins: " and ".join(ins),
+    GATE_NAND: lambda ins: "not (" + " and ".join(ins) + ")",
+    GATE_OR: lambda ins: " or ".join(ins),
+    GATE_NOR: lambda ins: "not (" + " or ".join(ins) + ")",
+    GATE_XOR: lambda ins: " ^ ".join(ins),
+    GATE_XNOR: lambda ins: "not (" + " ^ ".join(ins) + ")",
+    GATE_NOT: lambda ins: "not " + ins[0],
+    GATE_BUF: lambda ins: ins[0],
+}
+
+# expression of each gate kind when some input may be unknown
+KLEENE = {
+    GATE_AND: lambda ins: "kleeneAnd(" + ", ".join(ins) + ")",
+    GATE_NAND: lambda ins: "kleeneNot(kleeneAnd(" + ", ".join(ins) + "))",
+    GATE_OR: lambda ins: "kleeneOr(" + ", ".join(ins) + ")",
+    GATE_NOR: lambda ins: "kleeneNot(kleeneOr(" + ", ".join(ins) + "))",
+    GATE_XOR: lambda ins: "kleeneXor(" + ", ".join(ins) + ")",
+    GATE_XNOR: lambda ins: "kleeneNot(kleeneXor(" + ", ".join(ins) + "))",
+    GATE_NOT: lambda ins: "kleeneNot(" + ins[0] + ")",
+    GATE_BUF: lambda ins: ins[0],
+}
+
+# compiled functions, by circuit structure; the least recently used goes away beyond CACHE_SIZE
+CACHE_SIZE = 64
+_cache: Dict = {}
+
+
+def signature(netlist: CompactNetlist) -> tuple:
+    return (netlist.getNetCount(), tuple(netlist.getInputs()), tuple([gate[:3] for gate in netlist.getGates()]), tuple(netlist.getOutputs()))
+
+
+# body(): the lines evaluating the gates. With boolean inputs, a net is a bool unless an undriven
+#         (unknown) net reaches it: only those gates need the Kleene operations.
+def body(netlist: CompactNetlist, booleanInputs: bool) -> List[str]:
+    driven = set(netlist.getInputs()) if booleanInputs else set()
+    lines = []
+    for kind, ins, out, name in netlist.getGates():
+        names = ["n"+str(i) for i in ins]
+        if all([i in driven for i in ins]):
+            lines.append("    n"+str(out)+" = "+BOOLEAN[kind](names)+"    # "+name)
+            driven.add(out)
+        else:
+            lines.append("    n"+str(out)+" = "+KLEENE[kind](names)+"    # "+name)
+    return lines
+
+
+# source(): the Python source of the compiled circuit. evaluate(values) receives the value of each
+#           input (in the order of netlist.getInputs()) and returns the tuple of output values.
+def source(netlist: CompactNetlist) -> str:
+    inputs = ["n"+str(i) for i in netlist.getInputs()]
+    assigned = set(netlist.getInputs()) | set([gate[2] for gate in netlist.getGates()])
+    undriven = sorted(set([i for gate in netlist.getGates() for i in gate[1]] + netlist.getOutputs()) - assigned)
+    outputs = "(" + "".join(["n"+str(i)+", " for i in netlist.getOutputs()]) + ")"
+
+    lines = ["def evaluateKleene(values):"]
+    lines.append("    " + "".join([i+", " for i in inputs]) + "= values" if len(inputs) > 0 else "    pass")
+    lines.extend(["    n"+str(i)+" = None" for i in undriven])
+    lines.extend(body(netlist, False))
+    lines.append("    return " + outputs)
+    lines.append("")
+    lines.append("def evaluate(values):")
+    lines.append("    if None in values:")
+    lines.append("        return evaluateKleene(values)")
+    lines.append("    " + "".join([i+", " for i in inputs]) + "= values" if len(inputs) > 0 else "    pass")
+    lines.extend(["    n"+str(i)+" = None" for i in undriven])
+    lines.extend(body(netlist, True))
+    lines.append("    return " + outputs)
+    return "\n".join(lines) + "\n"
+
+
+# compileNetlist(): the compiled evaluate() function of the net list, built once per circuit structure
+#                  (while it stays among the CACHE_SIZE structures used last).
+def compileNetlist(netlist: CompactNetlist) -> Callable:
+    key = signature(netlist)
+    function = _cache.pop(key, None)
+    if function is None:
+        scope = {"kleeneAnd": kleeneAnd, "kleeneOr": kleeneOr, "kleeneXor": kleeneXor, "kleeneNot": kleeneNot}
+        exec(compile(source(netlist), "<circuit>", "exec"), scope)
+        function = scope["evaluate"]
+        while len(_cache) >= CACHE_SIZE:
+            del _cache[next(iter(_cache))]
+    _cache[key] = function
+    return function
+
+
+def clearCache() -> None:
+    _cache.clear()
@@ -14,9 +14,10 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List
 from operator import xor
 from util import *
+from circuit import GATE_NOT, GATE_AND, GATE_NAND, GATE_OR, GATE_NOR, GATE_XOR, GATE_XNOR, gateTable
 # import sys
 
 from OpenGL.GL import *
@@ -24,33 +25,39 @@ from OpenGL.GLUT import *
 from OpenGL.GLU import *
 
 import math
+import weakref
 
 
 N_ENTRIES = 2
 
-
 # Entry: Represents a logic entry. It has a value itself.
 #       Then cannot be connected to other entries (only outputs its own value).
 class Entry(Element):
     # the attributes (private) only can be reached by getters and setters.
     __value: bool = None
     __coords: Coords = None
-    __tech_coords: Coords = None
+    __tech_coords: GridPoint = None
     __orientation = ORIENTATION_LR
     __size = POINT_SPACE*4
     __gate = None
     __keyboard = None
+    __listeners = None
     id = 0
     # the constructor of Entry receives a logic value and the Coords where the entry should be placed.
-    def __init__(self, coords: Coords = Coords(0.0, 0.0), size=POINT_SPACE*4, gate=None,keyboard = None,tech = None):
+    # A name given (a pin created after its gate, see Gate) does not take a new id.
+    def __init__(self, coords: Coords = Coords(0.0, 0.0), size=POINT_SPACE*4, gate=None,keyboard = None,tech = None, name = None):
         #super().__init__()
-        self.setName("E"+str(Entry.id))
-        Entry.id+=1
+        self.__listeners = []
+        if name is None:
+            name = "E"+str(Entry.id)
+            Entry.id+=1
+        self.setName(name)
         self.__size = size
         self.setCoords(coords)
         self.__gate = gate
         self.__keyboard = keyboard
-        self.__tech_coords = tech if tech is not None else coords
+        if tech is not None:     # setCoords() placed the tech coords at the coords
+            self.setTechCoords(tech)
 
     def getValue(self) -> bool:
         return self.__value
@@ -66,13 +73,28 @@ class Entry(Element):
         except ValueError as ve:
             return self
         else:
-            self.__value = value
+            if self.__value is not value:
+                self.__value = value
+                self.__notify()
             return self
 
+    # listeners are called with the entry every time its value changes.
+    def addListener(self, listener) -> None:
+        self.__listeners.append(listener)
+
+    def removeListener(self, listener) -> None:
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+
+    def __notify(self) -> None:
+        for listener in self.__listeners:
+            listener(self)
+
     def toogleV(self) -> bool:
         try:
             if self.__value is not None:
                 self.__value = xor(self.__value, True)
+                self.__notify()
                 return True
             else:
                 raise AttributeError("Entry value not defined!")
@@ -86,15 +108,19 @@ class Entry(Element):
         self.setTechCoords(coords)
         return True
 
+    def getOrientation(self) -> int:
+        return self.__orientation
+
     def setRotation(self, sense=False):
         self.__orientation = self.__orientation + (1 if sense else -1)
         self.__orientation = 0 if self.__orientation > 3 else self.__orientation
         self.__orientation = 3 if self.__orientation < 0 else self.__orientation
 
-    def getTechCoords(self)->Coords:
+    # the tech coords are a GridPoint, which can key dicts and sets (a Coords if the pin is off the grid).
+    def getTechCoords(self)->GridPoint:
         return self.__tech_coords
     def setTechCoords(self,coords:Coords):
-        self.__tech_coords = coords
+        self.__tech_coords = toGridPoint(coords)
         return self
 
     def setTranslation(self, coords=Coords):
@@ -185,22 +211,26 @@ class Checker(Element):
     __value: bool = None
     __coords: Coords = None
     __orientation = ORIENTATION_RL
-    __tech_coords: Coords = None
+    __tech_coords: GridPoint = None
     __size = POINT_SPACE*3
     __checked = False
     __display = None
     __gate = None
     id = 0
     # the constructor of Entry receives a logic value and the Coords where the entry should be placed.
-    def __init__(self, coords: Coords = Coords(0.0, 0.0), size=POINT_SPACE*3, display = None, gate = None, tech = None):
+    # A name given (a pin created after its gate, see Gate) does not take a new id.
+    def __init__(self, coords: Coords = Coords(0.0, 0.0), size=POINT_SPACE*3, display = None, gate = None, tech = None, name = None):
         #super().__init__()
-        self.setName("C"+str(Checker.id))
-        Checker.id+=1
+        if name is None:
+            name = "C"+str(Checker.id)
+            Checker.id+=1
+        self.setName(name)
         self.__size = size
         self.setCoords(coords)
         self.__display = display
         self.__gate = gate
-        self.__tech_coords = tech if tech is not None else coords
+        if tech is not None:     # setCoords() placed the tech coords at the coords
+            self.setTechCoords(tech)
 
     def getValue(self) -> bool:
         return self.__value
@@ -232,12 +262,16 @@ class Checker(Element):
         self.setTechCoords(coords)
         return True
 
-    def getTechCoords(self)->Coords:
+    # the tech coords are a GridPoint, which can key dicts and sets (a Coords if the pin is off the grid).
+    def getTechCoords(self)->GridPoint:
         return self.__tech_coords
     def setTechCoords(self,coords:Coords):
-        self.__tech_coords = coords
+        self.__tech_coords = toGridPoint(coords)
         return self
 
+    def getOrientation(self) -> int:
+        return self.__orientation
+
     def setRotation(self, sense=False):
         self.__orientation = self.__orientation + (1 if sense else -1)
         self.__orientation = 0 if self.__orientation > 3 else self.__orientation
@@ -247,6 +281,12 @@ class Checker(Element):
         self.setCoords(coords)
         return self
 
+    def isGateIn(self):
+        return self.__gate != None
+
+    def getGate(self):
+        return self.__gate
+
     def draw(self,n= True):
         # line
         c = line_orientation(
@@ -358,6 +398,9 @@ class Display(Element):
     def getCoords(self) -> Coords:
         return self.__coords
 
+    def getOrientation(self) -> int:
+        return self.__orientation
+
     def setRotation(self, sense=False):
         self.__orientation = self.__orientation + (1 if sense else -1)
         self.__orientation = 0 if self.__orientation > 3 else self.__orientation
@@ -508,6 +551,9 @@ class KeyBoard(Element):
         self.rectCenter().glTranslate()
         glRotatef(90.0*self.__orientation, 0.0, 0.0, 1.0)
 
+    def getOrientation(self) -> int:
+        return self.__orientation
+
     def setRotation(self, sense=False):
         self.__orientation = self.__orientation + (1 if sense else -1)
         self.__orientation = 0 if self.__orientation > 3 else self.__orientation
@@ -539,12 +585,12 @@ class KeyBoard(Element):
 
         self.__fill.apply()
         glBegin(GL_POLYGON)
-        rect_around(Coords(0.0, 0.0), self.__size*3/8, b=self.__size/2)
+        rect_around(ORIGIN, self.__size*3/8, b=self.__size/2)
         glEnd()
 
         COLOR_STROKE.apply()
         glBegin(GL_LINE_LOOP)
-        rect_around(Coords(0.0, 0.0), self.__size*3/8, b=self.__size/2)
+        rect_around(ORIGIN, self.__size*3/8, b=self.__size/2)
         glEnd()
 
         self.__ligh_off.apply()
@@ -618,14 +664,22 @@ class KeyBoard(Element):
 
 class Gate(Element):
     id: int = 0
+    # output of the gate for each tuple of input values over {False, True, None} (see circuit.gateTable).
+    # Each gate class points to its table instead of computing the output by itself.
+    table: Dict = None
     # the attributes (private) only can be reached by getters and setters.
-    __checks: List[Checker] = []
+    __checks: List[Checker] = None
     __coords: Coords = None
     __out: Entry = None
+    __inputs: int = 2           # number of checkers
+    __pinIds: tuple = None      # ids of the names of the output and of the first checker
 
     __fill: Color = Color(r=0.4, g=0.6, b=0.4)
     __orientation = ORIENTATION_LR
     __size = POINT_SPACE*5
+    __placed: tuple = None      # position and orientation the pin coords were computed for
+    offsets: Dict = {}           # (orientation, size, checkers) -> pin coords (see pinOffsets)
+    shapes: Dict = {}            # (gate class, size) -> outline as (x, y) tuples (see shape)
 
     # the constructor of Gate receives the gate type, two logic values and the Coords where it
     # should be placed.
@@ -634,18 +688,25 @@ class Gate(Element):
         self.setName("G" + str(Gate.id))
         Gate.id += 1
         self.__size = size
-
-
-        self.__out = Entry(gate=self)
         # If is not a Not Gate, then will have two entries
-        self.__checks = []
-        self.__checks.append(Checker(gate = self))
-        if bin:
-            self.__checks.append(Checker(gate = self))
-
-        self.__updateCoords()
+        self.__inputs = 2 if bin else 1
+        # the output and the checkers are created at their first use (see __pins()): opening a
+        # project with many gates does not build them all
+        self.__out = None
+        self.__checks = None
+        self.__placed = None
+        self.__pinIds = (Entry.id, Checker.id)     # the pins get the names they would get here
+        Entry.id += 1
+        Checker.id += self.__inputs
+
+    # __pins(): creates the output and the checkers of the gate.
+    def __pins(self) -> None:
+        entry, checker = self.__pinIds
+        self.__out = Entry(gate=self, name="E"+str(entry))
+        self.__checks = [Checker(gate = self, name="C"+str(checker+i)) for i in range(self.__inputs)]
 
     def getIn(self, i: int) -> Checker:
+        self.__updateCoords()
         try:
             if self.__checks is not None and len(self.__checks) > i and self.__checks[i] is not None:
                 return self.__checks[i]
@@ -672,6 +733,7 @@ class Gate(Element):
         return self.__size
 
     def setIn(self, i: int, v: bool) -> bool:  # returns True if succeeds.
+        self.__updateCoords()
         try:
             if self.__checks is not None and len(self.__checks) > i and self.__checks[i] is not None:
                 self.__checks[i].setValue(v)
@@ -691,7 +753,8 @@ class Gate(Element):
         self.__orientation = self.__orientation + (1 if sense else -1)
         self.__orientation = 0 if self.__orientation > 3 else self.__orientation
         self.__orientation = 3 if self.__orientation < 0 else self.__orientation
-        self.__updateCoords()
+        if self.__out is not None:
+            self.__updateCoords()
 
     def setTranslation(self, coords: Coords):
         c = line_orientation(
@@ -701,28 +764,82 @@ class Gate(Element):
         return self
 
     def __updateCoords(self) -> Gate:
-        # Configures orientation
-        c = Coords(0.0,0.0)
-        self.__out.setCoords(line_orientation(c, (self.__orientation+2) % 4, a=self.__size*2/5, l=False))
+        # the pins only move with the gate: nothing to do if it did not move or rotate since the last call
+        if self.__out is None:
+            self.__pins()
+        placed = (self.__coords.getX(), self.__coords.getY(), self.__orientation)
+        if placed == self.__placed:
+            return self
+        self.__placed = placed
+
+        out, checks, points = self.pinOffsets(self.__orientation, self.__size, self.__inputs)
+        point = toGridPoint(self.__coords)
+        if type(point) is not GridPoint or points is None:
+            point = self.__coords   # off the grid: the tech coords stay exact Coords
+            points = [out] + checks
+        self.__out.setCoords(out)
+        self.__out.setTechCoords(point.sum(points[0]))
+        for check, coords, offset in zip(self.__checks, checks, points[1:]):
+            check.setCoords(coords)
+            check.setTechCoords(point.sum(offset))
+        return self
 
-        middle = line_orientation(c, self.__orientation, a=self.__size*3/5, l=False)
-        if len(self.__checks) == 1:
-            self.__checks[0].setCoords(middle)    
+    # pinOffsets(): the coords of the output and of the checkers relative to the gate, and the same
+    #              offsets as GridPoints (None if one is off the grid). They only depend on the
+    #              orientation, the size and the number of checkers, so they are computed once and
+    #              shared by the gates (nobody changes the coords of a pin in place).
+    @staticmethod
+    def pinOffsets(orientation: int, size: float, checks: int) -> tuple:
+        key = (orientation, size, checks)
+        offsets = Gate.offsets.get(key)
+        if offsets is None:
+            # Configures orientation
+            c = Coords(0.0,0.0)
+            out = line_orientation(c, (orientation+2) % 4, a=size*2/5, l=False)
+            middle = line_orientation(c, orientation, a=size*3/5, l=False)
+            if checks == 1:
+                ins = [middle]
+            else:
+                ins = [line_orientation(middle, (orientation+3) % 4, a=size/5, l=False),
+                       line_orientation(middle, (orientation+1) % 4, a=size/5, l=False)]
+            points = [toGridPoint(i) for i in [out] + ins]
+            offsets = Gate.offsets[key] = (out, ins, points if all([type(i) is GridPoint for i in points]) else None)
+        return offsets
+
+    # shape(): the points of listPoints() as (x, y) tuples. They only depend on the class and the size
+    #         of the gate, so draw() takes them from here every frame instead of building new Coords.
+    def shape(self) -> tuple:
+        key = (type(self), self.__size)
+        shape = Gate.shapes.get(key)
+        if shape is None:
+            shape = Gate.shapes[key] = tuple([(i.getX(), i.getY()) for i in self.listPoints()])
+        return shape
+
+    # evaluate(): sets the output from the current values of the checkers, by a lookup at the table.
+    #            Does not touch the coords: gateOut() is the one which also updates them.
+    def evaluate(self) -> bool:
+        if self.__out is None:
+            self.__updateCoords()
+        checks = self.__checks
+        if len(checks) == 2:
+            value = self.table[(checks[0].getValue(), checks[1].getValue())]
         else:
-            self.__checks[1].setCoords(line_orientation(
-                middle, (self.__orientation+1) % 4, a=self.__size/5, l=False))
-            self.__checks[0].setCoords(line_orientation(
-                middle, (self.__orientation+3) % 4, a=self.__size/5, l=False))
-
-        self.__out.setTechCoords(self.__out.getCoords().sum(self.getCoords()))
-        self.__checks[0].setTechCoords(self.__checks[0].getCoords().sum(self.getCoords()))
-        if len(self.__checks) != 1:
-            self.__checks[1].setTechCoords(self.__checks[1].getCoords().sum(self.getCoords()))
+            value = self.table[tuple([i.getValue() for i in checks])]
+        self.__out.setValue(value)
+        return value
 
     def gateOut(self) -> Entry:
         self.__updateCoords()
+        if self.table is not None:
+            self.evaluate()
         return self.__out
 
+    # getOuts(): the output entries, with the coords updated but not evaluated. A gate has one; a
+    #           Subcircuit has one per output.
+    def getOuts(self) -> List[Entry]:
+        self.__updateCoords()
+        return [self.__out]
+
     def getCenter(self):
         return line_orientation(self.__coords, self.__orientation, a=self.__size*1/10, l=False)
 
@@ -746,15 +863,18 @@ class Gate(Element):
         return coords
 
     def getD(self):
+        self.__updateCoords()
         return line_orientation(self.__out.getCoords(), self.__orientation, self.__size/5, l=False)
 
     def draw(self,n= True):
         # self.getCoords().draw()
+        self.__updateCoords()
+        # the tech coords are the pins already placed on the gate (see __updateCoords())
         for check in self.__checks:
-            rect_polygon_around(check.getCoords().sum(self.getCoords()),self.__size*0.2/5)
-            line_orientation(check.getCoords().sum(self.getCoords()), (self.__orientation+2) % 4, self.__size/2)
-        line_orientation(self.__out.getCoords().sum(self.getCoords()), self.__orientation, self.__size/5)
-        rect_polygon_around(self.__out.getCoords().sum(self.getCoords()),self.__size*0.2/5)
+            rect_polygon_around(check.getTechCoords(),self.__size*0.2/5)
+            line_orientation(check.getTechCoords(), (self.__orientation+2) % 4, self.__size/2)
+        line_orientation(self.__out.getTechCoords(), self.__orientation, self.__size/5)
+        rect_polygon_around(self.__out.getTechCoords(),self.__size*0.2/5)
 
         # name
         Color().apply()
@@ -772,15 +892,11 @@ class Gate(Element):
 
 
 class NotGate(Gate):
+    table = gateTable(GATE_NOT, 1)
+
     def __init__(self, coords: Coords = Coords(0.0, 0.0), size=POINT_SPACE*5):
         super().__init__(coords, size=size,bin=False)
 
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(not self.getIn(0).getValue())
-
     def draw(self,n= True):
         super().draw(n=n)
         point = self.getD()
@@ -793,18 +909,18 @@ class NotGate(Gate):
         # Polygon
         self.getFill().apply()
         glBegin(GL_POLYGON)
-        Coords(self.getSize()*3/10, 0.0).apply()
-        Coords(-self.getSize()*3/10, -self.getSize()/5).apply()
-        Coords(-self.getSize()*3/10, self.getSize()/5).apply()
+        glVertex3f(self.getSize()*3/10, 0.0, 0.0)
+        glVertex3f(-self.getSize()*3/10, -self.getSize()/5, 0.0)
+        glVertex3f(-self.getSize()*3/10, self.getSize()/5, 0.0)
         glEnd()
 
         # bord
         # Polygon
         COLOR_STROKE.apply()
         glBegin(GL_LINE_LOOP)
-        Coords(self.getSize()*3/10, 0.0).apply()
-        Coords(-self.getSize()*3/10, -self.getSize()/5).apply()
-        Coords(-self.getSize()*3/10, self.getSize()/5).apply()
+        glVertex3f(self.getSize()*3/10, 0.0, 0.0)
+        glVertex3f(-self.getSize()*3/10, -self.getSize()/5, 0.0)
+        glVertex3f(-self.getSize()*3/10, self.getSize()/5, 0.0)
         glEnd()
 
         glPopMatrix()
@@ -826,11 +942,7 @@ class NotGate(Gate):
 
 
 class AndGate(Gate):
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(self.getIn(0).getValue() and self.getIn(1).getValue())
+    table = gateTable(GATE_AND, 2)
 
     def listPoints(self):
         ret = []
@@ -852,20 +964,20 @@ class AndGate(Gate):
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
         self.setCenter()
-        l = self.listPoints()
+        l = self.shape()
         # Polygon
         self.getFill().apply()
         glBegin(GL_POLYGON)
-        for i in l:
-            i.apply()
+        for x, y in l:
+            glVertex3f(x, y, 0.0)
         glEnd()
 
         # bord
         # Polygon
         COLOR_STROKE.apply()
         glBegin(GL_LINE_LOOP)
-        for i in l:
-            i.apply()
+        for x, y in l:
+            glVertex3f(x, y, 0.0)
         glEnd()
 
         glPopMatrix()
@@ -890,12 +1002,7 @@ class AndGate(Gate):
 
 
 class NandGate(AndGate):
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(not(self.getIn(0).getValue()
-                                  and self.getIn(1).getValue()))
+    table = gateTable(GATE_NAND, 2)
 
     def draw(self,n= True):
         super().draw(n=n)
@@ -905,12 +1012,7 @@ class NandGate(AndGate):
 
 
 class OrGate(Gate):
-
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(self.getIn(0).getValue() or self.getIn(1).getValue())
+    table = gateTable(GATE_OR, 2)
 
     def listPoints(self):
         ret = []
@@ -935,20 +1037,20 @@ class OrGate(Gate):
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
         self.setCenter()
-        l = self.listPoints()
+        l = self.shape()
         # Polygon
         self.getFill().apply()
         glBegin(GL_POLYGON)
-        for i in l:
-            i.apply()
+        for x, y in l:
+            glVertex3f(x, y, 0.0)
         glEnd()
 
         # bord
         # Polygon
         COLOR_STROKE.apply()
         glBegin(GL_LINE_LOOP)
-        for i in l:
-            i.apply()
+        for x, y in l:
+            glVertex3f(x, y, 0.0)
         glEnd()
 
         
@@ -976,13 +1078,7 @@ class OrGate(Gate):
 
 
 class NorGate(OrGate):
-
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(not(self.getIn(0).getValue()
-                                  or self.getIn(1).getValue()))
+    table = gateTable(GATE_NOR, 2)
 
     def draw(self,n= True):
         super().draw(n=n)
@@ -992,12 +1088,7 @@ class NorGate(OrGate):
 
 
 class XorGate(OrGate):
-
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(self.getIn(0).getValue() != self.getIn(1).getValue())
+    table = gateTable(GATE_XOR, 2)
 
     def draw(self,n= True):
         super().draw(n=n)
@@ -1011,11 +1102,11 @@ class XorGate(OrGate):
         COLOR_STROKE.apply()
         glBegin(GL_LINE_STRIP)
 
-        Coords(-self.getSize()*0.37, -self.getSize()*0.2).apply()
-        Coords(-self.getSize()*0.29, -self.getSize()*0.1).apply()
-        Coords(-self.getSize()*0.27, 0).apply()
-        Coords(-self.getSize()*0.29, +self.getSize()*0.1).apply()
-        Coords(-self.getSize()*0.37, +self.getSize()*0.2).apply()
+        glVertex3f(-self.getSize()*0.37, -self.getSize()*0.2, 0.0)
+        glVertex3f(-self.getSize()*0.29, -self.getSize()*0.1, 0.0)
+        glVertex3f(-self.getSize()*0.27, 0.0, 0.0)
+        glVertex3f(-self.getSize()*0.29, +self.getSize()*0.1, 0.0)
+        glVertex3f(-self.getSize()*0.37, +self.getSize()*0.2, 0.0)
 
         glEnd()
 
@@ -1025,12 +1116,7 @@ class XorGate(OrGate):
 
 
 class XnorGate(XorGate):
-
-    def gateOut(self) -> Entry:
-        entry = super().gateOut()
-        if None in self.getChecks():
-            return entry.setValue(None)
-        return entry.setValue(self.getIn(0).getValue() == self.getIn(1).getValue())
+    table = gateTable(GATE_XNOR, 2)
 
     def draw(self,n= True):
         super().draw(n=n)
@@ -1038,6 +1124,193 @@ class XnorGate(XorGate):
         point.sum(self.getCoords()).draw(color=Color(r=1.0, g=1.0, b=1.0), stroke=Color(),radius = self.getSize()*3/40)
         return self
 
+# Subcircuit: a component made from the circuit of another tab (its CircuitNetlist, see netlist.py).
+#            Each free entry of that circuit is an input pin and each checker which is not a gate
+#            input is an output pin. With up to SUBCIRCUIT_TABLE inputs the outputs come from the
+#            truth table of the subcircuit, built once per change of the source tab and shared by
+#            every instance; otherwise (or with an unknown input) from its compiled function.
+SUBCIRCUIT_TABLE = 16
+
+_subcircuits = weakref.WeakKeyDictionary()  # source -> (stamp, net list, rows of the table, function)
+_expanding = set()                          # sources being expanded, to find a subcircuit of itself
+
+
+# subcircuitPins(): the entries and checkers of the source circuit which become the pins.
+def subcircuitPins(source) -> tuple:
+    from netlist import freeEntries
+    return freeEntries(source.getEntries()), [i for i in source.getCheckers() if not i.isGateIn()]
+
+
+class Subcircuit(Element):
+    id = 0
+    __source = None
+    __checks: List[Checker] = None
+    __outs: List[Entry] = None
+    __memo: tuple = None
+    __coords: Coords = None
+    __fill: Color = Color(r=0.6, g=0.6, b=0.8)
+    __orientation = ORIENTATION_LR
+    __size = POINT_SPACE*4
+
+    def __init__(self, source, coords: Coords = Coords(0.0, 0.0), size=POINT_SPACE*4):
+        self.setName("S"+str(Subcircuit.id))
+        Subcircuit.id += 1
+        self.__size = size
+        self.__source = source
+        self.__memo = None
+        inputs, outputs = subcircuitPins(source)
+        self.__checks = [Checker(gate=self) for i in inputs]
+        self.__outs = [Entry(gate=self) for i in outputs]
+        self.setCoords(coords)
+
+    def getSource(self):
+        return self.__source
+
+    def getChecks(self) -> List[Checker]:
+        self.__updateCoords()
+        return self.__checks
+
+    def getOuts(self) -> List[Entry]:
+        self.__updateCoords()
+        return self.__outs
+
+    def getCoords(self) -> Coords:
+        return self.__coords
+
+    def setCoords(self, coords: Coords) -> bool:
+        self.__coords = coords
+        self.__updateCoords()
+        return True
+
+    def getOrientation(self) -> int:
+        return self.__orientation
+
+    def setRotation(self, sense=False):
+        self.__orientation = self.__orientation + (1 if sense else -1)
+        self.__orientation = 0 if self.__orientation > 3 else self.__orientation
+        self.__orientation = 3 if self.__orientation < 0 else self.__orientation
+        self.__updateCoords()
+        return self
+
+    def setTranslation(self, coords: Coords):
+        self.setCoords(coords)
+        return self
+
+    # half of the side with the pins: room for the input or the output column, whichever is longer.
+    def __height(self) -> float:
+        return max(len(self.__checks), len(self.__outs), 1)*POINT_SPACE
+
+    def __updateCoords(self):
+        pins = [(self.__checks, self.__orientation), (self.__outs, (self.__orientation+2) % 4)]
+        for column, side in pins:
+            for i in range(len(column)):
+                c = line_orientation(Coords(0.0, 0.0), side, a=self.__size, l=False)
+                c = line_orientation(c, (self.__orientation+1) % 4, a=(2*i-len(column)+1)*POINT_SPACE, l=False)
+                column[i].setCoords(c)
+                column[i].setTechCoords(c.sum(self.getCoords()))
+
+    # getStamp(): changes whenever the source tab, or the source of a subcircuit inside it, is edited.
+    def getStamp(self) -> tuple:
+        if self.__source in _expanding:
+            raise RuntimeError("Error! Subcircuit inside itself. "+str(self)+".")
+        _expanding.add(self.__source)
+        try:
+            return (self.__source.getVersion(),) + tuple([i.getStamp() for i in self.__source.getSubcircuits()])
+        finally:
+            _expanding.discard(self.__source)
+
+    # __getMemo(): the net list, truth table and function of the source, rebuilt only if it changed.
+    def __getMemo(self) -> tuple:
+        stamp = self.getStamp()
+        if self.__memo is not None and self.__memo[0] == stamp:
+            return self.__memo
+        memo = _subcircuits.get(self.__source)
+        if memo is None or memo[0] != stamp:
+            from netlist import compactNetlist
+            import bitparallel
+            import compiler
+            inputs, outputs = subcircuitPins(self.__source)
+            _expanding.add(self.__source)
+            try:
+                netlist = compactNetlist(self.__source.getEntries(), self.__source.getWires(), outputs)
+            finally:
+                _expanding.discard(self.__source)
+            rows = None
+            if len(inputs) <= SUBCIRCUIT_TABLE:
+                table = bitparallel.truthTable(netlist, list(range(len(inputs))))
+                rows = [tuple(table.getRow(r)) for r in range(table.getRows())]
+            memo = (stamp, netlist, rows, compiler.compileNetlist(netlist))
+            _subcircuits[self.__source] = memo
+        if len(memo[1].getInputs()) != len(self.__checks) or len(memo[1].getOutputs()) != len(self.__outs):
+            raise RuntimeError("Error! The pins of the subcircuit changed. "+str(self)+".")
+        self.__memo = memo
+        return memo
+
+    # getNetlist(): the source circuit as a CompactNetlist, inputs and outputs in the order of the pins.
+    def getNetlist(self):
+        return self.__getMemo()[1]
+
+    # evaluate(): sets the outputs from the current values of the checkers: one index at the truth
+    #            table (bit i of the row is the input i) or, without a table, a call of the function.
+    def evaluate(self) -> tuple:
+        memo = self.__getMemo()
+        values = [i.getValue() for i in self.__checks]
+        if memo[2] is not None and None not in values:
+            row = 0
+            for i in range(len(values)):
+                if values[i]:
+                    row |= 1 << i
+            outputs = memo[2][row]
+        else:
+            outputs = memo[3](values)
+        for out, value in zip(self.__outs, outputs):
+            out.setValue(value)
+        return outputs
+
+    def __box(self) -> tuple:
+        if self.__orientation % 2 == 0:
+            return self.__size/2, self.__height()
+        return self.__height(), self.__size/2
+
+    def draw(self, n=True):
+        a, b = self.__box()
+        self.__fill.apply()
+        glBegin(GL_POLYGON)
+        rect_around(self.getCoords(), a, b)
+        glEnd()
+
+        COLOR_STROKE.apply()
+        glBegin(GL_LINE_LOOP)
+        rect_around(self.getCoords(), a, b)
+        glEnd()
+
+        for check in self.getChecks():
+            line_orientation(check.getTechCoords(), (self.__orientation+2) % 4, self.__size/2)
+            rect_polygon_around(check.getTechCoords(), self.__size*0.2/4)
+        for out in self.getOuts():
+            line_orientation(out.getTechCoords(), self.__orientation, self.__size/2)
+            if out.getValue() == True:
+                COLOR_TRUE.apply()
+            elif out.getValue() == False:
+                COLOR_FALSE.apply()
+            else:
+                COLOR_NONE.apply()
+            rect_polygon_around(out.getTechCoords(), self.__size*0.2/4)
+
+        # name
+        Color().apply()
+        if(n):
+            text_right(self.getName(), self.getCoords().sum(Coords(-a, -b-self.__size/4)))
+        return self
+
+    def event(self, event_type: int, key=None, button=None, state=None, coords=None) -> bool:
+        return False
+
+    def isInside(self, coords) -> bool:
+        a, b = self.__box()
+        return coords.in_around(self.getCoords(), a, b)
+
+
 # Wire: Represents the connector of the logic circuit. It's defined as a list of unique
 #      Coords. Once connected to an logic component carries its value from start to end points.
 
@@ -1144,6 +1417,10 @@ def isGate(component) -> bool:
     return isinstance(component, Gate)
 
 
+def isSubcircuit(component) -> bool:
+    return isinstance(component, Subcircuit)
+
+
 def isWire(component) -> bool:
     return isinstance(component, Wire)
 
@@ -0,0 +1,125 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa a verificação de regras de projeto (DRC): redes com
+*                     mais de um driver, entradas de portas flutuando, saídas de portas sem carga e
+*                     verificadores ligados a nada, numa única passada pelas redes.
+*              en-us/ this file implements the design rule check (DRC): nets with many drivers,
+*                     floating gate inputs, unloaded gate outputs and checkers tied to nothing, in a
+*                     single pass over the nets.
+*
+"""
+
+from typing import Dict, List
+from components import *
+from netlist import NetBuilder
+
+ERROR = "error"         # the circuit can not be simulated
+WARNING = "warning"     # the circuit is simulated, but some values are unknown or unused
+
+RULE_MULTIPLE_DRIVERS = "multiple drivers"
+RULE_FLOATING_INPUT = "floating gate input"
+RULE_UNLOADED_OUTPUT = "unloaded gate output"
+RULE_UNCONNECTED_CHECKER = "unconnected checker"
+
+SEVERITY = {RULE_MULTIPLE_DRIVERS: ERROR, RULE_FLOATING_INPUT: WARNING,
+            RULE_UNLOADED_OUTPUT: WARNING, RULE_UNCONNECTED_CHECKER: WARNING}
+
+
+# pinName(): the name of a pin; a gate pin is named after its gate.
+def pinName(pin) -> str:
+    gate = pin.getGate()
+    if gate is None:
+        return pin.getName()
+    if isEntry(pin):
+        outs = gate.getOuts()
+        return gate.getName() + ".out" + (str(outs.index(pin)) if len(outs) > 1 else "")
+    return gate.getName() + ".in" + str(gate.getChecks().index(pin))
+
+
+# Violation: a rule broken at a net and the pins involved.
+class Violation:
+    __rule: str = None
+    __net: int = None
+    __pins: List = None
+
+    def __init__(self, rule: str, net: int, pins: List):
+        self.__rule = rule
+        self.__net = net
+        self.__pins = pins
+
+    def getRule(self) -> str:
+        return self.__rule
+
+    def getSeverity(self) -> str:
+        return SEVERITY[self.__rule]
+
+    def getNet(self) -> int:
+        return self.__net
+
+    def getPins(self) -> List:
+        return self.__pins
+
+    def getMessage(self) -> str:
+        return self.__rule.capitalize() + " at net " + str(self.__net) + ": " + ", ".join([pinName(i) for i in self.__pins]) + "."
+
+    def __str__(self):
+        return self.getSeverity().capitalize() + "! " + self.getMessage()
+
+
+# checkNets(): the violations of the pins grouped by nets (a NetBuilder holding every pin). Each pin
+#             is looked up once and each net visited once, so the check is linear in the pins.
+def checkNets(nets: NetBuilder, entries: List[Entry], checkers: List[Checker]) -> List[Violation]:
+    drivers = {}    # net -> entries
+    loads = {}      # net -> checkers
+    for i in dict.fromkeys(entries):
+        net = nets.getNet(i)
+        if net in drivers:
+            drivers[net].append(i)
+        else:
+            drivers[net] = [i]
+    for i in dict.fromkeys(checkers):
+        net = nets.getNet(i)
+        if net in loads:
+            loads[net].append(i)
+        else:
+            loads[net] = [i]
+
+    violations = []
+    for net, found in drivers.items():
+        if len(found) > 1:
+            violations.append(Violation(RULE_MULTIPLE_DRIVERS, net, found))
+        elif net not in loads and found[0].isGateOut():
+            violations.append(Violation(RULE_UNLOADED_OUTPUT, net, found))
+    for net, found in loads.items():
+        if net not in drivers:
+            floating = [i for i in found if i.isGateIn()]
+            if len(floating) > 0:
+                violations.append(Violation(RULE_FLOATING_INPUT, net, floating))
+            if len(floating) < len(found):
+                violations.append(Violation(RULE_UNCONNECTED_CHECKER, net, [i for i in found if not i.isGateIn()]))
+    return violations
+
+
+# checkDesign(): the violations of the circuit given as at the analyzer.
+def checkDesign(entries: List[Entry], wires: List, checkers: List[Checker]) -> List[Violation]:
+    return checkNets(NetBuilder(wires, entries + checkers), entries, checkers)
+
+
+def errors(violations: List[Violation]) -> List[Violation]:
+    return [i for i in violations if i.getSeverity() == ERROR]
+
+
+# summary(): one line for the message box: the count of each rule and the first violation.
+def summary(violations: List[Violation]) -> str:
+    if len(violations) == 0:
+        return "DRC: no violations."
+    counts = {}
+    for i in violations:
+        counts[i.getRule()] = counts.get(i.getRule(), 0) + 1
+    first = (errors(violations) + violations)[0]
+    return "DRC: " + ", ".join([str(count) + " " + rule for rule, count in counts.items()]) + ". " + str(first)
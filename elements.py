@@ -1,6 +1,13 @@
 from components import Element, Coords
-from components import Entry, Checker, Display, NotGate, AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate, KeyBoard
+from components import Entry, Checker, Display, NotGate, AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate, KeyBoard, Subcircuit
 from logicanalyzer import*
+from levelizedanalyzer import LevelizedAnalyzer
+from netlist import CircuitNetlist, compactNetlist, freeEntries, uniqueCheckers
+from scheduler import TabScheduler
+import optimizer
+from project import saveProject, loadProject
+from drc import summary
+from eventanalyzer import EventDrivenAnalyzer
 from util import *
 
 from OpenGL.GL import *
@@ -19,6 +26,7 @@ TYPE_WIRE_Z_INVERT = 1
 ROTATE = 0
 DUPLICATE = 1
 DELETE = 2
+PROJECT_FILE = "project.desp"   # saved with Ctrl+S and opened with Ctrl+O (project.json for the JSON variant)
 
 #This class is resposible for draw the wires in window. All the operations needed 
 #to do this are here
@@ -32,13 +40,23 @@ class WireManager(Element):
     __typeWire: int = None              #Determine type wire
     __wireCanceled: bool = False
     __start: bool = True
+    __netlist: CircuitNetlist = None    # receives each wire completed by the user
     def __init__(self):
         super().__init__()
         self.dotsWires = []
+        self.__netlist = None
         self.setTypeWire(TYPE_WIRE_Z_INVERT)
 
     def getDotsWires(self):
         return self.dotsWires
+
+    def setNetlist(self, netlist: CircuitNetlist):
+        self.__netlist = netlist
+        for i in self.dotsWires:
+            netlist.addWire(i)
+
+    def getNetlist(self) -> CircuitNetlist:
+        return self.__netlist
     def setTypeWire(self,type: int):
         self.__typeWire = type
     def setEndWire(self,coords = Coords):
@@ -71,7 +89,7 @@ class WireManager(Element):
     def updateCoordDotsWires(self,translate: Coords):
         for i in self.dotsWires:
             for j in range(len(i)):
-                coord = (Coords(i[j].getX()+translate.getX(), i[j].getY()+translate.getY()))
+                coord = (GridPoint(i[j].getX()+translate.getX(), i[j].getY()+translate.getY()))
                 i[j] = coord
 
     #Procedure for draw the current wire,whose wire yet not been completed by the user
@@ -80,32 +98,34 @@ class WireManager(Element):
         glBegin(GL_LINE_STRIP)
 
 
-        Coords(self.validPoint(self.__startWire.getX()),self.validPoint(self.__startWire.getY())).apply()
+        GridPoint(self.validPoint(self.__startWire.getX()),self.validPoint(self.__startWire.getY())).apply()
         if self.__typeWire == TYPE_WIRE_Z_INVERT:
-            Coords(self.validPoint(self.__startWire.getX()),self.validPoint((self.__endWire.getY() + self.__startWire.getY())/2)).apply()
-            Coords(self.validPoint(self.__endWire.getX()),self.validPoint((self.__endWire.getY()+self.__startWire.getY())/2)).apply()
+            GridPoint(self.validPoint(self.__startWire.getX()),self.validPoint((self.__endWire.getY() + self.__startWire.getY())/2)).apply()
+            GridPoint(self.validPoint(self.__endWire.getX()),self.validPoint((self.__endWire.getY()+self.__startWire.getY())/2)).apply()
         if self.__typeWire == TYPE_WIRE_Z:
-            Coords(self.validPoint((self.__startWire.getX() + self.__endWire.getX())/2),self.validPoint(self.__startWire.getY())).apply()
-            Coords(self.validPoint((self.__startWire.getX()+self.__endWire.getX())/2),self.validPoint(self.__endWire.getY())).apply()
-        Coords(self.validPoint(self.__endWire.getX()),self.validPoint(self.__endWire.getY())).apply()
+            GridPoint(self.validPoint((self.__startWire.getX() + self.__endWire.getX())/2),self.validPoint(self.__startWire.getY())).apply()
+            GridPoint(self.validPoint((self.__startWire.getX()+self.__endWire.getX())/2),self.validPoint(self.__endWire.getY())).apply()
+        GridPoint(self.validPoint(self.__endWire.getX()),self.validPoint(self.__endWire.getY())).apply()
         glEnd()
 
-        rect_polygon_around(Coords(self.validPoint(self.__startWire.getX()),self.validPoint(self.__startWire.getY())),a=POINT_SPACE*0.2)
-        rect_polygon_around(Coords(self.validPoint(self.__endWire.getX()),self.validPoint(self.__endWire.getY())),a=POINT_SPACE*0.2)
+        rect_polygon_around(GridPoint(self.validPoint(self.__startWire.getX()),self.validPoint(self.__startWire.getY())),a=POINT_SPACE*0.2)
+        rect_polygon_around(GridPoint(self.validPoint(self.__endWire.getX()),self.validPoint(self.__endWire.getY())),a=POINT_SPACE*0.2)
 
     #Take the coordinates of the last wire the user made and add it to the wire list to draw 
     # porsteriomente
     def addDotsToWire(self):
         list = []
-        list.append(Coords(self.validPoint(self.__startWire.getX()),self.validPoint(self.__startWire.getY())))
+        list.append(GridPoint(self.validPoint(self.__startWire.getX()),self.validPoint(self.__startWire.getY())))
         if self.__typeWire == TYPE_WIRE_Z_INVERT:
-            list.append(Coords(self.validPoint(self.__startWire.getX()),self.validPoint((self.__endWire.getY() + self.__startWire.getY())/2)))
-            list.append(Coords(self.validPoint(self.__endWire.getX()),self.validPoint((self.__endWire.getY()+self.__startWire.getY())/2)))
+            list.append(GridPoint(self.validPoint(self.__startWire.getX()),self.validPoint((self.__endWire.getY() + self.__startWire.getY())/2)))
+            list.append(GridPoint(self.validPoint(self.__endWire.getX()),self.validPoint((self.__endWire.getY()+self.__startWire.getY())/2)))
         if self.__typeWire == TYPE_WIRE_Z:
-            list.append( Coords(self.validPoint((self.__startWire.getX() + self.__endWire.getX())/2),self.validPoint(self.__startWire.getY())))
-            list.append(Coords(self.validPoint((self.__startWire.getX()+self.__endWire.getX())/2),self.validPoint(self.__endWire.getY())))
-        list.append(Coords(self.validPoint(self.__endWire.getX()),self.validPoint(self.__endWire.getY())))
+            list.append( GridPoint(self.validPoint((self.__startWire.getX() + self.__endWire.getX())/2),self.validPoint(self.__startWire.getY())))
+            list.append(GridPoint(self.validPoint((self.__startWire.getX()+self.__endWire.getX())/2),self.validPoint(self.__endWire.getY())))
+        list.append(GridPoint(self.validPoint(self.__endWire.getX()),self.validPoint(self.__endWire.getY())))
         self.dotsWires.append(list)
+        if self.__netlist is not None:
+            self.__netlist.addWire(list)
         
 
     def isInside(self, coords):
@@ -241,6 +261,62 @@ class MessageBox(Element):
         return False
         
 
+# ElementList: the elements of a Window. The components appended, inserted or removed directly at
+#              the list (as the older screens do) reach the netlist too, so starting a simulation never
+#              scans the elements again.
+class ElementList(list):
+    __netlist: CircuitNetlist = None
+
+    def __init__(self, netlist: CircuitNetlist):
+        super().__init__()
+        self.__netlist = netlist
+
+    def append(self, component):
+        super().append(component)
+        self.__netlist.addComponent(component)
+
+    def insert(self, index: int, component):
+        super().insert(index, component)
+        self.__netlist.addComponent(component)
+
+    def extend(self, components):
+        components = list(components)
+        super().extend(components)
+        self.__netlist.addComponents(components)
+
+    def __iadd__(self, components):
+        self.extend(components)
+        return self
+
+    def pop(self, index: int = -1):
+        component = super().pop(index)
+        self.__netlist.removeComponent(component)
+        return component
+
+    def remove(self, component):
+        super().remove(component)
+        self.__netlist.removeComponent(component)
+
+    def clear(self):
+        for component in self:
+            self.__netlist.removeComponent(component)
+        super().clear()
+
+    def __setitem__(self, index, value):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        new = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        for component in old:
+            self.__netlist.removeComponent(component)
+        self.__netlist.addComponents(new)
+
+    def __delitem__(self, index):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for component in old:
+            self.__netlist.removeComponent(component)
+
+
 #This class is responsible for draw the elements like gaters and entrys and grid
 #  
 class Window(Element):
@@ -250,7 +326,17 @@ class Window(Element):
     __currentComponentDragged: int = 0 
     __simulation: bool = False
     __logicAnalyzer: LogicAnalyzer = None
+    __analyzerClass = LogicAnalyzer     # engine used at the next simulation (LogicAnalyzer, LevelizedAnalyzer or EventDrivenAnalyzer)
     __messageBox: MessageBox = None
+    __netlist: CircuitNetlist = None    # pins and wires of the circuit, kept up to date while editing
+    __scheduled: bool = False           # the simulation runs at a TabScheduler instead of at draw()
+    __compact = None                    # compact net list sent to the scheduler
+    __structure: tuple = None           # structure of the analyzer when the compact net list was built
+    __inputs: list = None
+    __outputs: list = None              # checkers and gate outputs, in the order of the compact outputs
+    __future = None                     # evaluation running at the scheduler
+    __submitted: tuple = None           # stamp of the analyzer when the values were sent to the scheduler
+    __violations: list = None           # design rule violations of the running simulation
 
     __translate: Coords = Coords(0,0)
     def __init__(self):
@@ -258,14 +344,9 @@ class Window(Element):
         self.center = Coords(0, 0)
         self.size = Coords(0, 0)
         self.zoom = 1.0
-        self.elements = []
+        self.__netlist = CircuitNetlist()
+        self.elements = ElementList(self.__netlist)
         self.windowStartPosition = Coords(0,0)
-        self.checks = []
-        self.keyboards = []
-        self.entrys = []
-        self.gates = []
-        self.displays = []
-        self.wires = []
         self.logic = None
         self.setMessageBox(MessageBox())
         self.getMessageBox().setCenter(self.getCenter())
@@ -282,46 +363,56 @@ class Window(Element):
     def getTranslate(self):
         return self.__tranlate
 
-    def breakListElements(self):
-        for i in self.elements:
-            if isinstance(i,(NotGate, AndGate,NandGate, OrGate, NorGate, XorGate, XnorGate)):    
-                self.gates.append(i)
-            elif isinstance(i,KeyBoard):
-                self.keyboards.append(i)
-            elif isinstance(i,Checker):
-                self.checks.append(i)
-            elif isinstance(i,Entry):
-                self.entrys.append(i)
-            elif isinstance(i,Display):
-                self.displays.append(i)
-
-    def ativateSimulation(self):
-        self.breakListElements()
-        checks = []
-        entrys = []
-        
-        for i in self.gates:
-            checks.extend(i.getChecks())
-            entrys.append(i.gateOut())
+    def setAnalyzerClass(self, analyzerClass):
+        self.__analyzerClass = analyzerClass
+
+    def getAnalyzerClass(self):
+        return self.__analyzerClass
+
+    # getLogicAnalyzer(): the analyzer of the running simulation, None while editing.
+    def getLogicAnalyzer(self) -> LogicAnalyzer:
+        return self.__logicAnalyzer
 
-        for i in self.displays:
-            checks.extend(i.getChecks())
+    def getNetlist(self) -> CircuitNetlist:
+        return self.__netlist
 
-        for i in self.keyboards:
-            entrys.extend(i.getEntries())
-        for i in self.entrys:
+    # the elements list (ElementList) passes what is added and removed to the netlist, so the netlist
+    # follows the editing.
+    def addElement(self, component):
+        self.elements.append(component)
+
+    def removeElement(self, index: int):
+        return self.elements.pop(index)
+
+    def ativateSimulation(self, analyzerClass=None):
+        if analyzerClass is not None:
+            self.setAnalyzerClass(analyzerClass)
+        if self.__logicAnalyzer is not None:    # restarted: the old analyzer stops listening to the entries
+            self.unschedule()
+            self.__logicAnalyzer.release()
+            self.__logicAnalyzer = None
+        for i in self.__netlist.getInputs():
             i.setValue(False)
-        checks.extend(self.checks)
-        entrys.extend(self.entrys)
-        self.__logicAnalyzer = LogicAnalyzer(entrys, self.wires, checks)
+        self.__logicAnalyzer = self.getAnalyzerClass()(self.__netlist.getEntries(), self.__netlist.getWires(), self.__netlist.getCheckers())
+        self.__logicAnalyzer.setSource(self.__netlist)
+        self.__violations = self.__logicAnalyzer.drc()
+        if len(self.__violations) > 0:
+            self.getMessageBox().setMessage(summary(self.__violations))
+            self.getMessageBox().setVisible(True)
+
+    # getViolations(): the design rule violations found when the simulation started (see drc.py).
+    def getViolations(self) -> list:
+        return self.__violations
 
     def deactivateSimulation(self):
+        self.unschedule()
+        self.__violations = None
         for i in self.__logicAnalyzer.getEntries():
             i.setValue(None)
         for i in self.__logicAnalyzer.getCheckers():
             i.setValue(None)
+        self.__logicAnalyzer.release()
         self.__logicAnalyzer = None
-        self.wires.clear()
         print("sim")
 
     
@@ -375,15 +466,71 @@ class Window(Element):
             valor = (x - x%POINT_SPACE) if x%POINT_SPACE>0 else (x -x%POINT_SPACE + POINT_SPACE) 
             return int(valor)
 
+    def __simulationError(self, re: RuntimeError):
+        print(re)
+        self.getMessageBox().setMessage(str(re))
+        self.getMessageBox().setVisible(True)
+        self.deactivateSimulation()
+
+    # schedule(): runs the simulation at the scheduler instead of at draw(). Each call publishes the
+    #            finished result at the checkers and at the gate outputs (every value draw() shows),
+    #            rebuilds the net list if the structure of this tab changed and sends the entry
+    #            values again if its stamp changed. Returns True while a result is pending.
+    def schedule(self, scheduler: TabScheduler) -> bool:
+        if self.__logicAnalyzer is None:
+            return False
+        self.__scheduled = True
+        if self.__future is not None:
+            if not self.__future.done():
+                return True
+            future = self.__future
+            self.__future = None
+            if not future.cancelled():
+                for pin, value in zip(self.__outputs, future.result()):
+                    pin.setValue(value)
+        structure = self.__logicAnalyzer.structure()
+        if self.__compact is None or self.__structure != structure:
+            analyzer = self.__logicAnalyzer
+            self.__inputs = freeEntries(analyzer.getEntries())
+            probes = list(dict.fromkeys([i for i in analyzer.getEntries() if i.isGateOut()]))
+            try:
+                self.__compact = optimizer.optimize(compactNetlist(analyzer.getEntries(), analyzer.getWires(), analyzer.getCheckers(), probes))[0]
+            except RuntimeError as re:
+                self.__simulationError(re)
+                return False
+            self.__outputs = uniqueCheckers(analyzer.getCheckers()) + probes
+            self.__structure = structure
+            self.__submitted = None
+        stamp = self.__logicAnalyzer.stamp()
+        if self.__submitted != stamp:
+            self.__submitted = stamp
+            self.__future = scheduler.submit(self.__compact, [i.getValue() for i in self.__inputs])
+            return True
+        return False
+
+    # unschedule(): drops the scheduled simulation; draw() analyzes the circuit again. The values the
+    #              scheduler published are cleared, since the analyzer may not reach every gate output.
+    def unschedule(self) -> None:
+        if self.__future is not None:
+            self.__future.cancel()
+        self.__future = None
+        if self.__outputs is not None:
+            for pin in self.__outputs:
+                pin.setValue(None)
+            self.__logicAnalyzer.invalidate()
+        self.__compact = None
+        self.__structure = None
+        self.__submitted = None
+        self.__scheduled = False
+        self.__inputs = None
+        self.__outputs = None
+
     def draw(self):
-        if self.__logicAnalyzer is not None:
+        if self.__logicAnalyzer is not None and not self.__scheduled:
             try:
                 self.__logicAnalyzer.analyze()
             except RuntimeError as re:
-                print(re)
-                self.getMessageBox().setMessage(str(re))
-                self.getMessageBox().setVisible(True)
-                self.deactivateSimulation()
+                self.__simulationError(re)
          # self.logicAnalyzer.apply()
         #Draw the windows grid
         Color(0.0,0.0,0.0).apply()
@@ -393,7 +540,7 @@ class Window(Element):
         glBegin(GL_POINTS)
         for i in range(self.validPoint(self.windowStartPosition.getX()),self.validPoint(self.size.getX()), 5):
             for j in range(self.validPoint(self.windowStartPosition.getY()),self.validPoint(self.size.getY()), 5):
-                Coords(i,j).apply()
+                GridPoint(i,j).apply()
         glEnd()        
          
         #self.center.draw(radius=1.0)
@@ -413,6 +560,7 @@ class Window(Element):
     def updateCoordsElementsWindows(self, translate: Coords):
          for i in self.elements:
                 i.setCoords(Coords(i.getCoords().getX()+translate.getX(),i.getCoords().getY()+translate.getY()))
+         self.__netlist.refresh()
 
     def getIndexComponentIsInside(self, coords: Coords):
         for i in range(len(self.elements)):
@@ -420,12 +568,11 @@ class Window(Element):
                 return len(self.elements)-i-1
         return -1
 
+    # the wires reach the netlist as the user draws them; a wire manager not linked yet gives its
+    # wires once, here. Only the wire ends matter to the simulation.
     def prepareWireForSimulation(self, wireManager: WireManager):
-        for i in wireManager.getDotsWires():
-            l = []
-            l.append(i[0])
-            l.append(i[-1])
-            self.wires.append(l)
+        if wireManager.getNetlist() is not self.__netlist:
+            wireManager.setNetlist(self.__netlist)
 
     def event(self, event_type: int, key=None, button=None, state=None, coords=None) -> bool:
         if self.__logicAnalyzer is not None:
@@ -450,6 +597,7 @@ class Window(Element):
             if event_type == EVENT_TYPE_MOUSE_WALKING_NOT_PRESS:
                 if self.__dragComponent == True:
                     self.elements[ self.__currentComponentDragged].setTranslation(Coords(self.validPoint(coords.getX()),self.validPoint(coords.getY())))
+                    self.__netlist.moveComponent(self.elements[ self.__currentComponentDragged])
                     return True
 
         return False
@@ -602,6 +750,7 @@ class Panel(Element):
         self.getWindow().setWindowStartPosition(Coords(27-self.__coords.getX(),24- self.__coords.getY() ))
         self.getWindow().setSize(Coords(self.__coords.getX()*2 - 27,self.__coords.getY()*2 -24))
         self.setWireManager(WireManager())
+        self.getWireManager().setNetlist(self.getWindow().getNetlist())
         self.translateWindows(Coords(0,0))
         self.__window.adjustCenter()
         self.createMenu()
@@ -632,7 +781,7 @@ class Panel(Element):
 
     def addComponentWindow(self, component):
         if self.__window is not None:
-            self.__window.elements.append(component)
+            self.__window.addElement(component)
 
     def setWindow(self, window: Window):
         self.__window = window
@@ -689,12 +838,13 @@ class Panel(Element):
                 pass
             else:
                 self.__window.elements[self.__indexComponent].setRotation()
+                self.__window.getNetlist().moveComponent(self.__window.elements[self.__indexComponent])
             return 0
         
         if selection == 1:
             if len(self.__window.elements)>0 and self.__indexComponent != -1:
                 if self.__window.getDragComponent() ==False:
-                    self.__window.elements.pop(self.__indexComponent)
+                    self.__window.removeElement(self.__indexComponent)
                 
 
             return 0
@@ -1468,6 +1618,7 @@ class WindowGlobal(Element):
     __abaId: int = 0
     __windowFocus: int = -1
     __whatAbaIsFocus: int = -1  # Current windos bar is focus
+    __scheduler: TabScheduler = None    # simulates every tab in background (None, the default: each tab analyzes at draw)
 
     def __init__(self, sizeWindowGlobal=Coords(100, 100)):
         super().__init__()
@@ -1475,6 +1626,42 @@ class WindowGlobal(Element):
         self.workSet = []  # list of windowsBar
         self.tools = []  # list of Tools, like button start and stop simulation and zoom
         self.__abaId = 0
+        self.__scheduler = None
+
+    # setScheduler(): with a TabScheduler every open tab is simulated in background by the compiled
+    #                circuit, which gives only the values: the analyzer chosen for the tab, its trace,
+    #                profile and design rule check are left out. None goes back to the analyzers.
+    def setScheduler(self, scheduler: TabScheduler):
+        if self.__scheduler is not None:
+            self.__scheduler.shutdown()
+            for i in self.workSet:
+                i.getPanel().getWindow().unschedule()
+        self.__scheduler = scheduler
+
+    def getScheduler(self) -> TabScheduler:
+        return self.__scheduler
+
+    # addSubcircuit(): places at the focused tab, under the mouse, a Subcircuit made from the circuit
+    #                 of another tab (0 is the first one). Alt + the tab position (1 for the first tab)
+    #                 does it from the keyboard.
+    def addSubcircuit(self, source: int) -> Subcircuit:
+        if self.__whatAbaIsFocus < 0 or source == self.__whatAbaIsFocus or source < 0 or source >= len(self.workSet):
+            return None
+        panel = self.workSet[self.__whatAbaIsFocus].getPanel()
+        component = Subcircuit(self.workSet[source].getPanel().getWindow().getNetlist(), panel.getCoordMouse())
+        panel.addComponentWindow(component)
+        return component
+
+    # sends the simulation of every tab to the scheduler; while results are pending the screen is
+    # redrawn, so they show up as soon as they arrive.
+    def scheduleTabs(self):
+        if self.__scheduler is None:
+            return
+        pending = False
+        for i in self.workSet:
+            pending = i.getPanel().getWindow().schedule(self.__scheduler) or pending
+        if pending:
+            glutPostRedisplay()
     # Alls components like windowsBars, painelComponents are draws based on size the glut window
 
     def setSizeWindowGlobal(self, sizeWindowGlobal: Coords):
@@ -1500,7 +1687,7 @@ class WindowGlobal(Element):
     
     def draw(self):
         
-        
+        self.scheduleTabs()
         if self.__whatAbaIsFocus > -1 and len(self.workSet)>0:
             self.workSet[self.__whatAbaIsFocus].getPanel().draw()
             self.drawShadow()
@@ -1602,16 +1789,66 @@ class WindowGlobal(Element):
         for i in self.tools:
             if isinstance(i, IconMoreAba):
                 if i.isInside(coords.getX(), coords.getY()) == True:
-                    windowBar = WindowsBar(self.__abaId)
-                    windowBar.setSizeWindow(
-                        Coords(self.__width, self.__height))
-                    self.workSet.append(windowBar)
-                    windowBar.onlyOneFocus(self.workSet)
-                    self.__whatAbaIsFocus = self.__abaId
-                    self.__abaId = self.__abaId+1
+                    self.newTab()
+
+    # newTab(): adds a tab and gives it the focus.
+    def newTab(self) -> WindowsBar:
+        windowBar = WindowsBar(self.__abaId)
+        windowBar.setSizeWindow(
+            Coords(self.__width, self.__height))
+        self.workSet.append(windowBar)
+        windowBar.onlyOneFocus(self.workSet)
+        self.__whatAbaIsFocus = self.__abaId
+        self.__abaId = self.__abaId+1
+        return windowBar
+
+    # saveProject(): saves every tab (see project.py).
+    def saveProject(self, path: str = PROJECT_FILE):
+        tabs = []
+        for i in self.workSet:
+            panel = i.getPanel()
+            tabs.append((panel.getWindow().elements, panel.getWireManager().getDotsWires(), panel.getWindow().getNetlist()))
+        saveProject(path, tabs)
+
+    # openProject(): replaces the tabs by the ones of the project file.
+    def openProject(self, path: str = PROJECT_FILE):
+        for i in self.workSet:
+            if not i.getPanel().getWindow().isSimulation():
+                i.getPanel().getWindow().deactivateSimulation()
+        self.workSet = []
+        self.__abaId = 0
+        self.__whatAbaIsFocus = -1
+        bars = []
+
+        def newNetlist():
+            bars.append(self.newTab())
+            return bars[-1].getPanel().getWindow().getNetlist()
+
+        for bar, (elements, wires, netlist) in zip(bars, loadProject(path, newNetlist)):
+            for i in elements:
+                bar.getPanel().addComponentWindow(i)
+            bar.getPanel().getWireManager().getDotsWires().extend(wires)
+        if len(self.workSet) > 0:
+            for i in self.workSet:
+                i.setFocus(False)
+            self.workSet[0].setFocus(True)
+            self.__whatAbaIsFocus = 0
        
     def event(self, event_type: int, key=None, button=None, state=None, coords: Coords = None) -> bool:
 
+        if event_type == EVENT_TYPE_KEY_ASCII and key in [b'1', b'2', b'3', b'4', b'5', b'6', b'7', b'8', b'9'] and glutGetModifiers() & GLUT_ACTIVE_ALT:
+            self.addSubcircuit(int(key) - 1)
+            return None
+        if event_type == EVENT_TYPE_KEY_ASCII and key in [b'\x13', b'\x0f']:     # Ctrl+S, Ctrl+O
+            try:
+                self.saveProject() if key == b'\x13' else self.openProject()
+            except (OSError, ValueError, RuntimeError) as e:
+                print(e)
+            return None
+        if event_type == EVENT_TYPE_KEY_ASCII and key == b'\x02':     # Ctrl+B: every tab in background, or back to the analyzers
+            self.setScheduler(TabScheduler() if self.getScheduler() is None else None)
+            return None
+
         if state == GLUT_UP:    
             self.monitoreWindowsTools(coords)                       #check if any icons have been triggered
             self.windowBarFocusNow(coords.getX(), coords.getY())    #check if any bars have been triggered and assign focus to her
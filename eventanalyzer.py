@@ -0,0 +1,120 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa a simulação orientada a eventos: ao mudar o valor de
+*                     um Entry, apenas as portas afetadas por ele são avaliadas novamente.
+*              en-us/ this file implements the event-driven simulation: when an Entry changes its
+*                     value, only the gates affected by it are evaluated again.
+*
+"""
+
+import heapq
+from typing import Dict, List
+from components import *
+from levelizedanalyzer import LevelizedAnalyzer
+
+
+# EventDrivenAnalyzer: the first analysis evaluates the whole circuit. After that, each Entry
+#                     (including the KeyBoard ones) warns the analyzer when its value changes and
+#                     the next analysis only propagates these changes, gate by gate and level by
+#                     level, stopping where a gate output does not change.
+class EventDrivenAnalyzer(LevelizedAnalyzer):
+    __fanout: Dict = None       # entry -> gates driven by the entry net
+    __direct: Dict = None       # entry -> checkers driven by the entry net
+    __level: Dict = None        # gate -> level of the gate
+    __out: Dict = None          # gate -> entries of the gate outputs (a Subcircuit has many)
+    __changed: List = None      # entries changed since the last analysis
+    __ready: bool = False
+
+    def __init__(self, entries: List[Entry], wires: List[Wire], checkers: List[Checker]) -> None:
+        super().__init__(entries, wires, checkers)
+        self.__changed = []
+        self.__ready = False
+
+    def __build(self) -> None:
+        self.__fanout = {}
+        self.__direct = {}
+        self.__level = {}
+        self.__out = {}
+        for i, level in enumerate(self.getLevels()):
+            for gate in level:
+                self.__level[gate] = i
+                self.__out[gate] = gate.getOuts()
+
+        for check, source in self.getSources().items():
+            if source is None:
+                continue
+            if source not in self.__direct:
+                self.__direct[source] = []
+                self.__fanout[source] = []
+            self.__direct[source].append(check)
+            if check.isGateIn() and check.getGate() not in self.__fanout[source]:
+                self.__fanout[source].append(check.getGate())
+
+        for entry in self.getEntries():
+            if not entry.isGateOut():
+                entry.addListener(self.entryChanged)
+
+    def entryChanged(self, entry: Entry) -> None:
+        self.__changed.append(entry)
+
+    def __propagate(self) -> bool:
+        changed = self.__changed
+        self.__changed = []
+
+        queue = []
+        queued = set()
+        for entry in changed:
+            for check in self.__direct.get(entry, []):
+                check.setValue(entry.getValue())
+            for gate in self.__fanout.get(entry, []):
+                if gate not in queued:
+                    queued.add(gate)
+                    heapq.heappush(queue, (self.__level[gate], id(gate), gate))
+
+        while len(queue) > 0:
+            gate = heapq.heappop(queue)[2]
+            outs = self.__out[gate]
+            old = [out.getValue() for out in outs]
+            gate.evaluate()
+            for out, value in zip(outs, old):
+                if out.getValue() is value:
+                    continue
+                for check in self.__direct.get(out, []):
+                    check.setValue(out.getValue())
+                for target in self.__fanout.get(out, []):
+                    if target not in queued:
+                        queued.add(target)
+                        heapq.heappush(queue, (self.__level[target], id(target), target))
+        return True
+
+    def simulate(self) -> bool:
+        if not self.__ready:
+            if self.isProfiling():
+                self.measure("fanout", self.__build)
+            else:
+                self.__build()
+            self.__ready = True
+            self.__changed = []
+            return super().simulate()
+        if len(self.__changed) == 0:
+            return True
+        if self.isProfiling():
+            return self.measure("propagate", self.__propagate)
+        return self.__propagate()
+
+    def release(self) -> None:
+        if self.__ready:
+            for entry in self.getEntries():
+                entry.removeListener(self.entryChanged)
+        self.__ready = False
+        self.__changed = []
+        self.__fanout = None
+        self.__direct = None
+        self.__level = None
+        self.__out = None
+        super().release()
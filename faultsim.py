@@ -0,0 +1,139 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa a simulação de falhas "stuck-at" em paralelo: cada bit
+*                     das palavras carrega o circuito com uma falha diferente, e o bit 0 o circuito bom.
+*              en-us/ this file implements the parallel stuck-at fault simulation: each bit of the
+*                     words carries the circuit with a different fault, and the bit 0 the good circuit.
+*
+"""
+
+from typing import Dict, List
+from circuit import *
+from bitparallel import OPERATIONS, word
+
+OUTPUT_PIN = -1     # pin of a fault at the gate output; the inputs are 0, 1, ...
+
+
+# faultList(): every stuck-at-0 and stuck-at-1 fault at the pins of every gate, as tuples
+#             (gate index at netlist.getGates(), pin, stuck value).
+def faultList(netlist: CompactNetlist) -> List[tuple]:
+    faults = []
+    for g in range(len(netlist.getGates())):
+        for pin in [OUTPUT_PIN] + list(range(len(netlist.getGates()[g][1]))):
+            faults.append((g, pin, False))
+            faults.append((g, pin, True))
+    return faults
+
+
+def faultName(netlist: CompactNetlist, fault: tuple) -> str:
+    g, pin, value = fault
+    return netlist.getGates()[g][3] + (".out" if pin == OUTPUT_PIN else ".in"+str(pin)) + ("/SA1" if value else "/SA0")
+
+
+# force(): the word with the lanes of mask0 stuck at 0 and the lanes of mask1 stuck at 1.
+def force(w: tuple, mask0: int, mask1: int) -> tuple:
+    return (w[0] & ~mask0) | mask1, w[1] | mask0 | mask1
+
+
+# FaultReport: the faults simulated and, for each detected one, the index of the first vector
+#             which detected it.
+class FaultReport:
+    __netlist: CompactNetlist = None
+    __faults: List[tuple] = None
+    __detected: Dict = None
+    __vectors: int = 0
+
+    def __init__(self, netlist: CompactNetlist, faults: List[tuple], detected: Dict, vectors: int):
+        self.__netlist = netlist
+        self.__faults = faults
+        self.__detected = detected
+        self.__vectors = vectors
+
+    def getFaults(self) -> List[tuple]:
+        return self.__faults
+
+    def getDetected(self) -> Dict:
+        return self.__detected
+
+    def getUndetected(self) -> List[tuple]:
+        return [f for f in self.__faults if f not in self.__detected]
+
+    def getVectors(self) -> int:
+        return self.__vectors
+
+    def getCoverage(self) -> float:
+        if len(self.__faults) == 0:
+            return 1.0
+        return len(self.__detected) / len(self.__faults)
+
+    def getNames(self, faults: List[tuple]) -> List[str]:
+        return [faultName(self.__netlist, f) for f in faults]
+
+    def __str__(self):
+        return "FaultReport[faults="+str(len(self.__faults))+" detected="+str(len(self.__detected))+" coverage=%.2f%%]" % (100*self.getCoverage())
+
+
+# simulateFaults(): applies each vector (the values of netlist.getInputs()) to the good circuit, at
+#                  the lane 0, and to one faulty circuit per remaining fault, at the other lanes. A
+#                  fault is detected when a known output differs from the known good value. With
+#                  drop, detected faults leave the lanes, so later vectors only carry the others.
+def simulateFaults(netlist: CompactNetlist, vectors: List[List[bool]], faults: List[tuple] = None, drop: bool = True) -> FaultReport:
+    if faults is None:
+        faults = faultList(netlist)
+    gates = netlist.getGates()
+    detected = {}
+    remaining = list(dict.fromkeys(faults))
+    count = 0
+    for r in range(len(vectors)):
+        if len(remaining) == 0:
+            break
+        count += 1
+        mask = (1 << (len(remaining) + 1)) - 1
+
+        # masks of the lanes stuck at each pin: gate -> pin -> [mask0, mask1]
+        pins = {}
+        for lane in range(len(remaining)):
+            g, pin, value = remaining[lane]
+            masks = pins.setdefault(g, {}).setdefault(pin, [0, 0])
+            masks[1 if value else 0] |= 1 << (lane + 1)
+
+        nets = [(0, 0)] * netlist.getNetCount()
+        for net, value in zip(netlist.getInputs(), vectors[r]):
+            nets[net] = word(value, mask)
+        for g in range(len(gates)):
+            kind, ins, out, name = gates[g]
+            words = [nets[i] for i in ins]
+            stuck = pins.get(g)
+            if stuck is None:
+                nets[out] = OPERATIONS[kind](words, mask)
+                continue
+            for pin, masks in stuck.items():
+                if pin != OUTPUT_PIN:
+                    words[pin] = force(words[pin], masks[0], masks[1])
+            w = OPERATIONS[kind](words, mask)
+            if OUTPUT_PIN in stuck:
+                w = force(w, stuck[OUTPUT_PIN][0], stuck[OUTPUT_PIN][1])
+            nets[out] = w
+
+        differ = 0
+        for net in netlist.getOutputs():
+            v, k = nets[net]
+            if k & 1:
+                differ |= k & (v ^ (mask if v & 1 else 0))
+        differ >>= 1
+
+        kept = []
+        for lane in range(len(remaining)):
+            if (differ >> lane) & 1:
+                if remaining[lane] not in detected:
+                    detected[remaining[lane]] = r
+                if drop:
+                    continue
+            kept.append(remaining[lane])
+        remaining = kept
+    return FaultReport(netlist, faults, detected, count)
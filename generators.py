@@ -0,0 +1,232 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo gera circuitos sintéticos com as entradas, verificadores e portas
+*                     do simulador: somadores, multiplicadores, árvores de paridade e grafos
+*                     aleatórios, usados pelos benchmarks.
+*              en-us/ this file generates synthetic circuits with the entries, checkers and gates of
+*                     the simulator: adders, multipliers, parity trees and random graphs, used by
+*                     the benchmarks.
+*
+"""
+
+import random
+from typing import Callable, Dict, List
+
+from util import *
+from components import *
+from netlist import CircuitNetlist
+
+COLUMN = 40*POINT_SPACE     # distance between the columns of gates
+ROW = 20*POINT_SPACE        # distance between the gates of a column
+DEPTH = 10                  # levels of the random graphs
+
+
+# GeneratedCircuit: the net list of a generated circuit, with its inputs and outputs in order and the
+#                  expected output values of each input vector.
+class GeneratedCircuit:
+    __name: str = None
+    __netlist: CircuitNetlist = None
+    __inputs: List[Entry] = None
+    __outputs: List[Checker] = None
+    __reference: Callable = None
+    __gates: int = 0
+
+    def __init__(self, name: str, netlist: CircuitNetlist, inputs: List[Entry], outputs: List[Checker], reference: Callable, gates: int):
+        self.__name = name
+        self.__netlist = netlist
+        self.__inputs = inputs
+        self.__outputs = outputs
+        self.__reference = reference
+        self.__gates = gates
+
+    def getName(self) -> str:
+        return self.__name
+
+    def getNetlist(self) -> CircuitNetlist:
+        return self.__netlist
+
+    def getInputs(self) -> List[Entry]:
+        return self.__inputs
+
+    def getOutputs(self) -> List[Checker]:
+        return self.__outputs
+
+    def getGateCount(self) -> int:
+        return self.__gates
+
+    # reference(): the output values of an input vector, computed straight from the gate tables.
+    def reference(self, values: List[bool]) -> List[bool]:
+        return self.__reference(values)
+
+    def __str__(self):
+        return "GeneratedCircuit["+self.__name+" inputs="+str(len(self.__inputs))+" gates="+str(self.__gates)+" outputs="+str(len(self.__outputs))+"]"
+
+
+# Placer: places the components of a generated circuit and wires them. Each gate goes to the column
+#        after its deepest source, so no two pins meet by chance; the checkers stay at the left.
+class Placer:
+    __netlist: CircuitNetlist = None
+    __inputs: List[Entry] = None
+    __outputs: List[Checker] = None
+    __read: List[int] = None    # index of the source of each output
+    __level: Dict = None        # source (entry or gate output) -> column
+    __rows: Dict = None         # column -> components placed
+    __index: Dict = None        # source -> index of its value at the reference
+    __steps: List = None        # (table, source indexes) of each gate, in order
+
+    def __init__(self):
+        self.__netlist = CircuitNetlist()
+        self.__inputs = []
+        self.__outputs = []
+        self.__read = []
+        self.__level = {}
+        self.__rows = {}
+        self.__index = {}
+        self.__steps = []
+
+    def __place(self, column: int) -> Coords:
+        row = self.__rows.get(column, 0)
+        self.__rows[column] = row + 1
+        return Coords(column*COLUMN, row*ROW)
+
+    def __wire(self, source: Entry, check: Checker) -> None:
+        self.__netlist.addWire([source.getTechCoords(), check.getTechCoords()])
+
+    def entry(self) -> Entry:
+        entry = Entry(coords=self.__place(0))
+        self.__netlist.addComponent(entry)
+        self.__inputs.append(entry)
+        self.__level[entry] = 0
+        self.__index[entry] = len(self.__index)
+        return entry
+
+    # gate(): a gate of the class fed by the sources; returns the gate output.
+    def gate(self, cls, *sources) -> Entry:
+        column = max([self.__level[i] for i in sources]) + 1
+        gate = cls(coords=self.__place(column))
+        self.__netlist.addComponent(gate)
+        for source, check in zip(sources, gate.getChecks()):
+            self.__wire(source, check)
+        out = gate.gateOut()
+        self.__level[out] = column
+        self.__index[out] = len(self.__index)
+        self.__steps.append((cls.table, tuple([self.__index[i] for i in sources])))
+        return out
+
+    def checker(self, source: Entry) -> Checker:
+        checker = Checker(coords=self.__place(-1))
+        self.__netlist.addComponent(checker)
+        self.__wire(source, checker)
+        self.__outputs.append(checker)
+        self.__read.append(self.__index[source])
+        return checker
+
+    def circuit(self, name: str) -> GeneratedCircuit:
+        steps = list(self.__steps)
+        outputs = list(self.__read)
+
+        def reference(values: List[bool]) -> List[bool]:
+            v = list(values)
+            for table, ins in steps:
+                v.append(table[tuple([v[i] for i in ins])])
+            return [v[i] for i in outputs]
+
+        return GeneratedCircuit(name, self.__netlist, list(self.__inputs), list(self.__outputs), reference, len(steps))
+
+
+# halfAdder(), fullAdder(): (sum, carry) of the bits.
+def halfAdder(placer: Placer, a: Entry, b: Entry) -> tuple:
+    return placer.gate(XorGate, a, b), placer.gate(AndGate, a, b)
+
+
+def fullAdder(placer: Placer, a: Entry, b: Entry, c: Entry) -> tuple:
+    x = placer.gate(XorGate, a, b)
+    return placer.gate(XorGate, x, c), placer.gate(OrGate, placer.gate(AndGate, a, b), placer.gate(AndGate, x, c))
+
+
+# addBits(): ripple addition of two numbers given least significant bit first (the shorter one is
+#           padded with nothing: a half adder or no gate at all). Returns (sum bits, carry or None).
+def addBits(placer: Placer, x: List[Entry], y: List[Entry], carry: Entry = None) -> tuple:
+    sums = []
+    for k in range(max(len(x), len(y))):
+        bits = [i for i in (x[k] if k < len(x) else None, y[k] if k < len(y) else None, carry) if i is not None]
+        if len(bits) == 1:
+            s, carry = bits[0], None
+        elif len(bits) == 2:
+            s, carry = halfAdder(placer, bits[0], bits[1])
+        else:
+            s, carry = fullAdder(placer, bits[0], bits[1], bits[2])
+        sums.append(s)
+    return sums, carry
+
+
+# rippleCarryAdder(): inputs a0..a(n-1), b0..b(n-1), carry in; outputs s0..s(n-1), carry out.
+def rippleCarryAdder(bits: int) -> GeneratedCircuit:
+    placer = Placer()
+    a = [placer.entry() for i in range(bits)]
+    b = [placer.entry() for i in range(bits)]
+    c = placer.entry()
+    sums, carry = addBits(placer, a, b, c)
+    for i in sums + [carry]:
+        placer.checker(i)
+    return placer.circuit("adder")
+
+
+# arrayMultiplier(): inputs a0..a(n-1), b0..b(n-1); outputs the 2n bits of the product. Each row of
+#                   partial products (AND gates) is added to the previous sum by a ripple adder.
+def arrayMultiplier(bits: int) -> GeneratedCircuit:
+    placer = Placer()
+    a = [placer.entry() for i in range(bits)]
+    b = [placer.entry() for i in range(bits)]
+    products = [[placer.gate(AndGate, a[i], b[j]) for i in range(bits)] for j in range(bits)]
+    result = []
+    acc = products[0]
+    for j in range(1, bits):
+        result.append(acc[0])
+        sums, carry = addBits(placer, acc[1:], products[j])
+        acc = sums + ([carry] if carry is not None else [])
+    for i in result + acc:
+        placer.checker(i)
+    return placer.circuit("multiplier")
+
+
+# parityTree(): XOR of every input, by a balanced tree of two input gates.
+def parityTree(inputs: int) -> GeneratedCircuit:
+    placer = Placer()
+    level = [placer.entry() for i in range(inputs)]
+    while len(level) > 1:
+        level = [placer.gate(XorGate, level[i], level[i+1]) if i+1 < len(level) else level[i] for i in range(0, len(level), 2)]
+    placer.checker(level[0])
+    return placer.circuit("parity")
+
+
+# randomDag(): width inputs and depth levels of width random gates. Each gate reads the level before
+#             and, with one input in four, any earlier source. The last level gives the outputs.
+def randomDag(width: int, depth: int = DEPTH, seed: int = 0) -> GeneratedCircuit:
+    rnd = random.Random(seed)
+    kinds = [AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate, NotGate]
+    placer = Placer()
+    level = [placer.entry() for i in range(width)]
+    sources = list(level)
+    for d in range(depth):
+        gates = []
+        for g in range(width):
+            cls = rnd.choice(kinds)
+            count = 1 if cls is NotGate else 2
+            ins = [rnd.choice(sources) if rnd.random() < 0.25 else rnd.choice(level) for i in range(count)]
+            ins[0] = level[g]
+            gates.append(placer.gate(cls, *ins))
+        sources.extend(gates)
+        level = gates
+    for i in level:
+        placer.checker(i)
+    return placer.circuit("dag")
+
+
+# generators by family name, each one receiving the size of the circuit.
+FAMILIES = {"adder": rippleCarryAdder, "multiplier": arrayMultiplier, "parity": parityTree, "dag": randomDag}
@@ -0,0 +1,123 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa um analisador lógico que ordena as portas por nível
+*                     (ordenação topológica) uma única vez e avalia cada porta uma vez por análise.
+*              en-us/ this file implements a logic analyzer which sorts the gates by level
+*                     (topological sort) only once and evaluates each gate once per analysis.
+*
+"""
+
+from typing import Dict, List
+from components import *
+from logicanalyzer import LogicAnalyzer
+from netlist import NetBuilder, checkLoops
+from circuit import levelize
+
+
+# LevelizedAnalyzer: resolves the connections of the circuit only once, at the first analysis,
+#                   and keeps the gates in topological order. Each analysis then evaluates every
+#                   gate exactly once, instead of repeating the checkers until all are checked.
+class LevelizedAnalyzer(LogicAnalyzer):
+    __sources: Dict = None      # checker -> entry that drives it (None if not connected)
+    __loads: Dict = None        # gate -> checkers driven by the gate output
+    __levels: List = None       # gates grouped by level
+
+    def __init__(self, entries: List[Entry], wires: List[Wire], checkers: List[Checker]) -> None:
+        super().__init__(entries, wires, checkers)
+        self.__sources = None
+        self.__loads = None
+        self.__levels = None
+
+    def getLevels(self) -> List:
+        if self.__levels is None:
+            self.__build()
+        return self.__levels
+
+    def getSources(self) -> Dict:
+        if self.__levels is None:
+            self.__build()
+        return self.__sources
+
+    def getLoads(self) -> Dict:
+        if self.__levels is None:
+            self.__build()
+        return self.__loads
+
+    def __build(self) -> None:
+        entries = self.getEntries()
+        checkers = self.getCheckers()
+        fanin = {}
+
+        gates = []
+        for i in entries + checkers:
+            if i.getGate() is not None and i.getGate() not in fanin:
+                fanin[i.getGate()] = []
+                gates.append(i.getGate())
+        for gate in gates:
+            gate.getChecks()    # updates the tech coords of the gate pins
+
+        nets = NetBuilder(self.getWires(), entries + checkers)
+        self.countComparisons(nets)
+        drivers = {}
+        for i in entries:
+            driver = drivers.get(nets.getNet(i))
+            if driver is not None and driver != i:
+                raise RuntimeError("Error! Entries connected. "+str(driver)+ " with " + str(i)+".")
+            drivers[nets.getNet(i)] = i
+
+        self.__sources = {}
+        self.__loads = {}
+        for gate in gates:
+            self.__loads[gate] = []
+        for check in checkers:
+            source = drivers.get(nets.getNet(check))
+            self.__sources[check] = source
+            if source is not None and source.isGateOut():
+                self.__loads[source.getGate()].append(check)
+                if check.isGateIn() and source.getGate() not in fanin[check.getGate()]:
+                    fanin[check.getGate()].append(source.getGate())
+
+        checkLoops(gates, fanin)
+        levels, loop = levelize(gates, fanin)
+        self.__levels = levels
+
+    def __evaluate(self) -> bool:
+        # casos 1 e 2: checkers conectados a nada ou diretamente a um entry
+        for check, source in self.__sources.items():
+            if source is None:
+                check.setValue(None)
+                check.setChecked(True)
+            elif not source.isGateOut():
+                check.setValue(source.getValue())
+                check.setChecked(True)
+            else:
+                check.setChecked(False)
+
+        # casos 3 e 4: as portas de um nível só dependem de portas dos níveis anteriores
+        for level in self.__levels:
+            for gate in level:
+                gate.evaluate()
+                for check in self.__loads[gate]:
+                    check.setValue(self.__sources[check].getValue())
+                    check.setChecked(True)
+        return True
+
+    def simulate(self) -> bool:
+        if self.isProfiling():
+            if self.__levels is None:
+                self.measure("build", self.__build)
+            return self.measure("evaluate", self.__evaluate)
+        if self.__levels is None:
+            self.__build()
+        return self.__evaluate()
+
+    def release(self) -> None:
+        self.__sources = None
+        self.__loads = None
+        self.__levels = None
+        super().release()
@@ -12,63 +12,189 @@
 *
 """
 
-from typing import List
+import time
+from typing import Callable, Dict, List
 from components import *
+from netlist import NetBuilder, compactNetlist, freeEntries, checkLoops, netSignals
+from circuit import CompactNetlist, saveNetlist
+from drc import Violation, checkNets, checkDesign, errors
+import bitparallel
+
+FRAME = 1/60     # seconds of a frame: the analyses longer than this are reported by stallReporter()
+
+
+# AnalysisStats: the cost of profiled analyses (see LogicAnalyzer.profile()): the seconds and calls of
+#               each phase, the passes of the fixed-point loop and the comparisons of points.
+class AnalysisStats:
+    __analyses: int = 0
+    __seconds: float = 0.0
+    __phases: Dict = None       # phase -> seconds
+    __calls: Dict = None        # phase -> calls
+    __iterations: int = 0
+    __comparisons: int = 0
+
+    def __init__(self):
+        self.__analyses = 0
+        self.__seconds = 0.0
+        self.__phases = {}
+        self.__calls = {}
+        self.__iterations = 0
+        self.__comparisons = 0
+
+    def getAnalyses(self) -> int:
+        return self.__analyses
+
+    def getSeconds(self) -> float:
+        return self.__seconds
+
+    def getPhases(self) -> Dict:
+        return self.__phases
+
+    def getCalls(self) -> Dict:
+        return self.__calls
+
+    def getIterations(self) -> int:
+        return self.__iterations
+
+    def getComparisons(self) -> int:
+        return self.__comparisons
+
+    def addAnalysis(self, seconds: float) -> None:
+        self.__analyses += 1
+        self.__seconds += seconds
+
+    def addPhase(self, name: str, seconds: float, calls: int = 1) -> None:
+        self.__phases[name] = self.__phases.get(name, 0.0) + seconds
+        self.__calls[name] = self.__calls.get(name, 0) + calls
+
+    def addIterations(self, count: int) -> None:
+        self.__iterations += count
+
+    def addComparisons(self, count: int) -> None:
+        self.__comparisons += count
+
+    def merge(self, stats) -> None:
+        self.__analyses += stats.getAnalyses()
+        self.__seconds += stats.getSeconds()
+        for name, seconds in stats.getPhases().items():
+            self.addPhase(name, seconds, stats.getCalls()[name])
+        self.__iterations += stats.getIterations()
+        self.__comparisons += stats.getComparisons()
+
+    def __str__(self):
+        phases = ", ".join([name+"=%.3fms" % (seconds*1000) for name, seconds in self.__phases.items()])
+        return "AnalysisStats[analyses="+str(self.__analyses)+" total=%.3fms " % (self.__seconds*1000)+phases+" iterations="+str(self.__iterations)+" comparisons="+str(self.__comparisons)+"]"
+
+
+# stallReporter(): a profile callback which prints the stats of each analysis longer than limit seconds.
+def stallReporter(limit: float = FRAME, out=None) -> Callable:
+    def report(analyzer, stats: AnalysisStats) -> None:
+        if stats.getSeconds() > limit:
+            print("stall:", stats, file=out)
+    return report
+
 
 class LogicAnalyzer:
     __entries:List[Entry] = []
     __wires:List[Wire] = []
     __checkers:List[Checker] = []
+    __nets: NetBuilder = None
+    __drivers = None        # net -> entry that drives it
+    __violations: List[Violation] = None    # design rule violations found by the last simulation
+    __version: int = 0          # changes whenever the lists of the analyzer are replaced
+    __source = None             # CircuitNetlist the lists came from, if any (see setSource())
+    __inputs: List[Entry] = None    # free entries of the lists, found by the first stamp()
+    __subcircuits: List = None      # subcircuits whose outputs are at the entries
+    __stamp: tuple = None       # stamp() of the last analysis
+    __result: bool = None
+    __hits: int = 0
+    __misses: int = 0
+    __tracer = None         # VcdWriter of the running trace (see vcd.py)
+    __traced: List = None   # component read for each traced net
+    __stats: AnalysisStats = None   # sum of the profiled analyses, None while not profiling
+    __profiler: Callable = None     # called with (analyzer, stats) after each profiled analysis
+    __current: AnalysisStats = None # stats of the profiled analysis running
     
     def __init__(self, entries:List[Entry], wires:List[Wire],checkers:List[Checker]) -> None:
+        # each analyzer has its own lists: the class ones are never changed
+        self.__entries = []
+        self.__wires = []
+        self.__checkers = []
+        self.__nets = None
+        self.__drivers = None
+        self.__violations = None
+        self.__version = 0
+        self.__source = None
         self.setEntries(entries)
         self.setWires(wires)
         self.setCheckers(checkers)
+        self.__stamp = None
+        self.__result = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__tracer = None
+        self.__traced = None
+        self.__stats = None
+        self.__profiler = None
+        self.__current = None
 
 
     def setEntries(self, entries:List[Entry]) -> bool:
         try:
             for i in entries:
-                if isEntry(i):
-                    self.__entries.append(i)
-                else:
+                if not isEntry(i):
                     raise AttributeError("Error! Entry attribute expected. Entries not defined. You tried to assign an", type(i))
         except AttributeError as ae:
             print(ae)
             self.__entries = []
             return False
         else:
+            self.__entries = list(entries)
+            self.__changed()
             return True
 
     def setWires(self, wires:List[Wire]) -> bool:
         try:
             for i in wires:
-                if isinstance(i, List):
-                    self.__wires.append(i)
-                else:
+                if not isinstance(i, List):
                     raise AttributeError("Error! List attribute expected. List not defined. You tried to assign an", type(i))
         except AttributeError as ae:
             print(ae)
             self.__wires = []
             return False
         else:
+            self.__wires = list(wires)
+            self.__changed()
             return True
 
     def setCheckers(self, checkers:List[Checker]) -> bool:
         try:
             for i in checkers:
-                if isChecker(i):
-                    self.__checkers.append(i)
-                else:
+                if not isChecker(i):
                     raise AttributeError("Error! Checker attribute expected. Checkers not defined. You tried to assign an", type(i))
         except AttributeError as ae:
             print(ae)
             self.__checkers = []
             return False
         else:
+            self.__checkers = list(checkers)
+            self.__changed()
             return True
 
 
+    def __changed(self) -> None:
+        self.__version += 1
+        self.__inputs = None
+        self.__subcircuits = None
+
+    # setSource(): the CircuitNetlist the lists came from. Its version goes to the stamp, so moving or
+    #             rotating a component of the circuit makes the next analysis simulate it again.
+    def setSource(self, netlist) -> None:
+        self.__source = netlist
+
+    def getSource(self):
+        return self.__source
+
     def getEntries(self) -> List[Entry]:
         return self.__entries
     
@@ -78,56 +204,70 @@ class LogicAnalyzer:
     def getCheckers(self) -> List[Checker]:
         return self.__checkers
 
+    # gives each entry and checker the number of its net. The wires and the tech coords are not changed.
     def __netList(self):
-        for wire in self.getWires():
-            for wire2 in self.getWires():
-                if(wire != wire2):
-                    if(wire[1].equals(wire2[0])):
-                        wire2[0] = wire[0]
-                    if(wire[1].equals(wire2[1])):
-                        wire2[1] = wire2[0]
-                        wire2[0] = wire[0]
-
-            for entry in self.getEntries():
-                if(wire[1].equals(entry.getTechCoords())):
-                    entry.setTechCoords(wire[0])
-            for check in self.getCheckers():
-                if(wire[1].equals(check.getTechCoords())):
-                    check.setTechCoords(wire[0])
+        self.__nets = NetBuilder(self.getWires(), self.getEntries() + self.getCheckers())
+        self.countComparisons(self.__nets)
+        self.__drivers = {}
+        for i in self.getEntries():
+            net = self.__nets.getNet(i)
+            if net not in self.__drivers:
+                self.__drivers[net] = i
 
 
+    # the design rule check (see drc.py) of the nets just built: entries connected to each other stop
+    #  the analysis; the warnings stay at getViolations().
     def __validateLists(self):
-        for i in self.__entries:
-            for k in self.__entries:
-                if i!= k and i.getTechCoords().equals(k.getTechCoords()):
-                            raise RuntimeError("Error! Entries connected. "+str(i)+ " with " + str(k)+".")
-    
+        self.__violations = checkNets(self.__nets, self.getEntries(), self.getCheckers())
+        for i in errors(self.__violations):
+            raise RuntimeError("Error! Entries connected. "+str(i.getPins()[0])+ " with " + str(i.getPins()[1])+".")
+        return True
+
+    # a gate fed back by its own output never gets all its checkers checked and __defineValues
+    # would loop forever: every feedback loop is reported before it runs.
+    def __validateLoops(self) -> bool:
+        fanin = {}
+        for check in self.__checkers:
+            if check.isGateIn():
+                gate = check.getGate()
+                if gate not in fanin:
+                    fanin[gate] = []
+                i = self.__drivers.get(self.__nets.getNet(check))
+                if i is not None and i.isGateOut():
+                    if i.getGate() not in fanin:
+                        fanin[i.getGate()] = []
+                    if i.getGate() not in fanin[gate]:
+                        fanin[gate].append(i.getGate())
+        checkLoops(list(fanin.keys()), fanin)
         return True
 
     def __defineValues(self) -> bool:
         t = {}
         thereUnchecked = True
+        iterations = 0
 
         while thereUnchecked:
+            iterations += 1
             thereUnchecked=False
             for check in self.getCheckers():
                 thereUnchecked = True if (not check.getChecked()) else thereUnchecked
                 if not check.getChecked():
                     isConnected = False
-                    for i in self.getEntries():
-                        if i.getTechCoords().equals(check.getTechCoords()):
-                            isConnected = True
-                            if(i.getGate()!= None):
-                                gate = i.getGate()
-                                checked = True
-                                for j in gate.getChecks():
-                                    checked = checked and j.getChecked()
-                                if checked:    # caso 3
-                                    check.setValue(gate.gateOut().getValue())
-                                    check.setChecked(True)
-                            else:   # casos 1 e 2
+                    i = self.__drivers.get(self.__nets.getNet(check))
+                    if i is not None:
+                        isConnected = True
+                        if(i.getGate()!= None):
+                            gate = i.getGate()
+                            checked = True
+                            for j in gate.getChecks():
+                                checked = checked and j.getChecked()
+                            if checked:    # caso 3
+                                gate.evaluate()
                                 check.setValue(i.getValue())
                                 check.setChecked(True)
+                        else:   # casos 1 e 2
+                            check.setValue(i.getValue())
+                            check.setChecked(True)
                     if not isConnected:
                         check.setValue(None)
                         check.setChecked(True)
@@ -136,6 +276,8 @@ class LogicAnalyzer:
         # observe que se uma porta é conectada a outra, mas o check que aponta para ela aparecer primeiro, 
         # essa sequencia saltará a verificação dessa, devido a falta de informações, e percorrerá quantas vezes forem
         # necessárias para completar a verificação
+        if self.__current is not None:
+            self.__current.addIterations(iterations)
         return True
 
     def __prepareCheckers(self) -> None:
@@ -144,11 +286,215 @@ class LogicAnalyzer:
             i.setValue(None)
 
 
-    def analyze(self) -> bool:
+    # release(): called when the simulation stops, so the analyzer drops whatever it attached to the
+    #           circuit and the lists and nets it holds. The analyzer is not used after that.
+    def release(self) -> None:
+        self.stopTrace()
+        self.stopProfile()
+        self.__entries = []
+        self.__wires = []
+        self.__checkers = []
+        self.__nets = None
+        self.__drivers = None
+        self.__violations = None
+        self.__source = None
+        self.__inputs = None
+        self.__subcircuits = None
+        self.__stamp = None
+        self.__result = None
+
+    # trace(): writes the value of every net to a VCD file (see vcd.py) after each analysis that
+    #         simulated the circuit, one step per analysis, until stopTrace() or release().
+    def trace(self, path, timescale: str = None):
+        import vcd
+        self.stopTrace()
+        signals = netSignals(self.getEntries(), self.getWires(), self.getCheckers())
+        self.__traced = [component for name, component in signals]
+        self.__tracer = vcd.VcdWriter(path, [name for name, component in signals], timescale if timescale is not None else vcd.TIMESCALE)
+        return self.__tracer
+
+    def stopTrace(self) -> None:
+        if self.__tracer is not None:
+            self.__tracer.close()
+        self.__tracer = None
+        self.__traced = None
+
+    # drc(): the design rule violations of the circuit (see drc.py): many drivers at a net, floating
+    #       gate inputs, unloaded gate outputs and checkers tied to nothing.
+    def drc(self) -> List[Violation]:
+        return checkDesign(self.getEntries(), self.getWires(), self.getCheckers())
+
+    # getViolations(): the violations found by the last simulation of LogicAnalyzer itself.
+    def getViolations(self) -> List[Violation]:
+        return self.__violations
+
+    # getNetlist(): the circuit as a CompactNetlist, free of the components (see circuit.py).
+    def getNetlist(self) -> CompactNetlist:
+        return compactNetlist(self.getEntries(), self.getWires(), self.getCheckers())
+
+    # saveNetlist(): writes the net list as JSON, the file read by simulate.py (no OpenGL needed there).
+    def saveNetlist(self, path: str) -> None:
+        saveNetlist(self.getNetlist(), path)
+
+    # truthTable(): evaluates the checkers for every combination of the chosen entries at once (see
+    #              bitparallel.py). The other entries keep their current values. With no entries given,
+    #              every free entry is chosen.
+    def truthTable(self, entries: List[Entry] = None, width: int = bitparallel.WIDTH) -> bitparallel.TruthTable:
+        inputs = freeEntries(self.getEntries())
+        if entries is None:
+            entries = inputs
+        chosen = []
+        for i in entries:
+            if i not in inputs:
+                raise RuntimeError("Error! The entry is not a circuit input. "+str(i)+".")
+            chosen.append(inputs.index(i))
+        return bitparallel.truthTable(self.getNetlist(), chosen, [i.getValue() for i in inputs], width)
+
+    # evaluateBatch(): evaluates the checkers for each row of a (N, free entries) boolean matrix and
+    #                 returns the (N, checkers) matrix (see vectorbatch.py, it needs NumPy). The columns
+    #                 follow the order of the entries and checkers given to the analyzer.
+    def evaluateBatch(self, vectors, chunk: int = None, known: bool = False):
+        import vectorbatch
+        if chunk is None:
+            chunk = vectorbatch.CHUNK
+        return vectorbatch.evaluateBatch(self.getNetlist(), vectors, chunk, known)
+
+    # shardRunner(): a ShardRunner over the net list of this circuit (see shardrunner.py), to split
+    #               the truth table or a batch of vectors among worker processes.
+    def shardRunner(self, workers: int = None, shard: int = None):
+        import shardrunner
+        return shardrunner.ShardRunner(self.getNetlist(), workers, shard if shard is not None else shardrunner.SHARD)
+
+    # optimize(): the net list after the optimization passes (see optimizer.py) and the report of the
+    #            gates each pass removed. The components of the circuit are not changed.
+    def optimize(self) -> tuple:
+        import optimizer
+        return optimizer.optimize(self.getNetlist())
+
+    # compile(): the optimized circuit as a generated Python function (see compiler.py), which
+    #           receives the values of the free entries and returns the values of the checkers, in the
+    #           order given to the analyzer. The function is cached per circuit structure.
+    def compile(self):
+        import compiler
+        return compiler.compileNetlist(self.optimize()[0])
+
+    # faultSimulation(): the stuck-at faults at the gate pins detected by the vectors (rows with the
+    #                   values of the free entries), simulated one fault per bit lane (see faultsim.py).
+    def faultSimulation(self, vectors: List[List[bool]], drop: bool = True):
+        import faultsim
+        return faultsim.simulateFaults(self.getNetlist(), vectors, drop=drop)
+
+    # bdd(): the reduced ordered BDD of each checker over the free entries (see bdd.py), for
+    #       satisfiability, equivalence and counting queries without enumerating the vectors.
+    def bdd(self, order: List[int] = None):
+        import bdd
+        return bdd.CircuitBdd(self.getNetlist(), order)
+
+    # getHits(), getMisses(): analyses answered by the cache and analyses that simulated the circuit.
+    def getHits(self) -> int:
+        return self.__hits
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    # structure(): changes with the lists of the analyzer, the version of its source and the source
+    #             circuits of the subcircuits: whatever changes the nets and gates of the circuit.
+    #             Editing another tab only changes it for the analyzers using that tab as a subcircuit.
+    def structure(self) -> tuple:
+        if self.__inputs is None:
+            self.__inputs = freeEntries(self.__entries)
+            self.__subcircuits = list(dict.fromkeys([i.getGate() for i in self.__entries if isinstance(i.getGate(), Subcircuit)]))
+        return (self.__version, None if self.__source is None else self.__source.getVersion(),
+                tuple([i.getStamp() for i in self.__subcircuits]))
+
+    # stamp(): what the values of an analysis depend on: the structure and the free entry values.
+    def stamp(self) -> tuple:
+        structure = self.structure()
+        return structure + (tuple([i.getValue() for i in self.__inputs]),)
+
+    # invalidate(): the next analysis simulates the circuit even if the stamp did not change.
+    def invalidate(self) -> None:
+        self.__stamp = None
+
+    # profile(): from now on each analysis that simulates the circuit is profiled: the time of each
+    #           phase, the passes of the fixed-point loop and the comparisons of points go to
+    #           getStats(), and callback (if given) receives (analyzer, stats of the analysis).
+    #           Without profiling the phases are called directly, with no timer.
+    def profile(self, callback: Callable = None) -> AnalysisStats:
+        self.__stats = AnalysisStats()
+        self.__profiler = callback
+        return self.__stats
+
+    def stopProfile(self) -> AnalysisStats:
+        stats = self.__stats
+        self.__stats = None
+        self.__profiler = None
+        return stats
+
+    def getStats(self) -> AnalysisStats:
+        return self.__stats
+
+    # isProfiling(): True during a profiled analysis, when the phases should be run by measure().
+    def isProfiling(self) -> bool:
+        return self.__current is not None
+
+    # measure(): runs a phase of the profiled analysis and adds its time to the stats.
+    def measure(self, name: str, function: Callable, *args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.__current.addPhase(name, time.perf_counter() - start)
+
+    # countComparisons(): adds the comparisons of points made by the net builder of the analysis to
+    #                    the profiled analysis. The analyzers call it where they join the nets.
+    def countComparisons(self, nets: NetBuilder) -> None:
+        if self.__current is not None:
+            self.__current.addComparisons(nets.getComparisons())
+
+    # __profiled(): simulate() with the phases, the passes and the comparisons going to a new AnalysisStats.
+    def __profiled(self) -> bool:
+        stats = AnalysisStats()
+        self.__current = stats
+        start = time.perf_counter()
+        try:
+            return self.simulate()
+        finally:
+            stats.addAnalysis(time.perf_counter() - start)
+            self.__current = None
+            self.__stats.merge(stats)
+            if self.__profiler is not None:
+                self.__profiler(self, stats)
+
+    # simulate(): evaluates the circuit, setting the value of every checker.
+    def simulate(self) -> bool:
+        if self.isProfiling():
+            self.measure("netList", self.__netList)
+            if self.measure("validateLists", self.__validateLists) is False:
+                return None
+            self.measure("validateLoops", self.__validateLoops)
+            self.measure("prepareCheckers", self.__prepareCheckers)
+            return self.measure("defineValues", self.__defineValues)
+        self.__netList()
         if self.__validateLists() is False:
             return None
-        self.__netList()            
+        self.__validateLoops()
         self.__prepareCheckers()
         return self.__defineValues()
 
+    # analyze(): simulates the circuit only if it changed since the last analysis; otherwise the
+    #           checkers still hold their values and the last result is returned.
+    def analyze(self) -> bool:
+        stamp = self.stamp()
+        if stamp == self.__stamp:
+            self.__hits += 1
+            return self.__result
+        self.__misses += 1
+        self.__stamp = None
+        self.__result = self.simulate() if self.__stats is None else self.__profiled()
+        self.__stamp = stamp
+        if self.__tracer is not None:
+            self.__tracer.sample([i.getValue() for i in self.__traced])
+        return self.__result
+
 
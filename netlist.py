@@ -0,0 +1,427 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo monta a lista de redes (nets) do circuito: os pontos ligados por
+*                     fios são unidos (union-find) e cada pino recebe o número da sua rede.
+*              en-us/ this file builds the net list of the circuit: the points joined by wires are
+*                     merged (union-find) and each pin receives the number of its net.
+*
+"""
+
+from typing import Dict, List
+from components import *
+from spatialindex import ConnectivityIndex
+from circuit import *
+
+# kind of each gate class at the compact net list
+KINDS = {NotGate: GATE_NOT, AndGate: GATE_AND, NandGate: GATE_NAND, OrGate: GATE_OR,
+         NorGate: GATE_NOR, XorGate: GATE_XOR, XnorGate: GATE_XNOR}
+
+
+# DisjointSet: union-find over the integers 0..n-1, with path halving and union by size.
+class DisjointSet:
+    __parent: List[int] = None
+    __size: List[int] = None
+
+    def __init__(self):
+        self.__parent = []
+        self.__size = []
+
+    def make(self) -> int:
+        self.__parent.append(len(self.__parent))
+        self.__size.append(1)
+        return len(self.__parent) - 1
+
+    def find(self, i: int) -> int:
+        parent = self.__parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> int:
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return a
+        if self.__size[a] < self.__size[b]:
+            a, b = b, a
+        self.__parent[b] = a
+        self.__size[a] += self.__size[b]
+        return a
+
+    def __len__(self) -> int:
+        return len(self.__parent)
+
+
+# NetBuilder: receives the wires (pairs of start and end Coords) and the pins (Entry and Checker,
+#            placed at their tech coords) and gives each pin the canonical number of its net.
+#            Nothing received is changed: the wires lists and the pins tech coords stay as they are.
+class NetBuilder:
+    __points: ConnectivityIndex = None  # Coords -> point number
+    __sets: DisjointSet = None
+    __pins: Dict = None                 # pin -> point number
+    __nets: Dict = None                 # point root -> net number, after build()
+    __count: int = 0
+
+    def __init__(self, wires: List = None, pins: List = None):
+        self.__points = ConnectivityIndex()
+        self.__sets = DisjointSet()
+        self.__pins = {}
+        self.__nets = None
+        self.__count = 0
+        if wires is not None:
+            self.addWires(wires)
+        if pins is not None:
+            self.addPins(pins)
+
+    def __point(self, coords) -> int:
+        point = self.__points.first(coords)
+        if point is None:
+            point = self.__sets.make()
+            self.__points.add(coords, point)
+        return point
+
+    def addWire(self, start, end) -> None:
+        self.__sets.union(self.__point(start), self.__point(end))
+        self.__nets = None
+
+    def addWires(self, wires: List) -> None:
+        for wire in wires:
+            self.addWire(wire[0], wire[-1])
+
+    def addPin(self, pin) -> None:
+        self.__pins[pin] = self.__point(pin.getTechCoords())
+        self.__nets = None
+
+    def addPins(self, pins: List) -> None:
+        for pin in pins:
+            self.addPin(pin)
+
+    # build(): numbers the nets 0..n-1 in the order their first point was added.
+    def build(self) -> None:
+        self.__nets = {}
+        for point in range(len(self.__sets)):
+            root = self.__sets.find(point)
+            if root not in self.__nets:
+                self.__nets[root] = len(self.__nets)
+        self.__count = len(self.__nets)
+
+    def getNet(self, pin) -> int:
+        if self.__nets is None:
+            self.build()
+        return self.__nets[self.__sets.find(self.__pins[pin])]
+
+    def getNetAt(self, coords) -> int:
+        if self.__nets is None:
+            self.build()
+        point = self.__points.first(coords)
+        return None if point is None else self.__nets[self.__sets.find(point)]
+
+    def getNetCount(self) -> int:
+        if self.__nets is None:
+            self.build()
+        return self.__count
+
+    def getPins(self) -> List:
+        return list(self.__pins.keys())
+
+    # getComparisons(): the comparisons of points made to join the wires and pins (see ConnectivityIndex).
+    def getComparisons(self) -> int:
+        return self.__points.getComparisons()
+
+
+# gateKind(): the kind of the gate at the compact net list.
+def gateKind(gate) -> str:
+    for cls in type(gate).__mro__:
+        if cls in KINDS:
+            return KINDS[cls]
+    raise RuntimeError("Error! Gate not supported by the net list. "+str(gate))
+
+
+# freeEntries(): the entries which are not gate outputs, without repetitions, in the given order.
+#               These are the inputs of the compact net list.
+def freeEntries(entries: List[Entry]) -> List[Entry]:
+    seen = set()
+    ret = []
+    for i in entries:
+        if not i.isGateOut() and i not in seen:
+            seen.add(i)
+            ret.append(i)
+    return ret
+
+
+# uniqueCheckers(): the checkers without repetitions, in the given order. These are the outputs
+#                  of the compact net list.
+def uniqueCheckers(checkers: List[Checker]) -> List[Checker]:
+    seen = set()
+    ret = []
+    for i in checkers:
+        if i not in seen:
+            seen.add(i)
+            ret.append(i)
+    return ret
+
+
+# signalName(): the name of the net an entry drives: the entry itself, or the gate of a gate output
+#              (followed by the output number when the gate has many, as a Subcircuit).
+def signalName(entry: Entry) -> str:
+    if not entry.isGateOut():
+        return entry.getName()
+    outs = entry.getGate().getOuts()
+    if len(outs) == 1:
+        return entry.getGate().getName()
+    return entry.getGate().getName() + "." + str(outs.index(entry))
+
+
+# netSignals(): one (name, component) per net of the circuit. The component is the entry that drives
+#              the net (the first one, as at the analyzer) or, for an undriven net, its first checker.
+def netSignals(entries: List[Entry], wires: List, checkers: List[Checker]) -> List[tuple]:
+    nets = NetBuilder(wires, entries + checkers)
+    signals = {}
+    for i in entries:
+        net = nets.getNet(i)
+        if net not in signals:
+            signals[net] = (signalName(i), i)
+    for i in checkers:
+        net = nets.getNet(i)
+        if net not in signals:
+            signals[net] = (i.getName(), i)
+    return list(signals.values())
+
+
+# checkLoops(): raises RuntimeError naming the gates of every feedback loop (see feedbackLoops()).
+def checkLoops(gates: List, fanin: Dict) -> None:
+    loops = feedbackLoops(gates, fanin)
+    if len(loops) == 1:
+        raise RuntimeError("Error! Combinational loop at " + ", ".join([gate.getName() for gate in loops[0]]) + ".")
+    if len(loops) > 1:
+        raise RuntimeError("Error! Combinational loops at " + "; ".join([", ".join([gate.getName() for gate in loop]) for loop in loops]) + ".")
+
+
+# compactNetlist(): resolves the nets of the circuit and returns it as a CompactNetlist, with the
+#                  gates in topological order. Raises RuntimeError if two entries drive the same
+#                  net or if the gates make a loop. The probes (entries of the list) are outputs too,
+#                  after the checkers.
+def compactNetlist(entries: List[Entry], wires: List, checkers: List[Checker], probes: List[Entry] = None) -> CompactNetlist:
+    inputs = freeEntries(entries)
+    outputs = uniqueCheckers(checkers)
+    probes = probes if probes is not None else []
+
+    gates = []
+    outs = {}
+    for i in entries:
+        if i.isGateOut() and i.getGate() not in outs:
+            outs[i.getGate()] = i.getGate().getOuts()
+            gates.append(i.getGate())
+    for i in outputs:
+        if i.isGateIn() and i.getGate() not in outs:
+            outs[i.getGate()] = i.getGate().getOuts()
+            gates.append(i.getGate())
+
+    for gate in gates:
+        gate.getChecks()    # updates the tech coords of the gate pins
+    nets = NetBuilder(wires, inputs + outputs)
+    for gate in gates:
+        nets.addPins(gate.getChecks())
+        nets.addPins(outs[gate])
+
+    drivers = {}
+    for i in inputs + [i for gate in gates for i in outs[gate]]:
+        driver = drivers.get(nets.getNet(i))
+        if driver is not None and driver != i:
+            raise RuntimeError("Error! Entries connected. "+str(driver)+ " with " + str(i)+".")
+        drivers[nets.getNet(i)] = i
+
+    fanin = {}
+    for gate in gates:
+        fanin[gate] = []
+        for check in gate.getChecks():
+            source = drivers.get(nets.getNet(check))
+            if source is not None and source.isGateOut() and source.getGate() not in fanin[gate]:
+                fanin[gate].append(source.getGate())
+    checkLoops(gates, fanin)
+    levels, loop = levelize(gates, fanin)
+
+    compact = []
+    count = nets.getNetCount()
+    for level in levels:
+        for gate in level:
+            if isinstance(gate, Subcircuit):
+                count = inline(compact, gate.getNetlist(), [nets.getNet(i) for i in gate.getChecks()], [nets.getNet(i) for i in outs[gate]], count, gate.getName())
+            else:
+                compact.append((gateKind(gate), tuple([nets.getNet(i) for i in gate.getChecks()]), nets.getNet(outs[gate][0]), gate.getName()))
+
+    return CompactNetlist(count, [nets.getNet(i) for i in inputs], compact, [nets.getNet(i) for i in outputs + probes],
+                          [i.getName() for i in inputs], [i.getName() for i in outputs + probes])
+
+
+# inline(): appends the gates of a subcircuit net list to compact, its inputs on the nets ins and its
+#          outputs on the nets outs. The other nets of the subcircuit get new numbers from count on
+#          and the gates are named after the subcircuit. Returns the next free net number.
+def inline(compact: List[tuple], netlist: CompactNetlist, ins: List[int], outs: List[int], count: int, prefix: str) -> int:
+    nets = dict(zip(netlist.getInputs(), ins))
+    driven = set([gate[2] for gate in netlist.getGates()])
+    buffers = []
+    for i, out, name in zip(netlist.getOutputs(), outs, netlist.getOutputNames()):
+        if i in driven and i not in nets:
+            nets[i] = out
+        else:
+            buffers.append((i, out, name))     # an input, an undriven net or a net given to another output
+
+    for kind, inputs, out, name in netlist.getGates():
+        for i in inputs + (out,):
+            if i not in nets:
+                nets[i] = count
+                count += 1
+        compact.append((kind, tuple([nets[i] for i in inputs]), nets[out], prefix+"."+name))
+    for i, out, name in buffers:
+        if i in nets:
+            compact.append((GATE_BUF, (nets[i],), out, prefix+"."+name))
+    return count
+
+
+# CircuitNetlist: the pins and wires of the circuit being edited. The editor keeps it up to date as
+#                components are added, deleted or moved and wires are drawn, so a simulation starts
+#                from these lists instead of scanning every element again.
+class CircuitNetlist:
+    __components: Dict = None   # component -> (its entries, its checkers), None until its pins are read
+    __pending: List = None      # components added whose pins were not read yet (see __resolve)
+    __entries: Dict = None      # entries of every component, in the order they were added
+    __checkers: Dict = None     # checkers of every component, in the order they were added
+    __inputs: Dict = None       # the Entry elements placed by the user
+    __subcircuits: Dict = None  # the Subcircuit elements (see Subcircuit.getStamp)
+    __wires: List = None        # dots of each wire (only the ends matter to the simulation)
+    __version: int = 0          # changes at every edit (see Subcircuit)
+
+    def __init__(self):
+        self.__components = {}
+        self.__pending = []
+        self.__entries = {}
+        self.__checkers = {}
+        self.__inputs = {}
+        self.__subcircuits = {}
+        self.__wires = []
+        self.__version = 0
+
+    # pins(): the entries and checkers of a component, with their tech coords updated.
+    def pins(self, component) -> tuple:
+        if isinstance(component, Gate):
+            return list(component.getOuts()), list(component.getChecks())
+        if isinstance(component, KeyBoard):
+            return list(component.getEntries()), []
+        if isinstance(component, Checker):
+            return [], [component]
+        if isinstance(component, Entry):
+            return [component], []
+        if isinstance(component, Display):
+            return [], list(component.getChecks())
+        if isinstance(component, Subcircuit):
+            return list(component.getOuts()), list(component.getChecks())
+        return [], []
+
+    def addComponent(self, component) -> None:
+        self.addComponents([component])
+
+    # addComponents(): adds the components in one pass (a whole tab, when a project is opened). Their
+    #                 pins are only read when the entries or checkers are asked for, so the gates of an
+    #                 opened project do not build their pins before a simulation needs them.
+    def addComponents(self, components: List) -> None:
+        added = 0
+        for component in components:
+            if component in self.__components:
+                continue
+            self.__components[component] = None
+            self.__pending.append(component)
+            if isinstance(component, Entry):
+                self.__inputs[component] = True
+            elif isinstance(component, Subcircuit):
+                self.__subcircuits[component] = True
+            added += 1
+        if added > 0:
+            self.__version += 1
+
+    # __resolve(): reads the pins of the components added since the last call, in the order they were added.
+    def __resolve(self) -> None:
+        for component in self.__pending:
+            if component in self.__components and self.__components[component] is None:
+                entries, checkers = self.pins(component)
+                self.__components[component] = (entries, checkers)
+                for i in entries:
+                    self.__entries[i] = True
+                for i in checkers:
+                    self.__checkers[i] = True
+        self.__pending = []
+
+    def removeComponent(self, component) -> None:
+        if component not in self.__components:
+            return
+        pins = self.__components.pop(component)
+        if pins is not None:
+            for i in pins[0]:
+                self.__entries.pop(i, None)
+            for i in pins[1]:
+                self.__checkers.pop(i, None)
+        self.__inputs.pop(component, None)
+        self.__subcircuits.pop(component, None)
+        self.__version += 1
+
+    # moveComponent(): updates the tech coords of the component pins after a translation or rotation.
+    def moveComponent(self, component) -> None:
+        if component in self.__components:
+            if self.__components[component] is not None:
+                self.pins(component)
+            self.__version += 1
+
+    # refresh(): updates the tech coords of every pin, after the whole design was translated. The
+    #           components whose pins were not read yet get them updated when they are.
+    def refresh(self) -> None:
+        for component, pins in self.__components.items():
+            if pins is not None:
+                self.pins(component)
+
+    def addWire(self, dots: List) -> None:
+        self.__wires.append(dots)
+        self.__version += 1
+
+    def addWires(self, wires: List) -> None:
+        if len(wires) > 0:
+            self.__wires.extend(wires)
+            self.__version += 1
+
+    def removeWire(self, dots: List) -> None:
+        for i in range(len(self.__wires)):
+            if self.__wires[i] is dots:
+                del self.__wires[i]
+                self.__version += 1
+                return
+
+    def getComponents(self) -> List:
+        return list(self.__components.keys())
+
+    def getEntries(self) -> List[Entry]:
+        self.__resolve()
+        return list(self.__entries.keys())
+
+    def getCheckers(self) -> List[Checker]:
+        self.__resolve()
+        return list(self.__checkers.keys())
+
+    def getInputs(self) -> List[Entry]:
+        return list(self.__inputs.keys())
+
+    def getSubcircuits(self) -> List:
+        return list(self.__subcircuits.keys())
+
+    def getWires(self) -> List:
+        return self.__wires
+
+    def getVersion(self) -> int:
+        return self.__version
+
+    def __len__(self) -> int:
+        return len(self.__components)
@@ -0,0 +1,161 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa os passos de otimização da lista de redes simulada:
+*                     propagação de constantes, remoção de dupla inversão, fusão de portas
+*                     duplicadas e eliminação de portas mortas. Os elementos da janela não mudam.
+*              en-us/ this file implements the optimization passes of the simulated net list:
+*                     constant propagation, double inversion removal, duplicate gate merging and
+*                     dead gate elimination. The elements of the window do not change.
+*
+"""
+
+from typing import Dict, List
+from circuit import *
+
+# gate kind with the output inverted
+COMPLEMENT = {GATE_AND: GATE_NAND, GATE_NAND: GATE_AND, GATE_OR: GATE_NOR, GATE_NOR: GATE_OR,
+              GATE_XOR: GATE_XNOR, GATE_XNOR: GATE_XOR, GATE_NOT: GATE_BUF, GATE_BUF: GATE_NOT}
+
+
+def resolve(alias: Dict, net: int) -> int:
+    while net in alias:
+        net = alias[net]
+    return net
+
+
+# rebuild(): the net list with the given gates, every net replaced by its alias. A removed gate
+#           either aliases its output to an earlier net or leaves it undriven (unknown), so the
+#           gates stay in topological order.
+def rebuild(netlist: CompactNetlist, gates: List[tuple], alias: Dict) -> CompactNetlist:
+    compact = [(kind, tuple([resolve(alias, i) for i in ins]), out, name) for kind, ins, out, name in gates]
+    return CompactNetlist(netlist.getNetCount(), netlist.getInputs(), compact, [resolve(alias, i) for i in netlist.getOutputs()],
+                          netlist.getInputNames(), netlist.getOutputNames())
+
+
+# propagateConstants(): the only constant of the simulation is the unknown value of the undriven
+#                      nets. XOR, XNOR, NOT and buffers with an unknown input, and AND, NAND, OR and
+#                      NOR with every input unknown, are unknown: the gate goes away and its output
+#                      is left undriven. Repeated inputs of AND, NAND, OR and NOR are dropped, so a
+#                      gate with both inputs on the same net becomes a buffer (removed) or a NOT.
+def propagateConstants(netlist: CompactNetlist) -> CompactNetlist:
+    driven = set(netlist.getInputs())
+    alias = {}
+    gates = []
+    for kind, ins, out, name in netlist.getGates():
+        ins = tuple([resolve(alias, i) for i in ins])
+        known = [i in driven for i in ins]
+        if kind in (GATE_XOR, GATE_XNOR, GATE_NOT, GATE_BUF) and not all(known):
+            continue
+        if kind in (GATE_AND, GATE_NAND, GATE_OR, GATE_NOR):
+            if not any(known):
+                continue
+            ins = tuple(dict.fromkeys(ins))
+            if len(ins) == 1:
+                kind = GATE_BUF if kind in (GATE_AND, GATE_OR) else GATE_NOT
+        if kind == GATE_BUF:
+            alias[out] = ins[0]
+            continue
+        gates.append((kind, ins, out, name))
+        driven.add(out)
+    return rebuild(netlist, gates, alias)
+
+
+# removeInversions(): a NOT fed by a NOT (or a buffer) takes the net before the first one, and a NOT
+#                    fed by any other gate becomes the complement of that gate, which is left to
+#                    removeDeadGates() if nothing else reads it.
+def removeInversions(netlist: CompactNetlist) -> CompactNetlist:
+    drivers = {}
+    alias = {}
+    gates = []
+    for kind, ins, out, name in netlist.getGates():
+        ins = tuple([resolve(alias, i) for i in ins])
+        if kind == GATE_NOT and ins[0] in drivers:
+            kind, ins = COMPLEMENT[drivers[ins[0]][0]], drivers[ins[0]][1]
+        if kind == GATE_BUF:
+            alias[out] = ins[0]
+            continue
+        gates.append((kind, ins, out, name))
+        drivers[out] = (kind, ins)
+    return rebuild(netlist, gates, alias)
+
+
+# mergeDuplicates(): gates of the same kind reading the same nets (in any order) are one gate.
+def mergeDuplicates(netlist: CompactNetlist) -> CompactNetlist:
+    seen = {}
+    alias = {}
+    gates = []
+    for kind, ins, out, name in netlist.getGates():
+        ins = tuple([resolve(alias, i) for i in ins])
+        key = (kind, tuple(sorted(ins)))
+        if key in seen:
+            alias[out] = seen[key]
+            continue
+        seen[key] = out
+        gates.append((kind, ins, out, name))
+    return rebuild(netlist, gates, alias)
+
+
+# removeDeadGates(): gates that reach no output.
+def removeDeadGates(netlist: CompactNetlist) -> CompactNetlist:
+    live = set(netlist.getOutputs())
+    gates = []
+    for gate in reversed(netlist.getGates()):
+        if gate[2] in live:
+            live.update(gate[1])
+            gates.append(gate)
+    gates.reverse()
+    return rebuild(netlist, gates, {})
+
+
+PASSES = [("constant propagation", propagateConstants), ("double inversion", removeInversions),
+          ("duplicate gates", mergeDuplicates), ("dead gates", removeDeadGates)]
+
+
+# OptimizationReport: the number of gates before and after the pipeline and the gates removed by
+#                    each pass.
+class OptimizationReport:
+    __before: int = 0
+    __after: int = 0
+    __removed: Dict = None
+
+    def __init__(self, before: int, after: int, removed: Dict):
+        self.__before = before
+        self.__after = after
+        self.__removed = removed
+
+    def getBefore(self) -> int:
+        return self.__before
+
+    def getAfter(self) -> int:
+        return self.__after
+
+    def getRemoved(self) -> Dict:
+        return self.__removed
+
+    def __str__(self):
+        return "OptimizationReport[gates="+str(self.__before)+"->"+str(self.__after)+" "+", ".join([name+"="+str(count) for name, count in self.__removed.items()])+"]"
+
+
+# optimize(): runs the passes in order, again and again while one of them removes a gate. The
+#            optimized net list gives the same output values as the original one for every input
+#            value, the unknown value included.
+def optimize(netlist: CompactNetlist, passes: List[tuple] = None) -> tuple:
+    if passes is None:
+        passes = PASSES
+    removed = dict([(name, 0) for name, function in passes])
+    before = len(netlist.getGates())
+    changed = True
+    while changed:
+        changed = False
+        for name, function in passes:
+            count = len(netlist.getGates())
+            netlist = function(netlist)
+            if len(netlist.getGates()) < count:
+                removed[name] += count - len(netlist.getGates())
+                changed = True
+    return netlist, OptimizationReport(before, len(netlist.getGates()), removed)
@@ -0,0 +1,245 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo salva e abre os projetos (todas as abas): um formato binário
+*                     compacto, lido por mapeamento em memória (mmap), e uma variante JSON legível.
+*              en-us/ this file saves and opens the projects (every tab): a compact binary format,
+*                     read by memory mapping (mmap), and a readable JSON variant.
+*
+*   Binary layout (little endian):
+*       header      HEADER: magic, version, tabs, names, bytes of the name table
+*       name table  the names in UTF-8, each one ended by a zero byte
+*       each tab    TAB: components, wires, wire points
+*                   components x RECORD: type, orientation, value, x, y, name, source tab
+*                   wires x uint32: points of each wire
+*                   points x POINT: x, y
+"""
+
+import gc
+import json
+import mmap
+import struct
+from typing import Callable, Dict, List
+
+from components import *
+from netlist import CircuitNetlist
+
+MAGIC = b"DESP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+TAB = struct.Struct("<III")
+RECORD = struct.Struct("<BBBxddIi")
+POINT = struct.Struct("<dd")
+
+# type of each record; the index is stored
+TYPES = [Entry, Checker, Display, NotGate, AndGate, NandGate, OrGate, NorGate, XorGate, XnorGate, KeyBoard, Subcircuit]
+NAMES = dict([(cls.__name__, cls) for cls in TYPES])
+# types whose entries have their values saved (see values())
+VALUED = (Entry, KeyBoard)
+# class whose id numbers the default names of each type, and the prefix of those names
+COUNTERS = {Entry: (Entry, "E"), Checker: (Checker, "C"), Display: (Display, "D"), KeyBoard: (KeyBoard, "K"),
+            Subcircuit: (Subcircuit, "S")}
+COUNTERS.update([(cls, (Gate, "G")) for cls in TYPES if issubclass(cls, Gate)])
+
+# value of each entry of a record, 2 bits per entry (the 4 entries of a KeyBoard fit in one byte)
+VALUE_CODES = {False: 0, True: 1, None: 2}
+CODE_VALUES = [False, True, None]
+
+
+# values(): the entries whose values are saved with the component.
+def values(component) -> List[Entry]:
+    if isinstance(component, Entry):
+        return [component]
+    if isinstance(component, KeyBoard):
+        return component.getEntries()
+    return []
+
+
+# record(): the saved fields of a component: (type, orientation, value, x, y, name, source tab).
+def record(component, tabs: Dict) -> tuple:
+    if type(component) not in TYPES:
+        raise RuntimeError("Error! Component not supported by the project file. "+str(component)+".")
+    value = 0
+    entries = values(component)
+    for i in range(len(entries)):
+        value |= VALUE_CODES[entries[i].getValue()] << (2*i)
+    source = tabs.get(component.getSource(), -1) if isinstance(component, Subcircuit) else -1
+    if isinstance(component, Subcircuit) and source < 0:
+        raise RuntimeError("Error! The subcircuit source is not a tab of the project. "+str(component)+".")
+    return (TYPES.index(type(component)), component.getOrientation(), value,
+            component.getCoords().getX(), component.getCoords().getY(), component.getName(), source)
+
+
+# reserve(): advances the id which numbers the default names of the type (every gate shares Gate.id)
+#           past the number of a loaded default name, so the components created after opening a
+#           project do not repeat the names of the loaded ones.
+def reserve(cls, name: str) -> None:
+    counter, prefix = COUNTERS[cls]
+    if name.startswith(prefix) and name[len(prefix):].isdecimal():
+        counter.id = max(counter.id, int(name[len(prefix):]) + 1)
+
+
+# build(): the component of a record. A Subcircuit gets the net list of its source tab.
+def build(fields: tuple, netlists: List[CircuitNetlist]):
+    kind, orientation, value, x, y, name, source = fields
+    cls = TYPES[kind]
+    if cls is Subcircuit:
+        component = Subcircuit(netlists[source], Coords(x, y))
+    else:
+        component = cls(Coords(x, y))
+    component.setName(name)
+    reserve(cls, name)
+    for i in range(4):
+        if component.getOrientation() == orientation:
+            break
+        component.setRotation(True)
+    entries = values(component) if cls in VALUED else []
+    for i in range(len(entries)):
+        entries[i].setValue(CODE_VALUES[(value >> (2*i)) & 3])
+    return component
+
+
+# restore(): creates the components and wires of every tab and adds them to the net lists. The
+#           subcircuits come last: their pins are the free entries and checkers of the source tab.
+def restore(tabs: List[tuple], newNetlist: Callable) -> List[tuple]:
+    netlists = [newNetlist() for i in tabs]
+    ret = []
+    for (records, wires), netlist in zip(tabs, netlists):
+        elements = [None if TYPES[fields[0]] is Subcircuit else build(fields, netlists) for fields in records]
+        netlist.addComponents([i for i in elements if i is not None])
+        ret.append(elements)
+    for (records, wires), netlist, elements in zip(tabs, netlists, ret):
+        for i in range(len(records)):
+            if elements[i] is None:
+                if not 0 <= records[i][6] < len(tabs):
+                    raise RuntimeError("Error! The subcircuit source is not a tab of the project. "+records[i][5]+".")
+                elements[i] = build(records[i], netlists)
+        netlist.addComponents([elements[i] for i in range(len(records)) if TYPES[records[i][0]] is Subcircuit])
+        netlist.addWires(wires)
+    return [(elements, wires, netlist) for elements, (records, wires), netlist in zip(ret, tabs, netlists)]
+
+
+# saveProject(): tabs is a list of (elements, wires, net list), the wires being lists of points. A path
+#               ending with .json gets the JSON variant.
+def saveProject(path: str, tabs: List[tuple]) -> None:
+    if path.endswith(".json"):
+        saveProjectJson(path, tabs)
+        return
+    indexes = dict([(tabs[i][2], i) for i in range(len(tabs))])
+    names = {}
+    body = []
+    for elements, wires, netlist in tabs:
+        records = [record(i, indexes) for i in elements]
+        points = [point for dots in wires for point in dots]
+        body.append(TAB.pack(len(records), len(wires), len(points)))
+        for kind, orientation, value, x, y, name, source in records:
+            body.append(RECORD.pack(kind, orientation, value, x, y, names.setdefault(name, len(names)), source))
+        body.append(struct.pack("<%dI" % len(wires), *[len(dots) for dots in wires]))
+        body.append(b"".join([POINT.pack(point.getX(), point.getY()) for point in points]))
+    table = b"".join([name.encode("utf-8") + b"\0" for name in names])
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(tabs), len(names), len(table)))
+        f.write(table)
+        f.write(b"".join(body))
+
+
+# readProject(): the records and wires of each tab, read from the memory mapped file.
+def readProject(path: str) -> List[tuple]:
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(data) < HEADER.size:
+            raise ValueError("ValueError: project file expected. You entered: ", path)
+        magic, version, count, nameCount, tableSize = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("ValueError: project file expected. You entered: ", path)
+        offset = HEADER.size
+        names = data[offset:offset+tableSize].decode("utf-8").split("\0")[:nameCount]
+        offset += tableSize
+
+        tabs = []
+        view = memoryview(data)
+        try:
+            for t in range(count):
+                components, wireCount, pointCount = TAB.unpack_from(data, offset)
+                offset += TAB.size
+                size = components*RECORD.size
+                records = [(kind, orientation, value, x, y, names[name], source)
+                           for kind, orientation, value, x, y, name, source in RECORD.iter_unpack(view[offset:offset+size])]
+                offset += size
+                lengths = struct.unpack_from("<%dI" % wireCount, data, offset)
+                offset += 4*wireCount
+                size = pointCount*POINT.size
+                points = [GridPoint(int(x), int(y)) if x.is_integer() and y.is_integer() else GridPoint(x, y)
+                          for x, y in POINT.iter_unpack(view[offset:offset+size])]
+                offset += size
+                wires = []
+                start = 0
+                for length in lengths:
+                    wires.append(points[start:start+length])
+                    start += length
+                tabs.append((records, wires))
+        finally:
+            view.release()
+        return tabs
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise ValueError("ValueError: damaged project file. You entered: ", path)
+    finally:
+        data.close()
+
+
+# loadProject(): opens a project saved by saveProject(). newNetlist() is called once per tab and gives
+#               the net list which receives its components (the one of the tab window, at the editor).
+#               Returns a list of (elements, wires, net list). The garbage collector is paused while
+#               the objects are created: they all stay alive, and each collection would scan them again.
+def loadProject(path: str, newNetlist: Callable = CircuitNetlist) -> List[tuple]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if path.endswith(".json"):
+            return loadProjectJson(path, newNetlist)
+        return restore(readProject(path), newNetlist)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def saveProjectJson(path: str, tabs: List[tuple]) -> None:
+    indexes = dict([(tabs[i][2], i) for i in range(len(tabs))])
+    data = {"format": MAGIC.decode(), "version": VERSION, "tabs": []}
+    for elements, wires, netlist in tabs:
+        components = []
+        for i in elements:
+            kind, orientation, value, x, y, name, source = record(i, indexes)
+            component = {"type": TYPES[kind].__name__, "name": name, "x": x, "y": y, "orientation": orientation}
+            if len(values(i)) > 0:
+                component["values"] = [CODE_VALUES[(value >> (2*k)) & 3] for k in range(len(values(i)))]
+            if source >= 0:
+                component["source"] = source
+            components.append(component)
+        data["tabs"].append({"components": components, "wires": [[[i.getX(), i.getY()] for i in dots] for dots in wires]})
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1)
+
+
+def loadProjectJson(path: str, newNetlist: Callable = CircuitNetlist) -> List[tuple]:
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("format") != MAGIC.decode() or data.get("version") != VERSION:
+        raise ValueError("ValueError: project file expected. You entered: ", path)
+    tabs = []
+    for tab in data["tabs"]:
+        records = []
+        for i in tab["components"]:
+            if i["type"] not in NAMES:
+                raise ValueError("ValueError: component type expected. You entered: ", i["type"])
+            value = 0
+            for k, v in enumerate(i.get("values", [])):
+                value |= VALUE_CODES[v] << (2*k)
+            records.append((TYPES.index(NAMES[i["type"]]), i["orientation"], value, i["x"], i["y"], i["name"], i.get("source", -1)))
+        tabs.append((records, [[GridPoint(x, y) for x, y in dots] for dots in tab["wires"]]))
+    return restore(tabs, newNetlist)
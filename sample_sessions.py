@@ -0,0 +1,111 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa um teste de regressão das sessões de simulação: liga e
+*                     desliga a simulação de uma janela 1000 vezes e verifica que a memória e o
+*                     tempo de analyze() não crescem, e que os componentes postos direto na lista
+*                     elements também são simulados.
+*              en-us/ this file implements a regression test of the simulation sessions: starts and
+*                     stops the simulation of a window 1000 times and checks that the memory and
+*                     the time of analyze() do not grow, and that the components put straight at the
+*                     elements list are simulated too.
+*
+"""
+
+import contextlib
+import gc
+import io
+import random
+import sys
+import time
+import tracemalloc
+
+from util import *
+from components import *
+from elements import Window
+from logicanalyzer import LogicAnalyzer
+from levelizedanalyzer import LevelizedAnalyzer
+from eventanalyzer import EventDrivenAnalyzer
+import generators
+
+CYCLES = 1000
+WINDOW = 100            # cycles of each sample: the first ones are compared with the last ones
+MEMORY = 64*1024        # bytes the memory may grow between the samples
+SLOWER = 1.5            # the last cycles may be this much slower than the first ones (timer noise)
+
+
+# a window holding the components and wires of a generated circuit, as the editor would.
+def window(circuit) -> Window:
+    w = Window()
+    for i in circuit.getNetlist().getComponents():
+        w.addElement(i)
+    for dots in circuit.getNetlist().getWires():
+        w.getNetlist().addWire(dots)
+    return w
+
+
+def cycles(w: Window, circuit, analyzerClass) -> bool:
+    rnd = random.Random(0)
+    times = []
+    memory = []
+    sizes = set()
+    tracemalloc.start()
+    for cycle in range(CYCLES):
+        with contextlib.redirect_stdout(io.StringIO()):
+            w.ativateSimulation(analyzerClass)
+            for entry in circuit.getInputs():
+                entry.setValue(rnd.random() < 0.5)
+            start = time.perf_counter()
+            w.getLogicAnalyzer().analyze()
+            times.append(time.perf_counter() - start)
+            sizes.add((len(w.getLogicAnalyzer().getEntries()), len(w.getLogicAnalyzer().getCheckers())))
+            w.deactivateSimulation()
+        if cycle + 1 in (WINDOW, CYCLES):
+            gc.collect()
+            memory.append(tracemalloc.get_traced_memory()[0])
+    tracemalloc.stop()
+
+    first = sum(times[:WINDOW]) / WINDOW
+    last = sum(times[-WINDOW:]) / WINDOW
+    ok = memory[1] - memory[0] < MEMORY and last < SLOWER*first and len(sizes) == 1
+    print("%20s  memory %+8d bytes  analyze %.3f ms -> %.3f ms  entries, checkers %s..%s  %s" % (analyzerClass.__name__, memory[1] - memory[0], first*1000, last*1000, min(sizes), max(sizes), "ok" if ok else "FAILED"))
+    return ok
+
+
+# appended(): the components appended to window.elements directly, as screen.py did, must reach the
+#             simulation as if they were added by addElement().
+def appended(circuit, analyzerClass) -> bool:
+    w = Window()
+    for i in circuit.getNetlist().getComponents():
+        w.elements.append(i)
+    for dots in circuit.getNetlist().getWires():
+        w.getNetlist().addWire(dots)
+    rnd = random.Random(0)
+    bad = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        w.ativateSimulation(analyzerClass)
+        sizes = (len(w.getLogicAnalyzer().getEntries()), len(w.getLogicAnalyzer().getCheckers()))
+        for vector in range(WINDOW):
+            values = [rnd.random() < 0.5 for i in circuit.getInputs()]
+            for entry, value in zip(circuit.getInputs(), values):
+                entry.setValue(value)
+            w.getLogicAnalyzer().analyze()
+            if [i.getValue() for i in circuit.getOutputs()] != circuit.reference(values):
+                bad += 1
+        w.deactivateSimulation()
+    expected = (len(circuit.getNetlist().getEntries()), len(circuit.getNetlist().getCheckers()))
+    ok = bad == 0 and sizes == expected
+    print("%20s  appended elements: entries, checkers %s (expected %s)  wrong vectors %d  %s" % (analyzerClass.__name__, sizes, expected, bad, "ok" if ok else "FAILED"))
+    return ok
+
+
+if __name__ == "__main__":
+    circuit = generators.rippleCarryAdder(8)
+    w = window(circuit)
+    results = [cycles(w, circuit, cls) for cls in [LogicAnalyzer, LevelizedAnalyzer, EventDrivenAnalyzer]]
+    results += [appended(circuit, cls) for cls in [LogicAnalyzer, LevelizedAnalyzer, EventDrivenAnalyzer]]
+    sys.exit(0 if all(results) else 1)
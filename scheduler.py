@@ -0,0 +1,62 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa o escalonador que simula, em segundo plano, os
+*                     circuitos de todas as abas abertas.
+*              en-us/ this file implements the scheduler which simulates, in background, the
+*                     circuits of every open tab.
+*
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List
+from circuit import CompactNetlist
+import compiler
+
+
+# runs at the worker: the compiled function is cached there per circuit structure (see compiler.py).
+def _evaluate(netlist: CompactNetlist, values: List[bool]) -> tuple:
+    return compiler.compileNetlist(netlist)(values)
+
+
+# TabScheduler: evaluates the compact net lists of the tabs at a pool of workers. Processes are
+#              forked, so the workers never import the screen module (which opens the GLUT window);
+#              where fork is not available the pool falls back to threads.
+class TabScheduler:
+    __executor = None
+    __workers: int = 1
+    __processes: bool = True
+
+    def __init__(self, workers: int = None, processes: bool = True):
+        self.__workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.__processes = processes and "fork" in multiprocessing.get_all_start_methods()
+        self.__executor = None
+
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    def usesProcesses(self) -> bool:
+        return self.__processes
+
+    def __getExecutor(self):
+        if self.__executor is None:
+            if self.__processes:
+                self.__executor = ProcessPoolExecutor(self.__workers, mp_context=multiprocessing.get_context("fork"))
+            else:
+                self.__executor = ThreadPoolExecutor(self.__workers)
+        return self.__executor
+
+    # submit(): evaluates the net list with the given input values; the future gives the output values.
+    def submit(self, netlist: CompactNetlist, values: List[bool]) -> Future:
+        return self.__getExecutor().submit(_evaluate, netlist, values)
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
@@ -18,7 +18,7 @@ def init():
     #glClearColor(.9, 0.8, .6, 1.0)
     """
     
-    window.elements.append(Display())
+    window.addElement(Display())
     window.elements[0].setRotation()
     window.elements[0].setTranslation(Coords(-50, -50))
 
@@ -27,30 +27,30 @@ def init():
     window.elements[0].getCheck(2).setValue(False)
     window.elements[0].getCheck(3).setValue(False)
 
-    window.elements.append(NotGate())
+    window.addElement(NotGate())
     window.elements[1].setRotation(sense=True)
     window.elements[1].setTranslation(Coords(50, -50))
 
-    window.elements.append(Entry())
+    window.addElement(Entry())
     window.elements[2]
     
     window.elements[2].setTranslation(Coords(-20, -20))
 
-    window.elements.append(Entry())
+    window.addElement(Entry())
     window.elements[3].setValue(False)
     window.elements[3].setRotation()
     window.elements[3].setTranslation(Coords(-20, 20))
 
-    window.elements.append(Checker())
+    window.addElement(Checker())
     window.elements[4].setValue(True)
     window.elements[4].setTranslation(Coords(20, -20))
 
-    window.elements.append(Checker())
+    window.addElement(Checker())
     window.elements[5].setValue(False)
     window.elements[5].setRotation(sense=True)
     window.elements[5].setTranslation(Coords(20, 20))
 
-    window.elements.append(KeyBoard())
+    window.addElement(KeyBoard())
     window.elements[6].setTranslation(Coords(-50, 50))
     
     """
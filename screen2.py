@@ -68,24 +68,24 @@ def init():
     
     # Insert Code to inicialization
 
-    #window.elements.append(checker_1)
-    #window.elements.append(checker_2)
-    #window.elements.append(Entry_2)
-    #window.elements.append(checker_3)
-    #window.elements.append(Gate_3)
-    #window.elements.append(Entry_3_1)
-    #window.elements.append(Entry_3_2)
-    window.elements.append(checker_4)
-    window.elements.append(Gate_4_1)
-    window.elements.append(Gate_4_2)
-    window.elements.append(Gate_4_3)
-    window.elements.append(Entry_4_1)
-    window.elements.append(Entry_4_2)
-    window.elements.append(Entry_4_3)
+    #window.addElement(checker_1)
+    #window.addElement(checker_2)
+    #window.addElement(Entry_2)
+    #window.addElement(checker_3)
+    #window.addElement(Gate_3)
+    #window.addElement(Entry_3_1)
+    #window.addElement(Entry_3_2)
+    window.addElement(checker_4)
+    window.addElement(Gate_4_1)
+    window.addElement(Gate_4_2)
+    window.addElement(Gate_4_3)
+    window.addElement(Entry_4_1)
+    window.addElement(Entry_4_2)
+    window.addElement(Entry_4_3)
 #
     
 
-    #window.elements.append(KeyBoard())
+    #window.addElement(KeyBoard())
     restartSimulation()
 
 def showScreen():
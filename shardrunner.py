@@ -0,0 +1,142 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo divide a tabela verdade, ou um conjunto de vetores, em fatias
+*                     avaliadas em processos separados, juntando os resultados na ordem.
+*              en-us/ this file splits the truth table, or a set of vectors, into shards evaluated
+*                     at separate processes, merging the results in order.
+*
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from circuit import *
+import bitparallel
+
+SHARD = 1 << 20     # truth table rows (or vectors) of each shard
+
+# net list of the worker process, received once by the initializer
+_netlist: CompactNetlist = None
+
+
+def _initWorker(netlist: CompactNetlist) -> None:
+    global _netlist
+    _netlist = netlist
+
+
+def _rowsShard(chosen: List[int], values: List[bool], start: int, count: int, width: int) -> tuple:
+    return bitparallel.evaluateRows(_netlist, chosen, values, start, count, width)
+
+
+def _vectorsShard(vectors, chunk: int):
+    import vectorbatch
+    return vectorbatch.evaluateBatch(_netlist, vectors, chunk, known=True)
+
+
+def _fileShard(path: str, start: int, stop: int, chunk: int):
+    import numpy as np
+    import vectorbatch
+    vectors = np.load(path, mmap_mode="r")
+    return vectorbatch.evaluateBatch(_netlist, vectors[start:stop], chunk, known=True)
+
+
+# ShardRunner: keeps a pool of worker processes, each one with its own copy of the net list (sent
+#             pickled once, when the process starts), and splits the work among them.
+class ShardRunner:
+    __netlist: CompactNetlist = None
+    __workers: int = 1
+    __shard: int = SHARD
+    __pool: ProcessPoolExecutor = None
+
+    def __init__(self, netlist: CompactNetlist, workers: int = None, shard: int = SHARD):
+        self.__netlist = netlist
+        self.setWorkers(workers if workers is not None else (os.cpu_count() or 1))
+        self.setShard(shard)
+        self.__pool = None
+
+    def setWorkers(self, workers: int) -> None:
+        if workers < 1:
+            raise ValueError("ValueError: at least one worker is expected. You entered: ", workers)
+        self.close()
+        self.__workers = workers
+
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    def setShard(self, shard: int) -> None:
+        if shard < 1 or shard & (shard - 1) != 0:
+            raise ValueError("ValueError: the shard size must be a power of two. You entered: ", shard)
+        self.__shard = shard
+
+    def getShard(self) -> int:
+        return self.__shard
+
+    def getNetlist(self) -> CompactNetlist:
+        return self.__netlist
+
+    def __getPool(self) -> ProcessPoolExecutor:
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(self.__workers, initializer=_initWorker, initargs=(self.__netlist,))
+        return self.__pool
+
+    def close(self) -> None:
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # truthTable(): the same as bitparallel.truthTable(), with the rows split into shards.
+    def truthTable(self, chosen: List[int], values: List[bool] = None, width: int = bitparallel.WIDTH) -> bitparallel.TruthTable:
+        rows = 1 << len(chosen)
+        shard = min(self.__shard, rows)
+        width = min(width, shard)
+        starts = list(range(0, rows, shard))
+        results = self.__getPool().map(_rowsShard, [chosen]*len(starts), [values]*len(starts), starts, [shard]*len(starts), [width]*len(starts))
+
+        valueChunks = [[] for i in self.__netlist.getOutputs()]
+        knownChunks = [[] for i in self.__netlist.getOutputs()]
+        for ones, known in results:
+            for o in range(len(ones)):
+                valueChunks[o].append(ones[o])
+                knownChunks[o].append(known[o])
+        names = self.__netlist.getInputNames()
+        return bitparallel.TruthTable([names[i] for i in chosen], self.__netlist.getOutputNames(),
+                                      [bitparallel.join(chunks, shard) for chunks in valueChunks],
+                                      [bitparallel.join(chunks, shard) for chunks in knownChunks])
+
+    # evaluateBatch(): the same as vectorbatch.evaluateBatch(), with the rows split into shards. The
+    #                 vectors may be a matrix or the path of a .npy file, which each worker maps
+    #                 (mmap) and reads only at its own rows.
+    def evaluateBatch(self, vectors, chunk: int = None, known: bool = False):
+        import numpy as np
+        import vectorbatch
+        if chunk is None:
+            chunk = vectorbatch.CHUNK
+        if isinstance(vectors, str):
+            rows = np.load(vectors, mmap_mode="r").shape[0]
+            starts = list(range(0, rows, self.__shard))
+            results = self.__getPool().map(_fileShard, [vectors]*len(starts), starts, [i + self.__shard for i in starts], [chunk]*len(starts))
+        else:
+            vectors = np.asarray(vectors)
+            starts = list(range(0, vectors.shape[0], self.__shard))
+            results = self.__getPool().map(_vectorsShard, [vectors[i:i+self.__shard] for i in starts], [chunk]*len(starts))
+
+        results = list(results)
+        outputs = len(self.__netlist.getOutputs())
+        if len(results) == 0:
+            empty = np.zeros((0, outputs), dtype=bool)
+            return (empty, empty.copy()) if known else empty
+        values = np.concatenate([r[0] for r in results])
+        if known:
+            return values, np.concatenate([r[1] for r in results])
+        return values
@@ -0,0 +1,111 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo simula um circuito salvo sem interface gráfica (sem OpenGL): lê os
+*                     vetores de entrada linha a linha (CSV) e escreve as saídas linha a linha.
+*              en-us/ this file simulates a saved circuit without the graphical interface (no OpenGL):
+*                     reads the input vectors line by line (CSV) and writes the outputs line by line.
+*
+*   Uso/usage: python simulate.py circuit.json [-i vectors.csv] [-o outputs.csv] [--no-header] [--vcd trace.vcd]
+*              Each line has one value per input: 0, 1 or x (unknown). A first line with the input
+*              names gives the order of the columns. Lines starting with # are skipped.
+*              The circuit file is written by LogicAnalyzer.saveNetlist(). --vcd also writes the
+*              inputs and outputs of each vector as one step of a waveform (see vcd.py).
+"""
+
+import argparse
+import sys
+from typing import Iterator, List, TextIO
+
+from circuit import CompactNetlist, loadNetlist
+import compiler
+from vcd import VcdWriter
+
+VALUES = {"0": False, "1": True, "x": None, "X": None, "": None,
+          "false": False, "true": True, "False": False, "True": True}
+TEXT = {False: "0", True: "1", None: "x"}
+
+
+# readVectors(): the input values of each line of the stream, in the order of netlist.getInputs().
+#               Only one line is held at a time.
+def readVectors(netlist: CompactNetlist, stream: TextIO) -> Iterator[List[bool]]:
+    names = netlist.getInputNames()
+    columns = None      # column of each input, from the header
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if line.startswith("#") or (line == "" and len(names) > 0):
+            continue
+        fields = [i.strip() for i in line.split(",")] if line != "" else []
+        if columns is None and any([i in names for i in fields]):
+            missing = [i for i in names if i not in fields]
+            if len(missing) > 0:
+                raise ValueError("ValueError: the header misses the inputs "+", ".join(missing)+". You entered: ", line)
+            columns = [fields.index(i) for i in names]
+            continue
+        if columns is None:
+            columns = list(range(len(names)))
+        if len(fields) <= max(columns, default=-1):
+            raise ValueError("ValueError: line "+str(number)+" has "+str(len(fields))+" values, "+str(len(names))+" expected. You entered: ", line)
+        try:
+            yield [VALUES[fields[i]] for i in columns]
+        except KeyError:
+            raise ValueError("ValueError: line "+str(number)+" has a value which is not 0, 1 or x. You entered: ", line)
+
+
+# simulate(): evaluates each vector with the compiled circuit (see compiler.py) and writes the values
+#            of the outputs as soon as they are known. A VcdWriter over the inputs and outputs, if
+#            given, receives one step per vector. Returns the number of vectors.
+def simulate(netlist: CompactNetlist, stream: TextIO, out: TextIO, header: bool = True, tracer: VcdWriter = None) -> int:
+    function = compiler.compileNetlist(netlist)
+    if header:
+        out.write(",".join(netlist.getOutputNames()) + "\n")
+    count = 0
+    for values in readVectors(netlist, stream):
+        outputs = function(values)
+        out.write(",".join([TEXT[i] for i in outputs]) + "\n")
+        if tracer is not None:
+            tracer.sample(values + list(outputs))
+        count += 1
+    return count
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulates a circuit saved as JSON (LogicAnalyzer.saveNetlist) without OpenGL.")
+    parser.add_argument("circuit", help="net list file (JSON)")
+    parser.add_argument("-i", "--input", default="-", help="input vectors (CSV), - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output values (CSV), - for stdout")
+    parser.add_argument("--no-header", action="store_true", help="do not write the output names")
+    parser.add_argument("--vcd", help="also write the inputs and outputs as a waveform (VCD), one step per vector")
+    args = parser.parse_args(argv)
+
+    stream = sys.stdin
+    out = sys.stdout
+    tracer = None
+    try:
+        netlist = loadNetlist(args.circuit)
+        if args.input != "-":
+            stream = open(args.input)
+        if args.output != "-":
+            out = open(args.output, "w")
+        if args.vcd is not None:
+            tracer = VcdWriter(args.vcd, netlist.getInputNames() + netlist.getOutputNames())
+        simulate(netlist, stream, out, not args.no_header, tracer)
+    except (ValueError, OSError, KeyError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        if tracer is not None:
+            tracer.close()
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
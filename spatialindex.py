@@ -0,0 +1,78 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo implementa um índice espacial que guarda os pinos de cada ponto,
+*                     para encontrar as conexões sem comparar todos os pares.
+*              en-us/ this file implements a spatial index which keeps the pins of each point, to
+*                     find the connections without comparing every pair.
+*
+"""
+
+from typing import Dict, List
+from util import GridPoint
+
+
+# ConnectivityIndex: a hash of the points to the pins sitting on them, in the order they were added.
+#                   The points of the integer grid are keyed by their GridPoint, so a Coords and a
+#                   GridPoint at the same place share the key; other Coords are keyed by (x, y). The
+#                   keys match exactly when Coords.equals would, without comparing any pair. Each
+#                   lookup of a point is counted as one comparison (see getComparisons()).
+class ConnectivityIndex:
+    __points: Dict = None
+    __comparisons: int = 0
+
+    def __init__(self):
+        self.__points = {}
+        self.__comparisons = 0
+
+    def key(self, coords):
+        self.__comparisons += 1
+        if type(coords) is GridPoint:
+            return coords
+        x = coords.getX()
+        y = coords.getY()
+        return GridPoint(x, y) if float(x).is_integer() and float(y).is_integer() else (x, y)
+
+    def add(self, coords, pin) -> None:
+        key = self.key(coords)
+        pins = self.__points.get(key)
+        if pins is None:
+            self.__points[key] = [pin]
+        else:
+            pins.append(pin)
+
+    def remove(self, coords, pin) -> bool:
+        key = self.key(coords)
+        pins = self.__points.get(key)
+        if pins is None:
+            return False
+        for i in range(len(pins)):
+            if pins[i] is pin:
+                del pins[i]
+                if len(pins) == 0:
+                    del self.__points[key]
+                return True
+        return False
+
+    # find(): returns the pins at the coords, in the order they were added.
+    def find(self, coords) -> List:
+        return list(self.__points.get(self.key(coords), ()))
+
+    def first(self, coords):
+        pins = self.__points.get(self.key(coords))
+        return None if pins is None else pins[0]
+
+    def clear(self) -> None:
+        self.__points = {}
+
+    # getComparisons(): the points looked up so far: the dict compares each one only with the keys of
+    #                   the same hash, instead of with every point of the index.
+    def getComparisons(self) -> int:
+        return self.__comparisons
+
+    def __len__(self) -> int:
+        return sum([len(pins) for pins in self.__points.values()])
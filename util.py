@@ -265,36 +265,136 @@ class Coords(Element):
         glRasterPos2f(self.__x, self.__y)
 
 
+# GridPoint: a point of the integer grid of the window plane, where the pins and wires are placed.
+#           Unlike Coords it is not an Element: no id, no name, no object dict (__slots__) and no
+#           setters. Being immutable it has __hash__ and __eq__, so it can key dicts and sets.
+#           Coords stays for the positions which move or need fractions (drawing).
+class GridPoint:
+    __slots__ = ("__x", "__y")
+
+    # the constructor does not snap: a coordinate off the grid (a fraction, NaN or an infinity)
+    # raises ValueError, so two different places never become the same point.
+    def __init__(self, x: float, y: float) -> None:
+        self.__x = x if type(x) is int else gridValue(x)
+        self.__y = y if type(y) is int else gridValue(y)
+
+    def getCoords(self):
+        return self
+
+    def getX(self) -> int:
+        return self.__x
+
+    def getY(self) -> int:
+        return self.__y
+
+    def sum(self, coords):
+        return GridPoint(self.__x+coords.getX(), self.__y+coords.getY())
+
+    def mul(self, value):
+        return GridPoint(self.__x*value, self.__y*value)
+
+    def middle(self, coords):
+        return GridPoint((self.__x+coords.getX())/2, (self.__y+coords.getY())/2)
+
+    # toward(): the point at a distance a in the direction of the orientation (see line_orientation()).
+    def toward(self, o: int, a: float):
+        if o % 2 == 0:
+            return GridPoint(self.__x-a, self.__y) if int(o/2) == 0 else GridPoint(self.__x+a, self.__y)
+        return GridPoint(self.__x, self.__y-a) if int(o/2) == 0 else GridPoint(self.__x, self.__y+a)
+
+    # equals(): compares the place with a GridPoint or a Coords.
+    def equals(self, c):
+        return c.getX() == self.__x and c.getY() == self.__y
+
+    # __eq__(): only a GridPoint can be equal, as only a GridPoint has the same hash (a Coords is
+    #          hashed by identity); equals() compares with a Coords.
+    def __eq__(self, other):
+        if type(other) is GridPoint:
+            return self.__x == other.__x and self.__y == other.__y
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.__x, self.__y))
+
+    def toCoords(self) -> Coords:
+        return Coords(self.__x, self.__y)
+
+    def apply(self):
+        glVertex3f(self.__x, self.__y, 0.0)
+        return self
+
+    def glTranslate(self):
+        glTranslatef(self.__x, self.__y, 0.0)
+
+    def glRasterPos(self):
+        glRasterPos2f(self.__x, self.__y)
+
+    def __str__(self):
+        return "GridPoint["+str(self.__x)+":"+str(self.__y)+"]"
+
+    def __repr__(self):
+        return "GridPoint("+str(self.__x)+", "+str(self.__y)+")"
+
+
+# gridValue(): the integer of a coordinate on the grid. Raises ValueError for the ones off the grid.
+def gridValue(value: float) -> int:
+    try:
+        if float(value).is_integer():
+            return int(value)
+    except (TypeError, ValueError):
+        pass
+    raise ValueError("ValueError: integer grid coordinate expected. You entered: ", value)
+
+
+# ORIGIN: the origin of the grid, shared by the drawings around it (rect_polygon_around()).
+ORIGIN = GridPoint(0, 0)
+
+
+# toGridPoint(): the GridPoint of a Coords on the grid (or the GridPoint itself). A Coords off the
+#               grid is returned as it is, never snapped: the pins of the small icons of the component
+#               panel keep their exact place, and ConnectivityIndex matches them exactly.
+def toGridPoint(coords):
+    if type(coords) is GridPoint:
+        return coords
+    x = coords.getX()
+    y = coords.getY()
+    if float(x).is_integer() and float(y).is_integer():
+        return GridPoint(int(x), int(y))
+    return coords
+
+
 def rect(c1: Coords, c2: Coords, c3: Coords, c4: Coords):
     glBegin(GL_QUADS)
-    Coords(c1.getX(), c1.getY()).apply()
-    Coords(c2.getX(), c2.getY()).apply()
-    Coords(c3.getX(), c3.getY()).apply()
-    Coords(c4.getX(), c4.getY()).apply()
+    glVertex3f(c1.getX(), c1.getY(), 0.0)
+    glVertex3f(c2.getX(), c2.getY(), 0.0)
+    glVertex3f(c3.getX(), c3.getY(), 0.0)
+    glVertex3f(c4.getX(), c4.getY(), 0.0)
     glEnd()
 
 
 def line(c1: Coords, c2: Coords, lineWidth: float):
     glLineWidth(lineWidth)
     glBegin(GL_LINES)
-    Coords(c1.getX(), c1.getY()).apply()
-    Coords(c2.getX(), c2.getY()).apply()
+    glVertex3f(c1.getX(), c1.getY(), 0.0)
+    glVertex3f(c2.getX(), c2.getY(), 0.0)
     glEnd()
     glLineWidth(3)
 
 
 def rect_around(c: Coords, a: float, b: float = None, p: int = 0):
     b = a if b == None else b
+    x = c.getX()
+    y = c.getY()
 
     for i in range(4):
         if(i+p) % 4 == 0:
-            c.sum(Coords(-a, -b)).apply()
+            glVertex3f(x-a, y-b, 0.0)
         if(i+p) % 4 == 1:
-            c.sum(Coords(-a, +b)).apply()
+            glVertex3f(x-a, y+b, 0.0)
         if(i+p) % 4 == 2:
-            c.sum(Coords(+a, +b)).apply()
+            glVertex3f(x+a, y+b, 0.0)
         if(i+p) % 4 == 3:
-            c.sum(Coords(+a, -b)).apply()
+            glVertex3f(x+a, y-b, 0.0)
 
     return None
 
@@ -307,27 +407,25 @@ def rect_polygon_around(c: Coords, a: float, b: float = None, p: int = 0, angle:
     glRotatef(angle, 0.0, 0.0, 1.0)
 
     glBegin(GL_POLYGON)
-    rect_around(Coords(0.0, 0.0), a, b, p)
+    rect_around(ORIGIN, a, b, p)
     glEnd()
 
     glPopMatrix()
 
 
 def line_orientation(ci: Coords, o: int, a: float = POINT_SPACE, l=True) -> Coords:
-    c = Coords(0, 0).copy(ci)
-
     # definindo a rotação do componente
     if o % 2 == 0:  # LR or RL
-        c = c.sum(Coords(-a, 0)) if int(o/2) == 0 else c.sum(Coords(a, 0))
+        c = Coords(ci.getX()-a, ci.getY()) if int(o/2) == 0 else Coords(ci.getX()+a, ci.getY())
     else:                       # UD or DU
-        c = c.sum(Coords(0, -a)) if int(o/2) == 0 else c.sum(Coords(0, a))
+        c = Coords(ci.getX(), ci.getY()-a) if int(o/2) == 0 else Coords(ci.getX(), ci.getY()+a)
 
     # Line
     if(l):
-        Color().apply()
+        glColor3f(0.0, 0.0, 0.0)
         glBegin(GL_LINES)
-        ci.apply()
-        c.apply()
+        glVertex3f(ci.getX(), ci.getY(), 0.0)
+        glVertex3f(c.getX(), c.getY(), 0.0)
         glEnd()
 
     return c
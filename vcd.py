@@ -0,0 +1,119 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo grava as formas de onda da simulação no formato VCD (Value Change
+*                     Dump), aberto pelos visualizadores de formas de onda (GTKWave, etc.).
+*              en-us/ this file writes the waveforms of the simulation in the VCD format (Value
+*                     Change Dump), opened by the waveform viewers (GTKWave, etc.).
+*
+*   Each step writes only the signals whose value changed, through a buffered file, so only the
+*   current value of each signal is kept, whatever the number of steps. The nets of a circuit of
+*   components are given by netlist.netSignals(); this file does not need OpenGL.
+"""
+
+import re
+from typing import List, TextIO
+
+BUFFER = 1 << 16            # bytes buffered before each write to the file
+TIMESCALE = "1 ns"          # duration of one step
+SCOPE = "circuit"
+VALUES = {False: "0", True: "1", None: "x"}
+
+
+# identifier(): the VCD identifier of a name: printable ASCII without spaces, unique among used.
+def identifier(name: str, used: set) -> str:
+    code = re.sub(r"[^!-~]", "_", name)
+    if code == "":
+        code = "_"
+    base = code
+    count = 1
+    while code in used:
+        code = base + "_" + str(count)
+        count += 1
+    used.add(code)
+    return code
+
+
+# VcdWriter: writes the header with the signal names, then one sample of every signal per step.
+class VcdWriter:
+    __stream: TextIO = None
+    __owned: bool = False       # the stream was opened by the writer, which closes it
+    __names: List[str] = None
+    __ids: List[str] = None
+    __last: List = None         # the values of the last sample, None before the first one
+    __time: int = -1
+
+    # path is a file name or an open text stream.
+    def __init__(self, path, names: List[str], timescale: str = TIMESCALE, scope: str = SCOPE):
+        if isinstance(path, str):
+            self.__stream = open(path, "w", buffering=BUFFER)
+            self.__owned = True
+        else:
+            self.__stream = path
+            self.__owned = False
+        self.__names = list(names)
+        used = set()
+        self.__ids = [identifier(i, used) for i in self.__names]
+        self.__last = None
+        self.__time = -1
+        self.__header(timescale, scope)
+
+    def __header(self, timescale: str, scope: str) -> None:
+        self.__stream.write("$version Digital Eletronics Simulator $end\n")
+        self.__stream.write("$timescale " + timescale + " $end\n")
+        self.__stream.write("$scope module " + identifier(scope, set()) + " $end\n")
+        for code in self.__ids:
+            self.__stream.write("$var wire 1 " + code + " " + code + " $end\n")
+        self.__stream.write("$upscope $end\n$enddefinitions $end\n")
+
+    def getNames(self) -> List[str]:
+        return self.__names
+
+    def getIds(self) -> List[str]:
+        return self.__ids
+
+    def getTime(self) -> int:
+        return self.__time
+
+    # sample(): the values of the signals (False, True or None), in the order of the names, at the
+    #          given time (the step after the last one if not given). The first sample dumps every
+    #          value; the next ones only the changed values. Returns the number of values written.
+    def sample(self, values: List[bool], time: int = None) -> int:
+        if self.__stream is None:
+            raise RuntimeError("Error! The VCD writer is closed.")
+        if len(values) != len(self.__ids):
+            raise ValueError("ValueError: "+str(len(self.__ids))+" values expected. You entered: ", len(values))
+        if time is None:
+            time = self.__time + 1
+        if time <= self.__time:
+            raise ValueError("ValueError: time after "+str(self.__time)+" expected. You entered: ", time)
+        last = self.__last
+        if last is None:
+            self.__stream.write("#" + str(time) + "\n$dumpvars\n")
+            self.__stream.write("".join([VALUES[v] + code + "\n" for v, code in zip(values, self.__ids)]))
+            self.__stream.write("$end\n")
+            count = len(values)
+        else:
+            changes = [VALUES[values[i]] + self.__ids[i] + "\n" for i in range(len(values)) if values[i] is not last[i]]
+            count = len(changes)
+            if count > 0:
+                self.__stream.write("#" + str(time) + "\n" + "".join(changes))
+        self.__last = list(values)
+        self.__time = time
+        return count
+
+    # close(): marks the end of the last step and closes the file opened by the writer.
+    def close(self) -> None:
+        if self.__stream is None:
+            return
+        if self.__last is not None:
+            self.__stream.write("#" + str(self.__time + 1) + "\n")
+        if self.__owned:
+            self.__stream.close()
+        else:
+            self.__stream.flush()
+        self.__stream = None
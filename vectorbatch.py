@@ -0,0 +1,100 @@
+"""
+*   Universidade Federal do Vale do São Francisco - Univasf
+*   Colegiado de Engenharia de Computação
+*   Orientador: Prof. Dr. Jorge Cavalcanti
+*   Discentes: Elayne Lemos, elayne.l.lemos@gmail.com
+*              Jônatas de Castro, jonatascastropassos@gmail.com
+*              Ezequias Antunes, ezequiasantunes@gmail.com
+*   Atividade: pt-br/ este arquivo avalia o circuito para uma matriz de vetores de entrada (NumPy),
+*                     uma porta por vez, em blocos de linhas para limitar a memória usada.
+*              en-us/ this file evaluates the circuit for a matrix of input vectors (NumPy), one gate
+*                     at a time, in blocks of rows to bound the memory used.
+*
+"""
+
+from typing import List
+import numpy as np
+from circuit import *
+
+CHUNK = 1 << 16     # rows evaluated together
+
+# As at bitparallel.py, each net is a pair (value, known) of boolean arrays, one element per row:
+# a net without driver is unknown and the gates follow the three-valued logic.
+
+
+def arrayAnd(words: List[tuple]) -> tuple:
+    one = words[0][0]
+    zero = words[0][1] & ~words[0][0]
+    for v, k in words[1:]:
+        one = one & v
+        zero = zero | (k & ~v)
+    return one, one | zero
+
+
+def arrayOr(words: List[tuple]) -> tuple:
+    one = words[0][0]
+    zero = words[0][1] & ~words[0][0]
+    for v, k in words[1:]:
+        one = one | v
+        zero = zero & (k & ~v)
+    return one, one | zero
+
+
+def arrayXor(words: List[tuple]) -> tuple:
+    value, known = words[0]
+    for v, k in words[1:]:
+        value = np.logical_xor(value, v)
+        known = known & k
+    return value & known, known
+
+
+def arrayNot(word: tuple) -> tuple:
+    return np.logical_xor(word[0], word[1]), word[1]
+
+
+OPERATIONS = {
+    GATE_AND: arrayAnd,
+    GATE_NAND: lambda words: arrayNot(arrayAnd(words)),
+    GATE_OR: arrayOr,
+    GATE_NOR: lambda words: arrayNot(arrayOr(words)),
+    GATE_XOR: arrayXor,
+    GATE_XNOR: lambda words: arrayNot(arrayXor(words)),
+    GATE_NOT: lambda words: arrayNot(words[0]),
+    GATE_BUF: lambda words: words[0],
+}
+
+
+# evaluate(): receives the (rows, inputs) boolean matrix of one block and returns the (value, known)
+#             arrays of every output.
+def evaluate(netlist: CompactNetlist, block) -> List[tuple]:
+    rows = block.shape[0]
+    unknown = (np.zeros(rows, dtype=bool), np.zeros(rows, dtype=bool))
+    allKnown = np.ones(rows, dtype=bool)
+    nets = [unknown] * netlist.getNetCount()
+    for i in range(len(netlist.getInputs())):
+        nets[netlist.getInputs()[i]] = (block[:, i], allKnown)
+    for kind, ins, out, name in netlist.getGates():
+        nets[out] = OPERATIONS[kind]([nets[i] for i in ins])
+    return [nets[i] for i in netlist.getOutputs()]
+
+
+# evaluateBatch(): evaluates the (N, inputs) boolean matrix, CHUNK rows at a time, and returns the
+#                 (N, outputs) matrix of values. An unknown output reads False; with known=True the
+#                 (N, outputs) matrix telling which values are known is returned too.
+def evaluateBatch(netlist: CompactNetlist, vectors, chunk: int = CHUNK, known: bool = False):
+    vectors = np.asarray(vectors)
+    if vectors.ndim != 2 or vectors.shape[1] != len(netlist.getInputs()):
+        raise ValueError("ValueError: a matrix with "+str(len(netlist.getInputs()))+" columns was expected. You entered: ", vectors.shape)
+    rows = vectors.shape[0]
+    values = np.zeros((rows, len(netlist.getOutputs())), dtype=bool)
+    knowns = np.zeros((rows, len(netlist.getOutputs())), dtype=bool) if known else None
+    for start in range(0, rows, chunk):
+        block = vectors[start:start+chunk].astype(bool, copy=False)
+        outputs = evaluate(netlist, block)
+        for o in range(len(outputs)):
+            values[start:start+chunk, o] = outputs[o][0]
+            if known:
+                knowns[start:start+chunk, o] = outputs[o][1]
+    if known:
+        return values, knowns
+    return values